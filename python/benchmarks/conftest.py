@@ -0,0 +1,92 @@
+import asyncio
+from typing import Any, Coroutine, Iterator, List
+
+import pytest
+from pydantic import BaseModel, Field
+
+from goat import HTTPSessionPool, PluginBase, WalletClientBase
+from goat.decorators.tool import Tool
+
+from benchmarks.stand_ins import UpstreamServer
+
+
+class EchoParameters(BaseModel):
+    value: str = Field(description="The value to echo")
+    repeat: int = Field(default=1, description="How many times to repeat the value")
+
+
+class EchoService:
+    @Tool({"description": "Echo a value from a coroutine", "parameters_schema": EchoParameters})
+    async def echo_async(self, parameters: dict):
+        return parameters["value"] * parameters["repeat"]
+
+    @Tool({"description": "Echo a value from a blocking function", "parameters_schema": EchoParameters})
+    def echo_sync(self, parameters: dict):
+        return parameters["value"] * parameters["repeat"]
+
+
+class EchoPlugin(PluginBase):
+    def __init__(self):
+        super().__init__("echo", [EchoService()])
+
+    def supports_chain(self, chain) -> bool:
+        return True
+
+
+class DummyWalletClient(WalletClientBase):
+    """Wallet without upstream calls, so core benchmarks only measure the SDK"""
+
+    def get_address(self) -> str:
+        return "0x0000000000000000000000000000000000000001"
+
+    def get_chain(self):
+        return {"type": "evm", "id": 1, "nativeCurrency": {"name": "Ether", "symbol": "ETH", "decimals": 18}}
+
+    def sign_message(self, message: str):
+        return {"signature": message}
+
+    def balance_of(self, address: str, token_address=None):
+        return {"decimals": 18, "symbol": "ETH", "name": "Ether", "value": "1", "in_base_units": "1000000000000000000"}
+
+
+class LoopRunner:
+    """Runs coroutines on one long-lived event loop so pooled sessions stay warm between rounds"""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+
+    def __call__(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        return self.loop.run_until_complete(coro)
+
+    def close(self) -> None:
+        self.loop.close()
+
+
+@pytest.fixture(scope="session")
+def upstream() -> Iterator[UpstreamServer]:
+    server = UpstreamServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def http_pool() -> HTTPSessionPool:
+    return HTTPSessionPool()
+
+
+@pytest.fixture(scope="session")
+def run(http_pool: HTTPSessionPool) -> Iterator[LoopRunner]:
+    runner = LoopRunner()
+    yield runner
+    runner(http_pool.close())
+    runner.close()
+
+
+@pytest.fixture
+def wallet() -> DummyWalletClient:
+    return DummyWalletClient()
+
+
+@pytest.fixture
+def plugins() -> List[PluginBase]:
+    return [EchoPlugin()]
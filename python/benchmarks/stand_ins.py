@@ -0,0 +1,224 @@
+"""Local stand-ins for the HTTP APIs and JSON-RPC nodes used by the benchmarks."""
+
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+# Response served for every REST endpoint. It carries the fields the plugins read (e.g. Allora's
+# data.inference_data) plus a small list so JSON decoding cost is representative.
+REST_PAYLOAD: Dict[str, Any] = {
+    "data": {
+        "inference_data": {
+            "network_inference": "3400000000000000000000",
+            "network_inference_normalized": "3400.0",
+            "timestamp": 1700000000,
+        }
+    },
+    "items": [{"id": f"item-{i}", "name": f"Item {i}", "price": i * 1.5} for i in range(20)],
+}
+
+_MINT_SOL = "So11111111111111111111111111111111111111112"
+_MINT_USDC = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+
+# Responses for REST endpoints whose plugins validate the payload, by request path
+REST_ROUTES: Dict[str, Any] = {
+    "/jupiter/quote": {
+        "inputMint": _MINT_SOL,
+        "inAmount": "1000000000",
+        "outputMint": _MINT_USDC,
+        "outAmount": "150000000",
+        "otherAmountThreshold": "149250000",
+        "swapMode": "ExactIn",
+        "slippageBps": 50,
+        "priceImpactPct": 0.01,
+        "routePlan": [
+            {
+                "swapInfo": {
+                    "ammKey": "amm-1",
+                    "label": "Whirlpool",
+                    "inputMint": _MINT_SOL,
+                    "outputMint": _MINT_USDC,
+                    "inAmount": "1000000000",
+                    "outAmount": "150000000",
+                    "feeAmount": "3000",
+                    "feeMint": _MINT_SOL,
+                },
+                "percent": 100,
+            }
+        ],
+    },
+    "/opensea/collections/goat/stats": {
+        "total": {
+            "volume": 1000.0,
+            "sales": 50,
+            "average_price": 20.0,
+            "num_owners": 40,
+            "market_cap": 5000.0,
+            "floor_price": 10.0,
+            "floor_price_symbol": "ETH",
+        },
+        "intervals": [
+            {
+                "interval": "one_day",
+                "volume": 100.0,
+                "volume_diff": 5.0,
+                "volume_change": 0.05,
+                "sales": 5,
+                "sales_diff": 1,
+                "average_price": 20.0,
+            }
+        ],
+    },
+    "/lulo/actions": {"transaction": "AQ=="},
+}
+
+EVM_CHAIN_ID = 1
+EVM_NATIVE_BALANCE = 10**18
+ERC20_BALANCE = 1234 * 10**6
+
+_SELECTOR_NAME = "06fdde03"
+_SELECTOR_SYMBOL = "95d89b41"
+_SELECTOR_DECIMALS = "313ce567"
+_SELECTOR_BALANCE_OF = "70a08231"
+_SELECTOR_AGGREGATE3 = "82ad56cb"
+
+SOLANA_BALANCE = 5 * 10**9
+
+
+class UpstreamServer:
+    """Serves the REST stand-in and the EVM and Solana JSON-RPC stand-ins from a background thread.
+
+    Routes:
+        POST /evm: Ethereum JSON-RPC node answering chain id, balance and ERC-20 reads (Multicall3 included)
+            and accepting raw transactions, which are mined right away
+        POST /solana: Solana JSON-RPC node answering balance and account lookups
+        paths in REST_ROUTES: the matching response as JSON
+        anything else: REST_PAYLOAD as JSON
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+        self.url = ""
+
+    def start(self) -> "UpstreamServer":
+        started = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self._start())
+            started.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+        return self
+
+    def stop(self) -> None:
+        if self._loop is None or self._runner is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()  # type: ignore[union-attr]
+
+    async def _start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/evm", self._evm)
+        app.router.add_post("/solana", self._solana)
+        app.router.add_route("*", "/{tail:.*}", self._rest)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.url = f"http://{host}:{port}"
+
+    async def _rest(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        await request.read()
+        return web.json_response(REST_ROUTES.get(request.path, REST_PAYLOAD))
+
+    async def _evm(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        return web.json_response(_dispatch(await request.json(), evm_rpc_result))
+
+    async def _solana(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        return web.json_response(_dispatch(await request.json(), solana_rpc_result))
+
+
+def _dispatch(payload: Any, handler: Any) -> Any:
+    if isinstance(payload, list):
+        return [_dispatch(item, handler) for item in payload]
+    return {"jsonrpc": "2.0", "id": payload.get("id"), "result": handler(payload["method"], payload.get("params", []))}
+
+
+def evm_rpc_result(method: str, params: List[Any]) -> Any:
+    if method == "eth_chainId":
+        return hex(EVM_CHAIN_ID)
+    if method == "net_version":
+        return str(EVM_CHAIN_ID)
+    if method == "eth_blockNumber":
+        return "0x1"
+    if method == "eth_getBalance":
+        return hex(EVM_NATIVE_BALANCE)
+    if method == "eth_getCode":
+        return "0x60806040"
+    if method == "eth_call":
+        return "0x" + _evm_call(bytes.fromhex(params[0]["data"][2:])).hex()
+    if method == "eth_estimateGas":
+        return hex(50_000)
+    if method == "eth_getBlockByNumber":
+        return {"number": "0x1", "hash": "0x" + "11" * 32, "baseFeePerGas": hex(10**9), "gasLimit": hex(30_000_000)}
+    if method == "eth_maxPriorityFeePerGas":
+        return hex(10**8)
+    if method == "eth_getTransactionCount":
+        return "0x0"
+    if method == "eth_sendRawTransaction":
+        from eth_utils import keccak
+
+        return "0x" + keccak(hexstr=params[0]).hex()
+    if method == "eth_getTransactionReceipt":
+        return {
+            "transactionHash": params[0],
+            "status": "0x1",
+            "blockHash": "0x" + "11" * 32,
+            "blockNumber": "0x1",
+            "transactionIndex": "0x0",
+            "cumulativeGasUsed": hex(50_000),
+            "gasUsed": hex(50_000),
+            "logs": [],
+        }
+    raise ValueError(f"Unsupported method {method}")
+
+
+def _evm_call(data: bytes) -> bytes:
+    from eth_abi import decode, encode
+
+    selector = data[:4].hex()
+    if selector == _SELECTOR_AGGREGATE3:
+        (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+        return encode(["(bool,bytes)[]"], [[(True, _evm_call(call_data)) for _, _, call_data in calls]])
+    if selector == _SELECTOR_NAME:
+        return encode(["string"], ["USD Coin"])
+    if selector == _SELECTOR_SYMBOL:
+        return encode(["string"], ["USDC"])
+    if selector == _SELECTOR_DECIMALS:
+        return encode(["uint8"], [6])
+    if selector == _SELECTOR_BALANCE_OF:
+        return encode(["uint256"], [ERC20_BALANCE])
+    raise ValueError(f"Unsupported call selector 0x{selector}")
+
+
+def solana_rpc_result(method: str, params: List[Any]) -> Any:
+    context = {"slot": 1}
+    if method == "getBalance":
+        return {"context": context, "value": SOLANA_BALANCE}
+    if method == "getAccountInfo":
+        return {"context": context, "value": None}
+    raise ValueError(f"Unsupported method {method}")
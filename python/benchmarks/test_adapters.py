@@ -0,0 +1,73 @@
+"""Cost of wrapping GOAT tools for each agent framework, and of a call through the wrapper.
+
+Each benchmark is skipped when its framework is not installed.
+"""
+
+import json
+
+import pytest
+
+from benchmarks.conftest import DummyWalletClient
+
+PARAMETERS = {"value": "goat", "repeat": 2}
+
+
+def test_langchain_wrap(benchmark, plugins):
+    pytest.importorskip("langchain_core")
+    from goat_adapters.langchain import get_on_chain_tools
+
+    benchmark(lambda: get_on_chain_tools(DummyWalletClient(), plugins))
+
+
+def test_langchain_invoke(benchmark, wallet, plugins):
+    pytest.importorskip("langchain_core")
+    from goat_adapters.langchain import get_on_chain_tools
+
+    tool = next(t for t in get_on_chain_tools(wallet, plugins) if t.name == "echo_sync")
+    benchmark(tool.invoke, PARAMETERS)
+
+
+def test_crewai_wrap(benchmark, plugins):
+    pytest.importorskip("crewai")
+    from goat_adapters.crewai import get_crewai_tools
+
+    benchmark(lambda: get_crewai_tools(DummyWalletClient(), plugins))
+
+
+def test_crewai_run(benchmark, wallet, plugins):
+    pytest.importorskip("crewai")
+    from goat_adapters.crewai import get_crewai_tools
+
+    tool = next(t for t in get_crewai_tools(wallet, plugins) if t.name == "echo_sync")
+    benchmark(lambda: tool.run(**PARAMETERS))
+
+
+def test_smolagents_wrap(benchmark, plugins):
+    pytest.importorskip("smolagents")
+    from goat_adapters.smolagents import get_smolagents_tools
+
+    benchmark(lambda: get_smolagents_tools(DummyWalletClient(), plugins))
+
+
+def test_smolagents_forward(benchmark, wallet, plugins):
+    pytest.importorskip("smolagents")
+    from goat_adapters.smolagents import get_smolagents_tools
+
+    tool = next(t for t in get_smolagents_tools(wallet, plugins) if t.name == "echo_sync")
+    benchmark(lambda: tool.forward(**PARAMETERS))
+
+
+def test_openai_agents_sdk_wrap(benchmark, plugins):
+    pytest.importorskip("agents")
+    from goat_adapters.openai_agents_sdk import get_on_chain_tools
+
+    benchmark(lambda: get_on_chain_tools(DummyWalletClient(), plugins))
+
+
+def test_openai_agents_sdk_invoke(benchmark, wallet, plugins, run):
+    pytest.importorskip("agents")
+    from goat_adapters.openai_agents_sdk import get_on_chain_tools
+
+    tool = next(t for t in get_on_chain_tools(wallet, plugins) if t.name == "echo_async")
+    arguments = json.dumps(PARAMETERS)
+    benchmark(lambda: run(tool.on_invoke_tool(None, arguments)))
@@ -0,0 +1,60 @@
+"""Overhead of the SDK itself: tool discovery, tool construction, validation and dispatch."""
+
+from goat import create_tool, get_tools
+
+from benchmarks.conftest import DummyWalletClient, EchoParameters, EchoPlugin
+
+PARAMETERS = {"value": "goat", "repeat": 2}
+
+
+def _tool(plugin, wallet, name):
+    return next(t for t in plugin.get_tools(wallet) if t.name == name)
+
+
+def test_get_tools_new_wallet(benchmark, plugins):
+    benchmark(lambda: get_tools(DummyWalletClient(), plugins))
+
+
+def test_get_tools_cached(benchmark, wallet, plugins):
+    get_tools(wallet, plugins)
+    benchmark(get_tools, wallet, plugins)
+
+
+def test_create_tool(benchmark):
+    config = {"name": "echo", "description": "Echo a value", "parameters": EchoParameters}
+    benchmark(create_tool, config, lambda parameters: parameters)
+
+
+def test_execute_full_validation(benchmark):
+    tool = create_tool({"name": "echo", "description": "", "parameters": EchoParameters}, lambda p: p)
+    benchmark(tool.execute, PARAMETERS)
+
+
+def test_execute_trusted_validation(benchmark):
+    tool = create_tool({"name": "echo", "description": "", "parameters": EchoParameters}, lambda p: p)
+    benchmark(tool.execute, PARAMETERS, "trusted")
+
+
+def test_execute_sync_plugin_tool(benchmark, wallet):
+    benchmark(_tool(EchoPlugin(), wallet, "echo_sync").execute, PARAMETERS)
+
+
+def test_execute_coroutine_plugin_tool_from_sync_code(benchmark, wallet):
+    # Goes through run_sync for every call
+    benchmark(_tool(EchoPlugin(), wallet, "echo_async").execute, PARAMETERS)
+
+
+def test_execute_async_coroutine_plugin_tool(benchmark, wallet, run):
+    tool = _tool(EchoPlugin(), wallet, "echo_async")
+    benchmark(lambda: run(tool.execute_async(PARAMETERS)))
+
+
+def test_execute_async_sync_plugin_tool(benchmark, wallet, run):
+    # Blocking tools are offloaded to a worker thread
+    tool = _tool(EchoPlugin(), wallet, "echo_sync")
+    benchmark(lambda: run(tool.execute_async(PARAMETERS)))
+
+
+def test_get_tools_with_query(benchmark, wallet, plugins):
+    get_tools(wallet, plugins, query="echo a value")
+    benchmark(get_tools, wallet, plugins, query="echo a value", k=1)
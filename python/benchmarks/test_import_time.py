@@ -0,0 +1,59 @@
+"""Cold-start cost of importing the SDK packages, each measured in a fresh interpreter."""
+
+import importlib.util
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Package -> modules its import must not load. Chain SDKs are only loaded on first use of an
+# attribute that needs them.
+PACKAGES = {
+    "goat": ["pydantic", "aiohttp"],
+    "goat_wallets.evm": ["web3", "eth_account", "pydantic"],
+    "goat_wallets.web3": ["web3", "eth_account", "ens"],
+    "goat_wallets.solana": ["solana", "solders", "spl", "nacl"],
+    "goat_wallets.multiversx": ["multiversx_sdk"],
+    "goat_wallets.crossmint": ["web3", "eth_account", "ens", "solana", "solders"],
+    "goat_plugins.crossmint_headless_checkout": ["web3", "solana", "solders", "rlp"],
+    "goat_adapters.langchain": ["langchain_core"],
+    "goat_adapters.crewai": ["crewai"],
+    "goat_adapters.openai_agents_sdk": ["agents"],
+    "goat_adapters.ag2": ["autogen"],
+    "goat_adapters.smolagents": ["smolagents"],
+}
+
+
+def _installed(package: str) -> bool:
+    try:
+        return importlib.util.find_spec(package) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+def _import(package: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", f"import sys, json, {package}; print(json.dumps(list(sys.modules)))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+@pytest.fixture(params=sorted(PACKAGES))
+def package(request):
+    if not _installed(request.param):
+        pytest.skip(f"{request.param} is not installed")
+    return request.param
+
+
+def test_interpreter_startup(benchmark):
+    """Baseline to subtract from the package imports below"""
+    benchmark.pedantic(subprocess.run, args=([sys.executable, "-c", "pass"],), kwargs={"check": True}, rounds=5)
+
+
+def test_import(benchmark, package):
+    result = benchmark.pedantic(_import, args=(package,), rounds=5)
+    loaded = set(json.loads(result.stdout))
+    assert not loaded.intersection(PACKAGES[package]), f"importing {package} loaded heavy dependencies eagerly"
@@ -0,0 +1,175 @@
+"""HTTP plugins against the local REST stand-in: validation, dispatch, pooled HTTP and JSON decoding."""
+
+from typing import Any, Callable, Dict, Tuple
+
+import pytest
+
+from goat import InMemoryToolResultCache, PluginBase, ToolResultCache
+
+from benchmarks.conftest import DummyWalletClient
+
+PluginCase = Tuple[Callable[[], PluginBase], str, str, Dict[str, Any]]
+
+
+class DummySolanaWalletClient(DummyWalletClient):
+    """Solana wallet that accepts transactions without signing or sending them"""
+
+    def get_address(self) -> str:
+        return "11111111111111111111111111111111"
+
+    def get_chain(self):
+        return {"type": "solana"}
+
+    def send_raw_transaction(self, transaction: str):
+        return {"hash": "1" * 64}
+
+
+class DisabledToolResultCache(ToolResultCache):
+    """Never hits, so every call reaches the stand-in"""
+
+    def get(self, namespace, key):
+        return False, None
+
+    def set(self, namespace, key, value, ttl, max_entries=None):
+        pass
+
+
+def _coingecko() -> PluginBase:
+    from goat_plugins.coingecko import CoinGeckoPluginOptions, coingecko
+
+    return coingecko(CoinGeckoPluginOptions(api_key="test"))
+
+
+def _rugcheck() -> PluginBase:
+    from goat_plugins.rugcheck import RugCheckPluginOptions, rugcheck
+
+    return rugcheck(RugCheckPluginOptions())
+
+
+def _nansen() -> PluginBase:
+    from goat_plugins.nansen import NansenPluginOptions, nansen
+
+    return nansen(NansenPluginOptions(api_key="test"))
+
+
+def _farcaster() -> PluginBase:
+    from goat_plugins.farcaster import FarcasterPluginOptions, farcaster
+
+    return farcaster(FarcasterPluginOptions(api_key="test"))
+
+
+def _allora() -> PluginBase:
+    from goat_plugins.allora import AlloraPluginOptions, allora
+
+    return allora(AlloraPluginOptions())
+
+
+def _debridge() -> PluginBase:
+    from goat_plugins.debridge import DebridgePluginOptions, debridge
+
+    return debridge(DebridgePluginOptions())
+
+
+def _jupiter() -> PluginBase:
+    from goat_plugins.jupiter import JupiterPluginOptions, jupiter
+
+    return jupiter(JupiterPluginOptions())
+
+
+def _uniswap() -> PluginBase:
+    from goat_plugins.uniswap import UniswapPluginOptions, uniswap
+
+    return uniswap(UniswapPluginOptions(api_key="test", base_url="https://trade-api.gateway.uniswap.org/v1"))
+
+
+def _dexscreener() -> PluginBase:
+    from goat_plugins.dexscreener import DexscreenerPluginOptions, dexscreener
+
+    return dexscreener(DexscreenerPluginOptions())
+
+
+def _opensea() -> PluginBase:
+    from goat_plugins.opensea import OpenSeaPluginOptions, opensea
+
+    return opensea(OpenSeaPluginOptions(api_key="test"))
+
+
+def _lulo() -> PluginBase:
+    from goat_plugins.lulo import LuloPluginOptions, lulo
+
+    return lulo(LuloPluginOptions())
+
+
+def _jsonrpc() -> PluginBase:
+    from goat_plugins.jsonrpc import JSONRpcPluginOptions, jsonrpc
+
+    return jsonrpc(JSONRpcPluginOptions(endpoint="http://localhost:8545"))
+
+
+_SOL = "So11111111111111111111111111111111111111112"
+_USDC = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+_TOKEN = "0x0000000000000000000000000000000000000001"
+
+# (plugin factory, attribute holding the API root, tool name, tool parameters)
+PLUGINS: Dict[str, PluginCase] = {
+    "coingecko": (_coingecko, "base_url", "get_trending_coins", {}),
+    "rugcheck": (_rugcheck, "base_url", "get_trending_tokens_24h", {}),
+    "nansen": (_nansen, "base_url", "get_token_details", {"address": "0x0000000000000000000000000000000000000001"}),
+    "farcaster": (_farcaster, "base_url", "search_casts", {"query": "goat"}),
+    "allora": (_allora, "api_root", "get_price_prediction", {"ticker": "ETH", "timeframe": "5m"}),
+    "debridge": (_debridge, "base_url", "get_supported_chains", {}),
+    "jupiter": (_jupiter, "base_url", "get_quote", {"inputMint": _SOL, "outputMint": _USDC, "amount": 10**9}),
+    "uniswap": (_uniswap, "base_url", "uniswap_get_quote", {"tokenIn": _TOKEN, "tokenOut": _TOKEN, "amount": "1000"}),
+    "dexscreener": (_dexscreener, "base_url", "search_pairs", {"query": "SOL/USDC"}),
+    "opensea": (_opensea, "base_url", "get_nft_collection_statistics", {"collectionSlug": "goat"}),
+    "lulo": (_lulo, "base_url", "deposit_usdc", {"amount": "1"}),
+    # The JSON-RPC plugin posts to a fixed endpoint, here the EVM JSON-RPC stand-in
+    "jsonrpc": (
+        _jsonrpc,
+        "endpoint",
+        "jsonrpc_func",
+        {"method": "eth_blockNumber", "params": [], "id": 1, "jsonrpc": "2.0"},
+    ),
+}
+
+# Plugins whose endpoint is the full URL rather than an API root under the REST stand-in
+_ENDPOINTS = {"jsonrpc": "evm"}
+
+
+def _plugin_tool(name: str, upstream, http_pool, wallet, tool_cache=None):
+    factory, url_attribute, tool_name, parameters = PLUGINS[name]
+    try:
+        plugin = factory()
+    except ImportError:
+        pytest.skip(f"{name} plugin is not installed")
+    plugin.use_http_pool(http_pool)
+    plugin.tool_cache = tool_cache or DisabledToolResultCache()
+    for provider in plugin.tool_providers:
+        setattr(provider, url_attribute, f"{upstream.url}/{_ENDPOINTS.get(name, name)}")
+    if not plugin.supports_chain(wallet.get_chain()):
+        wallet = DummySolanaWalletClient()
+    tool = next(t for t in plugin.get_tools(wallet) if t.name == tool_name)
+    return tool, parameters
+
+
+@pytest.mark.parametrize("name", sorted(PLUGINS))
+def test_plugin_execute_async(benchmark, name, upstream, http_pool, wallet, run):
+    tool, parameters = _plugin_tool(name, upstream, http_pool, wallet)
+    requests_before = upstream.requests
+    benchmark(lambda: run(tool.execute_async(parameters)))
+    assert upstream.requests > requests_before
+
+
+def test_plugin_execute_from_sync_code(benchmark, upstream, http_pool, wallet):
+    # Blocking callers run each call on a temporary loop through run_sync
+    tool, parameters = _plugin_tool("coingecko", upstream, http_pool, wallet)
+    benchmark(tool.execute, parameters)
+
+
+def test_plugin_cached_read(benchmark, upstream, http_pool, wallet, run):
+    # get_trending_coins declares a result cache, so only the first call reaches the stand-in
+    tool, parameters = _plugin_tool("coingecko", upstream, http_pool, wallet, InMemoryToolResultCache())
+    run(tool.execute_async(parameters))
+    requests_before = upstream.requests
+    benchmark(lambda: run(tool.execute_async(parameters)))
+    assert upstream.requests == requests_before
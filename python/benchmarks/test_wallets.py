@@ -0,0 +1,71 @@
+"""Wallet clients against the local JSON-RPC stand-ins."""
+
+import pytest
+
+from benchmarks.stand_ins import ERC20_BALANCE, EVM_NATIVE_BALANCE, SOLANA_BALANCE
+
+USDC_MAINNET = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+HOLDER = "0x0000000000000000000000000000000000000001"
+SOLANA_HOLDER = "11111111111111111111111111111111"
+
+
+@pytest.fixture
+def evm_wallet(upstream):
+    pytest.importorskip("web3")
+    from web3 import Web3
+
+    from goat import TokenMetadataCache
+    from goat_wallets.web3 import Web3EVMWalletClient
+
+    client = Web3(Web3.HTTPProvider(f"{upstream.url}/evm"))
+    return Web3EVMWalletClient(client, token_metadata_cache=TokenMetadataCache())
+
+
+@pytest.fixture
+def solana_wallet(upstream):
+    pytest.importorskip("solana")
+    from solana.rpc.api import Client
+    from solders.keypair import Keypair
+
+    from goat_wallets.solana import solana
+
+    return solana(Client(f"{upstream.url}/solana"), Keypair())
+
+
+def test_web3_native_balance(benchmark, evm_wallet):
+    balance = benchmark(evm_wallet.balance_of, HOLDER)
+    assert int(balance["in_base_units"]) == EVM_NATIVE_BALANCE
+
+
+def test_web3_erc20_balance(benchmark, evm_wallet):
+    balance = benchmark(evm_wallet.balance_of, HOLDER, USDC_MAINNET)
+    assert int(balance["in_base_units"]) == ERC20_BALANCE
+
+
+def test_web3_get_balance_tool(benchmark, evm_wallet):
+    tool = next(t for t in evm_wallet.get_core_tools() if t.name == "get_balance")
+    benchmark(tool.execute, {"address": HOLDER, "tokenAddress": USDC_MAINNET})
+
+
+def test_web3_send_erc20_transfer(benchmark, evm_wallet):
+    from eth_account import Account
+
+    from goat_wallets.evm import ERC20_ABI, NonceManager
+
+    account = Account.create()
+    evm_wallet._web3.eth.default_account = account.address
+    evm_wallet._web3.eth.default_local_account = account
+    evm_wallet._nonce_manager = NonceManager()
+    transaction = {
+        "to": USDC_MAINNET,
+        "abi": ERC20_ABI,
+        "functionName": "transfer",
+        "args": [HOLDER, 10**6],
+    }
+    receipt = benchmark(evm_wallet.send_transaction, transaction)
+    assert receipt["status"] == "1"
+
+
+def test_solana_native_balance(benchmark, solana_wallet):
+    balance = benchmark(solana_wallet.balance_of, SOLANA_HOLDER)
+    assert int(balance["in_base_units"]) == SOLANA_BALANCE
@@ -1,5 +1,17 @@
-from .adapter import register_tools
+from typing import TYPE_CHECKING
+
+from goat.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .adapter import register_tools
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "register_tools": ".adapter",
+    },
+)
 
 __all__ = [
     "register_tools",
-]
\ No newline at end of file
+]
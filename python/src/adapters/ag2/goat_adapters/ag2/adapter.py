@@ -1,5 +1,5 @@
 import inspect
-from typing import List, Any, Dict, Callable, Annotated, Protocol, runtime_checkable, cast, Sequence, get_type_hints
+from typing import List, Any, Dict, Optional, Callable, Annotated, Protocol, runtime_checkable, cast, Sequence, get_type_hints
 from autogen import ConversableAgent, register_function
 from autogen.tools import Tool
 from goat import WalletClientBase, get_tools
@@ -7,19 +7,23 @@ from functools import wraps, update_wrapper
 
 from goat.classes.tool_base import ToolBase
 
-def get_on_chain_tools(wallet: WalletClientBase, plugins: List[Any]) -> List[Tool]:
+def get_on_chain_tools(
+    wallet: WalletClientBase, plugins: List[Any], query: Optional[str] = None, k: int = 10
+) -> List[Tool]:
     """Create typed functions from GOAT tools.
 
     Args:
         wallet: A wallet client instance
         plugins: List of plugin instances
+        query: Only wrap the `k` tools most relevant to this text, e.g. the user's latest message
+        k: Maximum number of tools returned for a query
 
     Returns:
         Dictionary mapping tool names to ToolFunction objects that are callable
         and also expose tool metadata like name and description
     """
     # Get tools from GOAT
-    raw_tools = get_tools(wallet=wallet, plugins=plugins)
+    raw_tools = get_tools(wallet=wallet, plugins=plugins, query=query, k=k)
     typed_functions = []
     
     # Annotate each tool with the correct parameters, the way AG2 expects them
@@ -29,8 +33,8 @@ def get_on_chain_tools(wallet: WalletClientBase, plugins: List[Any]) -> List[Too
             
         parameters_model = raw_tool.parameters
         
-        # Get field information from the Pydantic model schema
-        schema = parameters_model.model_json_schema()
+        # Get field information from the Pydantic model schema (cached and shared, read-only)
+        schema = raw_tool.json_schema()
         properties = schema.get('properties', {})
         
         # Create function with proper annotations
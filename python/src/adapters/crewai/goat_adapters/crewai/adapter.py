@@ -1,11 +1,12 @@
-from typing import List, Any
+from typing import List, Any, Optional
 import traceback
 from crewai.tools import BaseTool
+from crewai.tools.structured_tool import CrewStructuredTool
 from goat.classes.plugin_base import PluginBase
 from litellm import ConfigDict
 from pydantic import BaseModel, Field
 from goat import WalletClientBase, get_tools
-from goat.classes.tool_base import ToolBase
+from goat.classes.tool_base import ToolBase, ValidationMode
 
 class GoatToolWrapper(BaseTool):
     """A wrapper for executing GOAT SDK tools within a CrewAI environment."""
@@ -33,25 +34,45 @@ class GoatToolWrapper(BaseTool):
         self,
         **kwargs: Any
     ) -> Any:
-        """Executes the wrapped GOAT tool."""
+        """Executes the wrapped GOAT tool, validating the arguments.
+
+        BaseTool.run passes its arguments straight to _run, so they are validated here.
+        """
+        return self._execute(kwargs, "full")
+
+    def to_structured_tool(self) -> CrewStructuredTool:
+        """Converts the tool into the structured tool CrewAI agents call.
+
+        The structured tool validates the arguments against args_schema before calling its
+        function, so the GOAT tool does not validate them again.
+        """
+        structured_tool = super().to_structured_tool()
+        structured_tool.func = lambda **kwargs: self._execute(kwargs, "trusted")
+        return structured_tool
+
+    def _execute(self, parameters: dict, validation_mode: ValidationMode) -> Any:
         try:
-            return self.goat_tool.execute(kwargs)
+            return self.goat_tool.execute(parameters, validation_mode=validation_mode)
         except Exception as e:
             # Get the full traceback
             error_details = traceback.format_exc()
             raise Exception(f"Error executing tool {self.name}: {error_details}")
 
-def get_crewai_tools(wallet: WalletClientBase, plugins: List[PluginBase]) -> List[BaseTool]:
+def get_crewai_tools(
+    wallet: WalletClientBase, plugins: List[PluginBase], query: Optional[str] = None, k: int = 10
+) -> List[BaseTool]:
     """Create CrewAI-compatible tools from GOAT tools.
 
     Args:
         wallet: A wallet client instance
         plugins: List of plugin instances
+        query: Only wrap the `k` tools most relevant to this text, e.g. the user's latest message
+        k: Maximum number of tools returned for a query
 
     Returns:
         List of BaseTool instances ready for CrewAI Agents.
     """
-    raw_tools: List[ToolBase] = get_tools(wallet=wallet, plugins=plugins)
+    raw_tools: List[ToolBase] = get_tools(wallet=wallet, plugins=plugins, query=query, k=k)
     crewai_tools: List[BaseTool] = []
 
     for raw_tool in raw_tools:
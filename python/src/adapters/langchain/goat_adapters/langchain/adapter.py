@@ -1,24 +1,32 @@
-from typing import List, TypeVar, Any
+from typing import List, TypeVar, Any, Optional
 
 from langchain_core.tools import BaseTool
 from langchain_core.tools.structured import StructuredTool
 from goat import ToolBase, WalletClientBase, get_tools
 
 
-def get_on_chain_tools(wallet: WalletClientBase, plugins: List[Any]) -> List[BaseTool]:
+def get_on_chain_tools(
+    wallet: WalletClientBase, plugins: List[Any], query: Optional[str] = None, k: int = 10
+) -> List[BaseTool]:
     """Create LangChain tools from GOAT tools.
 
     Args:
         wallet: A wallet client instance
         plugins: List of plugin instances
+        query: Only wrap the `k` tools most relevant to this text, e.g. the user's latest message
+        k: Maximum number of tools returned for a query
 
     Returns:
         List of LangChain Tool instances configured with the GOAT tools
     """
-    tools: List[ToolBase] = get_tools(wallet=wallet, plugins=plugins)
+    tools: List[ToolBase] = get_tools(wallet=wallet, plugins=plugins, query=query, k=k)
 
+    # StructuredTool validates the arguments against args_schema before calling the tool
     def _execute_tool(t: ToolBase, **args):
-        return t.execute(args)
+        return t.execute(args, validation_mode="trusted")
+
+    async def _execute_tool_async(t: ToolBase, **args):
+        return await t.execute_async(args, validation_mode="trusted")
 
     langchain_tools = []
     for t in tools:
@@ -27,6 +35,7 @@ def get_on_chain_tools(wallet: WalletClientBase, plugins: List[Any]) -> List[Bas
             name=t.name,
             description=t.description,
             func=lambda t=t, **args: _execute_tool(t, **args),
+            coroutine=lambda t=t, **args: _execute_tool_async(t, **args),
             args_schema=t.parameters,
         )
         langchain_tools.append(tool)
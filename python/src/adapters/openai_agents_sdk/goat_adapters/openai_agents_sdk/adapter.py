@@ -1,29 +1,35 @@
-from typing import List, Any
+from typing import List, Any, Optional
 
+import copy
 import json
 from agents import FunctionTool, RunContextWrapper
 from goat import ToolBase, WalletClientBase, get_tools
 
-def get_on_chain_tools(wallet: WalletClientBase, plugins: List[Any]) -> List[FunctionTool]:
+def get_on_chain_tools(
+    wallet: WalletClientBase, plugins: List[Any], query: Optional[str] = None, k: int = 10
+) -> List[FunctionTool]:
     """Create OpenAI Agents SDK tools from GOAT tools.
 
     Args:
         wallet: A wallet client instance
         plugins: List of plugin instances
+        query: Only wrap the `k` tools most relevant to this text, e.g. the user's latest message
+        k: Maximum number of tools returned for a query
 
     Returns:
         List of OpenAI Agents SDK Tool instances configured with the GOAT tools
     """
-    tools: List[ToolBase] = get_tools(wallet=wallet, plugins=plugins)
+    tools: List[ToolBase] = get_tools(wallet=wallet, plugins=plugins, query=query, k=k)
 
     openai_agents_sdk_tools = []
 
     for t in tools:
-        async def _execute_tool(ctx: RunContextWrapper[Any], args: str) -> str:
+        async def _execute_tool(ctx: RunContextWrapper[Any], args: str, t: ToolBase = t) -> str:
             parsed = json.loads(args) if args else {}
-            return str(tool.execute(parsed))
-    
-        schema = t.parameters.model_json_schema()
+            return str(await t.execute_async(parsed))
+
+        # The cached schema is shared between tools, and the SDK rewrites its params schema in place
+        schema = copy.deepcopy(t.json_schema())
         # TODO: Consider making custom BaseModel with extra = "forbid"
         schema["additionalProperties"] = False
 
@@ -1,6 +1,19 @@
-from .adapter import get_smolagents_tools, GoatToolWrapper
+from typing import TYPE_CHECKING
+
+from goat.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .adapter import get_smolagents_tools, GoatToolWrapper
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "get_smolagents_tools": ".adapter",
+        "GoatToolWrapper": ".adapter",
+    },
+)
 
 __all__ = [
     "get_smolagents_tools",
     "GoatToolWrapper",
-]
\ No newline at end of file
+]
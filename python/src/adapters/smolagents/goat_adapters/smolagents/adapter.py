@@ -1,6 +1,7 @@
 from typing import List, Any, Dict, get_origin, Optional, Type
 import inspect
 import traceback
+from functools import lru_cache
 from goat.classes.plugin_base import PluginBase
 from pydantic import BaseModel
 from goat import WalletClientBase, get_tools
@@ -27,6 +28,41 @@ def python_type_to_json_schema_type(python_type: Type) -> str:
         # For complex types or when unsure, use string as fallback
         return "string"
 
+@lru_cache(maxsize=None)
+def get_smolagents_inputs(parameters: Type[BaseModel]) -> Dict[str, Dict[str, str]]:
+    """Convert a GOAT parameters model to Smolagents inputs, once per model."""
+    inputs = {}
+    # Using Pydantic v2 model_fields
+    model_fields = getattr(parameters, "model_fields", {})
+    for field_name, field_info in model_fields.items():
+        # Get field type from annotation
+        python_type = field_info.annotation
+        
+        # Convert Python type to JSON schema type
+        field_type = python_type_to_json_schema_type(python_type)
+        
+        # Get field description
+        field_description = getattr(field_info, "description", "") or f"Parameter {field_name}"
+        
+        inputs[field_name] = {
+            "type": field_type,
+            "description": field_description
+        }
+    return inputs
+
+@lru_cache(maxsize=None)
+def get_smolagents_output_type(tool_class: Type[ToolBase]) -> str:
+    """Determine the Smolagents output_type from a tool class's execute return annotation, once per class."""
+    try:
+        return_type = inspect.signature(tool_class.execute).return_annotation
+        if return_type is not inspect.Signature.empty:
+            return python_type_to_json_schema_type(return_type)
+        # Default to string if no return annotation
+        return "string"
+    except (ValueError, TypeError):
+        # If we can't determine the return type, default to string
+        return "string"
+
 class GoatToolWrapper(Tool):
     """A wrapper for executing GOAT SDK tools within a Smolagents environment."""
     
@@ -41,37 +77,10 @@ class GoatToolWrapper(Tool):
         # We have a dynamic forward method, with our own validation
         self.skip_forward_signature_validation = True
         
-        # Convert GOAT tool parameters to Smolagents inputs format
-        self.inputs = {}
-        if hasattr(goat_tool, 'parameters'):
-            # Using Pydantic v2 model_fields
-            model_fields = getattr(goat_tool.parameters, "model_fields", {})
-            for field_name, field_info in model_fields.items():
-                # Get field type from annotation
-                python_type = field_info.annotation
-                
-                # Convert Python type to JSON schema type
-                field_type = python_type_to_json_schema_type(python_type)
-                
-                # Get field description
-                field_description = getattr(field_info, "description", "") or f"Parameter {field_name}"
-                
-                self.inputs[field_name] = {
-                    "type": field_type,
-                    "description": field_description
-                }
-        
-        # Try to determine output_type from the execute method's return annotation
-        try:
-            return_type = inspect.signature(goat_tool.execute).return_annotation
-            if return_type is not inspect.Signature.empty:
-                self.output_type = python_type_to_json_schema_type(return_type)
-            else:
-                # Default to string if no return annotation
-                self.output_type = "string"
-        except (ValueError, TypeError):
-            # If we can't determine the return type, default to string
-            self.output_type = "string"
+        # Convert GOAT tool parameters to Smolagents inputs format. The conversion is cached per
+        # model; each wrapper gets its own copy since Smolagents owns the inputs it is given
+        self.inputs = {name: dict(spec) for name, spec in get_smolagents_inputs(goat_tool.parameters).items()}
+        self.output_type = get_smolagents_output_type(type(goat_tool))
         
         super().__init__()
 
@@ -84,17 +93,21 @@ class GoatToolWrapper(Tool):
             error_details = traceback.format_exc()
             raise Exception(f"Error executing tool {self.name}: {error_details}")
 
-def get_smolagents_tools(wallet: WalletClientBase, plugins: List[PluginBase]) -> List[Tool]:
+def get_smolagents_tools(
+    wallet: WalletClientBase, plugins: List[PluginBase], query: Optional[str] = None, k: int = 10
+) -> List[Tool]:
     """Create Smolagents-compatible tools from GOAT tools.
 
     Args:
         wallet: A wallet client instance
         plugins: List of plugin instances
+        query: Only wrap the `k` tools most relevant to this text, e.g. the user's latest message
+        k: Maximum number of tools returned for a query
 
     Returns:
         List of Tool instances ready for Smolagents Agents.
     """
-    raw_tools: List[ToolBase] = get_tools(wallet=wallet, plugins=plugins)
+    raw_tools: List[ToolBase] = get_tools(wallet=wallet, plugins=plugins, query=query, k=k)
     smolagents_tools: List[Tool] = []
 
     for raw_tool in raw_tools:
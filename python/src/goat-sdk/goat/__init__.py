@@ -1,19 +1,170 @@
-from .classes.tool_base import create_tool, ToolBase
-from .classes.wallet_client_base import WalletClientBase
-from .classes.plugin_base import PluginBase
-from .utils.snake_case import snake_case
-from .utils.get_tools import get_tools
-from .types.chain import Chain, EvmChain, SolanaChain, AptosChain, ChromiaChain, MultiversXChain
+from typing import TYPE_CHECKING
+
+from .utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .classes.tool_base import create_tool, ToolBase, FunctionTool, ValidationMode
+    from .classes.wallet_client_base import WalletClientBase
+    from .classes.plugin_base import PluginBase
+    from .classes.http_session_pool import HTTPSessionPool, HTTPSessionPoolOptions, default_http_session_pool
+    from .classes.token_metadata_cache import (
+        TokenMetadataCache,
+        TokenMetadataStore,
+        InMemoryTokenMetadataStore,
+        JSONFileTokenMetadataStore,
+        default_token_metadata_cache,
+    )
+    from .classes.instrumentation import (
+        ToolCallEvent,
+        InstrumentationHook,
+        HistogramCollector,
+        ToolLatencyHistogram,
+        OpenTelemetryExporter,
+        add_instrumentation_hook,
+        remove_instrumentation_hook,
+        current_tool_call,
+        record_upstream_call,
+        instrument_requests_session,
+        instrument_httpx_client,
+    )
+    from .classes.tool_result_cache import (
+        ToolResultCache,
+        InMemoryToolResultCache,
+        RedisToolResultCache,
+        default_tool_result_cache,
+    )
+    from .classes.rate_limiter import (
+        RateLimit,
+        RateLimiter,
+        rate_limit_tenant,
+        use_rate_limiter,
+        current_rate_limiter,
+        current_tenant,
+    )
+    from .classes.single_flight import SingleFlight, default_single_flight
+    from .classes.token_registry import TokenRegistry, RegisteredToken
+    from .classes.tool_index import ToolIndex, get_tool_index
+    from .classes.result_shaping import ResultCursorStore, default_result_cursor_store
+    from .utils.snake_case import snake_case
+    from .utils.get_tools import get_tools
+    from .utils.maybe_await import maybe_await
+    from .utils.execute_many import execute_many, execute_many_async, ToolCallResult
+    from .types.chain import Chain, EvmChain, SolanaChain, AptosChain, ChromiaChain, MultiversXChain
+    from .types.token import Token, TokenMetadata
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "create_tool": ".classes.tool_base",
+        "ToolBase": ".classes.tool_base",
+        "FunctionTool": ".classes.tool_base",
+        "ValidationMode": ".classes.tool_base",
+        "WalletClientBase": ".classes.wallet_client_base",
+        "PluginBase": ".classes.plugin_base",
+        "HTTPSessionPool": ".classes.http_session_pool",
+        "HTTPSessionPoolOptions": ".classes.http_session_pool",
+        "default_http_session_pool": ".classes.http_session_pool",
+        "TokenMetadataCache": ".classes.token_metadata_cache",
+        "TokenMetadataStore": ".classes.token_metadata_cache",
+        "InMemoryTokenMetadataStore": ".classes.token_metadata_cache",
+        "JSONFileTokenMetadataStore": ".classes.token_metadata_cache",
+        "default_token_metadata_cache": ".classes.token_metadata_cache",
+        "ToolCallEvent": ".classes.instrumentation",
+        "InstrumentationHook": ".classes.instrumentation",
+        "HistogramCollector": ".classes.instrumentation",
+        "ToolLatencyHistogram": ".classes.instrumentation",
+        "OpenTelemetryExporter": ".classes.instrumentation",
+        "add_instrumentation_hook": ".classes.instrumentation",
+        "remove_instrumentation_hook": ".classes.instrumentation",
+        "current_tool_call": ".classes.instrumentation",
+        "record_upstream_call": ".classes.instrumentation",
+        "instrument_requests_session": ".classes.instrumentation",
+        "instrument_httpx_client": ".classes.instrumentation",
+        "ToolResultCache": ".classes.tool_result_cache",
+        "InMemoryToolResultCache": ".classes.tool_result_cache",
+        "RedisToolResultCache": ".classes.tool_result_cache",
+        "default_tool_result_cache": ".classes.tool_result_cache",
+        "RateLimit": ".classes.rate_limiter",
+        "RateLimiter": ".classes.rate_limiter",
+        "rate_limit_tenant": ".classes.rate_limiter",
+        "use_rate_limiter": ".classes.rate_limiter",
+        "current_rate_limiter": ".classes.rate_limiter",
+        "current_tenant": ".classes.rate_limiter",
+        "SingleFlight": ".classes.single_flight",
+        "default_single_flight": ".classes.single_flight",
+        "TokenRegistry": ".classes.token_registry",
+        "RegisteredToken": ".classes.token_registry",
+        "ToolIndex": ".classes.tool_index",
+        "get_tool_index": ".classes.tool_index",
+        "ResultCursorStore": ".classes.result_shaping",
+        "default_result_cursor_store": ".classes.result_shaping",
+        "snake_case": ".utils.snake_case",
+        "get_tools": ".utils.get_tools",
+        "maybe_await": ".utils.maybe_await",
+        "execute_many": ".utils.execute_many",
+        "execute_many_async": ".utils.execute_many",
+        "ToolCallResult": ".utils.execute_many",
+        "Chain": ".types.chain",
+        "EvmChain": ".types.chain",
+        "SolanaChain": ".types.chain",
+        "AptosChain": ".types.chain",
+        "ChromiaChain": ".types.chain",
+        "MultiversXChain": ".types.chain",
+        "Token": ".types.token",
+        "TokenMetadata": ".types.token",
+    },
+)
 
 __all__ = [
     # Classes
     "ToolBase",
     "create_tool",
+    "FunctionTool",
+    "ValidationMode",
     "WalletClientBase",
     "PluginBase",
+    "HTTPSessionPool",
+    "HTTPSessionPoolOptions",
+    "TokenMetadataCache",
+    "TokenMetadataStore",
+    "InMemoryTokenMetadataStore",
+    "JSONFileTokenMetadataStore",
+    "TokenRegistry",
+    "ToolIndex",
+    "ResultCursorStore",
+    "ToolResultCache",
+    "InMemoryToolResultCache",
+    "RedisToolResultCache",
+    "SingleFlight",
+    "RateLimit",
+    "RateLimiter",
+    "ToolCallEvent",
+    "InstrumentationHook",
+    "HistogramCollector",
+    "ToolLatencyHistogram",
+    "OpenTelemetryExporter",
     # Utils
     "snake_case",
     "get_tools",
+    "get_tool_index",
+    "execute_many",
+    "maybe_await",
+    "execute_many_async",
+    "default_http_session_pool",
+    "default_token_metadata_cache",
+    "default_tool_result_cache",
+    "default_single_flight",
+    "default_result_cursor_store",
+    "rate_limit_tenant",
+    "use_rate_limiter",
+    "current_rate_limiter",
+    "current_tenant",
+    "add_instrumentation_hook",
+    "remove_instrumentation_hook",
+    "current_tool_call",
+    "record_upstream_call",
+    "instrument_requests_session",
+    "instrument_httpx_client",
     # Types
     "Chain",
     "EvmChain",
@@ -21,4 +172,8 @@ __all__ = [
     "AptosChain",
     "ChromiaChain",
     "MultiversXChain",
+    "Token",
+    "TokenMetadata",
+    "RegisteredToken",
+    "ToolCallResult",
 ]
@@ -0,0 +1,155 @@
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from goat.classes.instrumentation import create_aiohttp_trace_config
+from goat.classes.rate_limiter import create_rate_limit_trace_config
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+@dataclass
+class HTTPSessionPoolOptions:
+    """
+    Connection settings for an HTTPSessionPool
+
+    Attributes:
+        limit: Maximum number of simultaneous connections across all hosts
+        limit_per_host: Maximum number of simultaneous connections to a single host
+        keepalive_timeout: Seconds an idle keep-alive connection is kept open
+        ttl_dns_cache: Seconds resolved DNS entries are cached
+        timeout: Default total timeout in seconds for a request. None keeps aiohttp's default of
+            5 minutes; services needing a shorter bound pass a per-request timeout
+    """
+
+    limit: int = 100
+    limit_per_host: int = 10
+    keepalive_timeout: float = 30.0
+    ttl_dns_cache: int = 300
+    timeout: Optional[float] = None
+
+
+class HTTPSessionPool:
+    """
+    Lifecycle-managed pool of aiohttp sessions shared by HTTP-backed plugin services
+
+    aiohttp sessions are bound to the event loop they were created on, so the pool keeps
+    one session (with its own keep-alive connector) per loop and hands it out to every
+    request made on that loop. Sessions of loops that have been closed are closed and
+    dropped on the next get_session() call.
+    """
+
+    def __init__(self, options: Optional[HTTPSessionPoolOptions] = None):
+        """
+        Creates a new HTTPSessionPool
+
+        Args:
+            options: Connection settings. Defaults to HTTPSessionPoolOptions()
+        """
+        self.options = options or HTTPSessionPoolOptions()
+        # id(loop) -> (loop, session). The session references its loop, so a dict keyed weakly by
+        # loop would never drop an entry; closed loops are pruned instead
+        self._sessions: "Dict[int, Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]]" = {}
+        self._lock = threading.Lock()
+
+    async def get_session(self) -> "aiohttp.ClientSession":
+        """
+        Returns the pooled session for the running event loop, creating it on first use
+
+        Returns:
+            An open aiohttp.ClientSession. Callers must not close it.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            stale_sessions = self._pop_closed_loops()
+            entry = self._sessions.get(id(loop))
+            session = entry[1] if entry is not None else None
+            if session is None or session.closed:
+                session = self._create_session()
+                self._sessions[id(loop)] = (loop, session)
+
+        # The loops are gone, so the connections cannot be shut down gracefully; closing the
+        # sessions here only releases them
+        for stale_session in stale_sessions:
+            await stale_session.close()
+        return session
+
+    async def release(self) -> None:
+        """
+        Closes the session bound to the running event loop, if any
+
+        Used before discarding a short-lived event loop so its connections are not leaked.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._sessions.pop(id(loop), None)
+        if entry is not None and not entry[1].closed:
+            await entry[1].close()
+
+    async def close(self) -> None:
+        """
+        Closes every session in the pool
+
+        Sessions bound to other running loops are closed on their own loop. Sessions whose
+        loop has already closed are closed on the current loop. Sessions whose loop is
+        stopped but not closed are dropped.
+        """
+        current_loop = asyncio.get_running_loop()
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+
+        for loop, session in sessions:
+            if session.closed:
+                continue
+            if loop is current_loop or loop.is_closed():
+                await session.close()
+            elif loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+
+    def _pop_closed_loops(self) -> "List[aiohttp.ClientSession]":
+        # Called with the lock held
+        closed = [key for key, (loop, _) in self._sessions.items() if loop.is_closed()]
+        return [self._sessions.pop(key)[1] for key in closed]
+
+    def _create_session(self) -> "aiohttp.ClientSession":
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise ImportError(
+                "HTTPSessionPool requires aiohttp. Install it with `pip install goat-sdk[http]`."
+            ) from e
+
+        connector = aiohttp.TCPConnector(
+            limit=self.options.limit,
+            limit_per_host=self.options.limit_per_host,
+            keepalive_timeout=self.options.keepalive_timeout,
+            ttl_dns_cache=self.options.ttl_dns_cache,
+        )
+        session_options = {}
+        if self.options.timeout is not None:
+            session_options["timeout"] = aiohttp.ClientTimeout(total=self.options.timeout)
+        return aiohttp.ClientSession(
+            connector=connector,
+            # Apply the calling plugin's rate limiter, and attribute requests and body sizes
+            # to the instrumented tool call that made them
+            trace_configs=[create_rate_limit_trace_config(), create_aiohttp_trace_config()],
+            **session_options,
+        )
+
+
+_default_pool: Optional[HTTPSessionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def default_http_session_pool() -> HTTPSessionPool:
+    """
+    Returns the process-wide HTTPSessionPool used by plugins that are not given one explicitly
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = HTTPSessionPool()
+        return _default_pool
@@ -0,0 +1,477 @@
+import bisect
+import contextvars
+import math
+import threading
+import time
+from abc import ABC
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+@dataclass
+class ToolCallEvent:
+    """
+    Measurements of a single tool call, handed to instrumentation hooks
+
+    Attributes:
+        tool_name: The name of the tool
+        plugin_name: The name of the plugin providing the tool, or None for wallet core tools
+        started_at: Wall-clock start time of the call, in seconds since the epoch
+        validation_time: Seconds spent validating the parameters
+        execution_time: Seconds spent running the tool
+        upstream_calls: Number of HTTP/RPC requests made while the tool ran
+        upstream_bytes_sent: Request body bytes sent upstream
+        upstream_bytes_received: Response body bytes received from upstream
+        error: The exception raised by the call, if any
+    """
+
+    tool_name: str
+    plugin_name: Optional[str] = None
+    started_at: float = 0.0
+    validation_time: float = 0.0
+    execution_time: float = 0.0
+    upstream_calls: int = 0
+    upstream_bytes_sent: int = 0
+    upstream_bytes_received: int = 0
+    error: Optional[BaseException] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def duration(self) -> float:
+        """Total seconds spent in the call"""
+        return self.validation_time + self.execution_time
+
+
+class InstrumentationHook(ABC):
+    """
+    Receives tool call events. Override the callbacks you need; both default to no-ops.
+
+    Hooks run synchronously on the tool-call path, so they should only record data.
+    """
+
+    def on_tool_start(self, event: ToolCallEvent) -> None:
+        """Called before the tool's parameters are validated"""
+        pass
+
+    def on_tool_end(self, event: ToolCallEvent) -> None:
+        """Called once the tool returned or raised, with every measurement filled in"""
+        pass
+
+
+_hooks: Tuple[InstrumentationHook, ...] = ()
+_hooks_lock = threading.Lock()
+_current_tool_call: contextvars.ContextVar[Optional[ToolCallEvent]] = contextvars.ContextVar(
+    "goat_current_tool_call", default=None
+)
+
+
+def add_instrumentation_hook(hook: InstrumentationHook) -> None:
+    """
+    Registers a hook that receives every tool call event of the process
+
+    Args:
+        hook: The hook to register
+    """
+    global _hooks
+    with _hooks_lock:
+        if hook not in _hooks:
+            _hooks = (*_hooks, hook)
+
+
+def remove_instrumentation_hook(hook: InstrumentationHook) -> None:
+    """
+    Unregisters a hook added with add_instrumentation_hook
+
+    Args:
+        hook: The hook to remove
+    """
+    global _hooks
+    with _hooks_lock:
+        _hooks = tuple(registered for registered in _hooks if registered is not hook)
+
+
+def instrumentation_enabled() -> bool:
+    """
+    Returns True when at least one hook is registered. Tool calls skip all measurements otherwise.
+    """
+    return bool(_hooks)
+
+
+def current_tool_call() -> Optional[ToolCallEvent]:
+    """
+    Returns the event of the tool call running in the current context, if any
+    """
+    return _current_tool_call.get()
+
+
+@contextmanager
+def instrument_tool_call(tool_name: str, plugin_name: Optional[str] = None) -> Iterator[ToolCallEvent]:
+    """
+    Tracks a tool call: notifies the hooks and makes the event current for upstream accounting
+
+    Args:
+        tool_name: The name of the tool
+        plugin_name: The name of the plugin providing the tool
+
+    Yields:
+        The event of the call. Callers fill in validation_time and execution_time.
+    """
+    hooks = _hooks
+    event = ToolCallEvent(tool_name=tool_name, plugin_name=plugin_name, started_at=time.time())
+    token = _current_tool_call.set(event)
+    _notify(hooks, "on_tool_start", event)
+    try:
+        yield event
+    except BaseException as e:
+        event.error = e
+        raise
+    finally:
+        _current_tool_call.reset(token)
+        _notify(hooks, "on_tool_end", event)
+
+
+def record_upstream_call(bytes_sent: int = 0, bytes_received: int = 0, calls: int = 1) -> None:
+    """
+    Adds an upstream HTTP/RPC request to the tool call running in the current context
+
+    Does nothing outside of an instrumented tool call, so clients can call it unconditionally.
+
+    Args:
+        bytes_sent: Request body size in bytes
+        bytes_received: Response body size in bytes
+        calls: Number of requests to add
+    """
+    event = _current_tool_call.get()
+    if event is None:
+        return
+    with event._lock:
+        event.upstream_calls += calls
+        event.upstream_bytes_sent += bytes_sent
+        event.upstream_bytes_received += bytes_received
+
+
+def create_aiohttp_trace_config() -> "aiohttp.TraceConfig":
+    """
+    Returns an aiohttp TraceConfig that records each request of a session as an upstream call
+
+    Returns:
+        A TraceConfig to pass to aiohttp.ClientSession(trace_configs=[...])
+    """
+    import aiohttp
+
+    async def on_request_end(session: Any, context: Any, params: Any) -> None:
+        record_upstream_call()
+
+    async def on_request_exception(session: Any, context: Any, params: Any) -> None:
+        record_upstream_call()
+
+    async def on_request_chunk_sent(session: Any, context: Any, params: Any) -> None:
+        record_upstream_call(bytes_sent=len(params.chunk), calls=0)
+
+    async def on_response_chunk_received(session: Any, context: Any, params: Any) -> None:
+        record_upstream_call(bytes_received=len(params.chunk), calls=0)
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    trace_config.on_request_chunk_sent.append(on_request_chunk_sent)
+    trace_config.on_response_chunk_received.append(on_response_chunk_received)
+    return trace_config
+
+
+def instrument_requests_session(session: Any) -> Any:
+    """
+    Adds a response hook to a requests.Session that records each request as an upstream call
+
+    Useful for clients built on `requests`, e.g. web3's HTTPProvider(endpoint, session=...).
+
+    Args:
+        session: The requests.Session to instrument
+
+    Returns:
+        The same session
+    """
+    session.hooks.setdefault("response", []).append(_record_requests_response)
+    return session
+
+
+def instrument_httpx_client(client: Any) -> Any:
+    """
+    Adds a response hook to an httpx.Client or httpx.AsyncClient that records each request as an
+    upstream call
+
+    Useful for clients built on `httpx`, e.g. the HTTP providers of solana-py. Instrumenting the
+    same client twice has no effect.
+
+    Args:
+        client: The httpx.Client or httpx.AsyncClient to instrument
+
+    Returns:
+        The same client
+    """
+    hook = _record_httpx_response_async if hasattr(client, "aclose") else _record_httpx_response
+    hooks = client.event_hooks["response"]
+    if hook not in hooks:
+        hooks.append(hook)
+    return client
+
+
+def _record_requests_response(response: Any, *args: Any, **kwargs: Any) -> None:
+    if _current_tool_call.get() is None:
+        return
+    body = response.request.body if response.request is not None else None
+    bytes_sent = len(body) if isinstance(body, (bytes, str)) else 0
+    record_upstream_call(bytes_sent=bytes_sent, bytes_received=len(response.content or b""))
+
+
+def _record_httpx_response(response: Any) -> None:
+    if _current_tool_call.get() is None:
+        return
+    # Response hooks run before the body is read; callers read it right after anyway
+    response.read()
+    record_upstream_call(bytes_sent=_httpx_request_size(response.request), bytes_received=len(response.content))
+
+
+async def _record_httpx_response_async(response: Any) -> None:
+    if _current_tool_call.get() is None:
+        return
+    await response.aread()
+    record_upstream_call(bytes_sent=_httpx_request_size(response.request), bytes_received=len(response.content))
+
+
+def _httpx_request_size(request: Any) -> int:
+    try:
+        return len(request.content)
+    except Exception:
+        # Streamed request bodies are not buffered, so their size is unknown
+        return 0
+
+
+def _notify(hooks: Tuple[InstrumentationHook, ...], callback: str, event: ToolCallEvent) -> None:
+    for hook in hooks:
+        try:
+            getattr(hook, callback)(event)
+        except Exception as e:
+            # A broken hook must not fail the tool call it observes
+            print(f"Warning: Instrumentation hook {type(hook).__name__}.{callback} failed: {e}")
+
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+
+class ToolLatencyHistogram:
+    """
+    Bucketed latency distribution and upstream totals of one tool
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Creates an empty histogram
+
+        Args:
+            buckets: Increasing bucket upper bounds in seconds. An overflow bucket is added after the last one
+        """
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.errors = 0
+        self.validation_total = 0.0
+        self.upstream_calls = 0
+        self.upstream_bytes = 0
+
+    def observe(self, event: ToolCallEvent) -> None:
+        """
+        Adds a tool call to the histogram
+
+        Args:
+            event: The finished tool call
+        """
+        duration = event.duration
+        self.bucket_counts[bisect.bisect_left(self.buckets, duration)] += 1
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.validation_total += event.validation_time
+        self.upstream_calls += event.upstream_calls
+        self.upstream_bytes += event.upstream_bytes_sent + event.upstream_bytes_received
+        if event.error is not None:
+            self.errors += 1
+
+    def percentile(self, p: float) -> float:
+        """
+        Estimates a latency percentile by interpolating inside the matching bucket
+
+        Args:
+            p: The percentile as a fraction, e.g. 0.99
+
+        Returns:
+            The estimated latency in seconds, or 0.0 for an empty histogram
+        """
+        if not 0 <= p <= 1:
+            raise ValueError("Percentile must be between 0 and 1")
+        if self.count == 0:
+            return 0.0
+        rank = p * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                upper = min(upper, self.max)
+                lower = min(lower, upper)
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds"""
+        return self.total / self.count if self.count else 0.0
+
+
+class HistogramCollector(InstrumentationHook):
+    """
+    In-process collector keeping a latency histogram per (plugin name, tool name)
+
+    Register it with add_instrumentation_hook, then use `slowest` to find the tools with the
+    worst tail latency.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Creates a new HistogramCollector
+
+        Args:
+            buckets: Increasing bucket upper bounds in seconds
+        """
+        self.buckets = tuple(buckets)
+        self._histograms: Dict[Tuple[Optional[str], str], ToolLatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def on_tool_end(self, event: ToolCallEvent) -> None:
+        key = (event.plugin_name, event.tool_name)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = ToolLatencyHistogram(self.buckets)
+            histogram.observe(event)
+
+    def get(self, tool_name: str, plugin_name: Optional[str] = None) -> Optional[ToolLatencyHistogram]:
+        """
+        Returns the histogram of a tool, if it has been called
+
+        Args:
+            tool_name: The name of the tool
+            plugin_name: The name of the plugin providing the tool
+        """
+        return self._histograms.get((plugin_name, tool_name))
+
+    def slowest(self, p: float = 0.99, limit: int = 10) -> List[Tuple[Optional[str], str, float]]:
+        """
+        Returns the tools with the highest latency percentile
+
+        Args:
+            p: The percentile as a fraction, e.g. 0.99
+            limit: Maximum number of tools to return
+
+        Returns:
+            (plugin name, tool name, latency in seconds) tuples, slowest first
+        """
+        with self._lock:
+            ranked = [
+                (plugin_name, tool_name, histogram.percentile(p))
+                for (plugin_name, tool_name), histogram in self._histograms.items()
+            ]
+        ranked.sort(key=lambda entry: entry[2], reverse=True)
+        return ranked[:limit]
+
+    def reset(self) -> None:
+        """Drops every recorded histogram"""
+        with self._lock:
+            self._histograms.clear()
+
+
+class OpenTelemetryExporter(InstrumentationHook):
+    """
+    Exports tool call events as OpenTelemetry metrics and, optionally, spans
+
+    Metrics: goat.tool.duration and goat.tool.validation.duration histograms (seconds), and
+    goat.tool.errors, goat.tool.upstream.calls and goat.tool.upstream.bytes counters, all with
+    goat.tool.name and goat.plugin.name attributes.
+    """
+
+    def __init__(self, meter_provider: Any = None, tracer_provider: Any = None, record_spans: bool = True):
+        """
+        Creates a new OpenTelemetryExporter
+
+        Args:
+            meter_provider: OpenTelemetry MeterProvider. Defaults to the global provider
+            tracer_provider: OpenTelemetry TracerProvider. Defaults to the global provider
+            record_spans: Whether to emit a span per tool call
+        """
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryExporter requires opentelemetry-api. Install it with `pip install goat-sdk[otel]`."
+            ) from e
+
+        meter = metrics.get_meter("goat", meter_provider=meter_provider)
+        self._duration = meter.create_histogram(
+            "goat.tool.duration", unit="s", description="Duration of GOAT tool calls"
+        )
+        self._validation_duration = meter.create_histogram(
+            "goat.tool.validation.duration", unit="s", description="Time spent validating GOAT tool parameters"
+        )
+        self._errors = meter.create_counter("goat.tool.errors", description="GOAT tool calls that raised")
+        self._upstream_calls = meter.create_counter(
+            "goat.tool.upstream.calls", description="Upstream HTTP/RPC requests made by GOAT tools"
+        )
+        self._upstream_bytes = meter.create_counter(
+            "goat.tool.upstream.bytes", unit="By", description="Upstream HTTP/RPC body bytes of GOAT tools"
+        )
+        self._tracer = trace.get_tracer("goat", tracer_provider=tracer_provider) if record_spans else None
+
+    def on_tool_end(self, event: ToolCallEvent) -> None:
+        attributes = {"goat.tool.name": event.tool_name, "goat.plugin.name": event.plugin_name or ""}
+        self._duration.record(event.duration, attributes)
+        self._validation_duration.record(event.validation_time, attributes)
+        if event.error is not None:
+            self._errors.add(1, attributes)
+        if event.upstream_calls:
+            self._upstream_calls.add(event.upstream_calls, attributes)
+        if event.upstream_bytes_sent:
+            self._upstream_bytes.add(event.upstream_bytes_sent, {**attributes, "goat.direction": "sent"})
+        if event.upstream_bytes_received:
+            self._upstream_bytes.add(event.upstream_bytes_received, {**attributes, "goat.direction": "received"})
+
+        if self._tracer is not None:
+            self._export_span(event, attributes)
+
+    def _export_span(self, event: ToolCallEvent, attributes: Dict[str, Any]) -> None:
+        from opentelemetry.trace import Status, StatusCode
+
+        start_time = int(event.started_at * 1e9)
+        span = self._tracer.start_span(  # type: ignore[union-attr]
+            f"goat.tool {event.tool_name}",
+            start_time=start_time,
+            attributes={
+                **attributes,
+                "goat.tool.validation_time": event.validation_time,
+                "goat.tool.upstream.calls": event.upstream_calls,
+                "goat.tool.upstream.bytes_sent": event.upstream_bytes_sent,
+                "goat.tool.upstream.bytes_received": event.upstream_bytes_received,
+            },
+        )
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(Status(StatusCode.ERROR, str(event.error)))
+        span.end(end_time=start_time + int(math.ceil(event.duration * 1e9)))
@@ -1,23 +1,45 @@
 import asyncio
+import copy
 import inspect
+import json
 import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import List, Any, TypeVar, Generic
+from typing import Dict, List, Any, Optional, Tuple, TypeVar, Generic
 
+from goat.classes.http_session_pool import HTTPSessionPool, default_http_session_pool
 from goat.classes.tool_base import ToolBase, create_tool
+from goat.classes.rate_limiter import RateLimiter, use_rate_limiter
+from goat.classes.result_shaping import default_result_cursor_store, shape_result
+from goat.classes.single_flight import default_single_flight
+from goat.classes.tool_result_cache import ToolResultCache, default_tool_result_cache
 from goat.classes.wallet_client_base import WalletClientBase
 from goat.types.chain import Chain
 from goat.decorators.tool import StoredToolMetadata, TOOL_METADATA_KEY
+from goat.utils.run_sync import run_sync
 
 TWalletClient = TypeVar("TWalletClient", bound=WalletClientBase)
 
+# Attribute on wallet clients holding the tools each plugin built for them. Keeping the cache on
+# the wallet ties its lifetime to the wallet: the tools reference the wallet, so a cache keyed by
+# wallet elsewhere would keep every wallet alive. The tools run against a copy of their plugin
+# rather than the plugin itself, so the cached tools do not keep their plugin key alive.
+WALLET_TOOL_CACHE_ATTR = "_goat_plugin_tools"
+
 
 class PluginBase(Generic[TWalletClient], ABC):
     """
     Abstract base class for plugins that provide tools for wallet interactions.
     """
 
-    def __init__(self, name: str, tool_providers: List[object]):
+    def __init__(
+        self,
+        name: str,
+        tool_providers: List[object],
+        http_pool: Optional[HTTPSessionPool] = None,
+        tool_cache: Optional[ToolResultCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
         """
         Creates a new Plugin instance.
 
@@ -25,6 +47,14 @@ class PluginBase(Generic[TWalletClient], ABC):
             name: The name of the plugin
             tool_providers: Array of class instances that provide tools. Must be actual instances,
                           not classes themselves.
+            http_pool: Optional HTTP session pool for the plugin's tool providers. Defaults to the
+                       process-wide pool returned by default_http_session_pool(). Its sessions keep
+                       aiohttp's default request timeout unless HTTPSessionPoolOptions.timeout is set.
+            tool_cache: Optional cache for the results of tools declaring cache options. Defaults to
+                        the process-wide cache returned by default_tool_result_cache().
+            rate_limiter: Optional rate limiter for the pooled HTTP requests made by the plugin's tools.
+                          Pass the same limiter to several plugin instances to share a quota. Defaults
+                          to a limiter that only pauses hosts answering 429.
         """
         if not all(
             isinstance(provider, object) and not isinstance(provider, type)
@@ -36,6 +66,74 @@ class PluginBase(Generic[TWalletClient], ABC):
 
         self.name = name
         self.tool_providers = tool_providers
+        self.use_http_pool(http_pool or default_http_session_pool())
+        self.tool_cache = tool_cache or default_tool_result_cache()
+        self.single_flight = default_single_flight()
+        self.rate_limiter = rate_limiter or RateLimiter()
+
+    # Tool metadata discovered per tool provider class, shared by all plugin instances
+    _tool_metadata_cache: Dict[type, Tuple[StoredToolMetadata, ...]] = {}
+    _tool_metadata_cache_lock = threading.Lock()
+
+    @classmethod
+    def discover_tools(cls, tool_provider_type: type) -> Tuple[StoredToolMetadata, ...]:
+        """
+        Returns the metadata of every @Tool method of a tool provider class.
+
+        The class is scanned once; later calls return the cached result.
+
+        Args:
+            tool_provider_type: The tool provider class
+
+        Returns:
+            The tool metadata, in attribute name order
+        """
+        cached = cls._tool_metadata_cache.get(tool_provider_type)
+        if cached is not None:
+            return cached
+
+        discovered = []
+        for attr_name in dir(tool_provider_type):
+            # Inspect the class attribute so properties are not evaluated
+            attr = inspect.getattr_static(tool_provider_type, attr_name, None)
+            if isinstance(attr, (staticmethod, classmethod)):
+                attr = attr.__func__
+            tool_metadata = getattr(attr, TOOL_METADATA_KEY, None)
+            if isinstance(tool_metadata, StoredToolMetadata):
+                discovered.append(tool_metadata)
+
+        with cls._tool_metadata_cache_lock:
+            return cls._tool_metadata_cache.setdefault(tool_provider_type, tuple(discovered))
+
+    def uses_result_cursors(self) -> bool:
+        """
+        Checks if any tool of the plugin can truncate its results, in which case the
+        get_more_results tool is needed to page through them.
+
+        Returns:
+            True if a tool declares max_items or max_bytes result options
+        """
+        for tool_provider in self.tool_providers:
+            for tool_metadata in self.discover_tools(type(tool_provider)):
+                result_options = tool_metadata.result or {}
+                if "max_items" in result_options or "max_bytes" in result_options:
+                    return True
+        return False
+
+    def use_http_pool(self, http_pool: HTTPSessionPool) -> None:
+        """
+        Sets the HTTP session pool used by the plugin and its tool providers.
+
+        Tool providers opt in by declaring an `http_pool` attribute; it is replaced with
+        the plugin's pool so every request made by the plugin reuses its connections.
+
+        Args:
+            http_pool: The HTTP session pool to use
+        """
+        self.http_pool = http_pool
+        for tool_provider in self.tool_providers:
+            if hasattr(tool_provider, "http_pool"):
+                tool_provider.http_pool = http_pool  # type: ignore
 
     @abstractmethod
     def supports_chain(self, chain: Chain) -> bool:
@@ -54,6 +152,46 @@ class PluginBase(Generic[TWalletClient], ABC):
         """
         Retrieves the tools provided by the plugin.
 
+        Tools are built once per wallet client and reused on later calls, as long as the
+        plugin's tool providers are unchanged.
+
+        Args:
+            wallet_client: The wallet client to use for tool execution
+
+        Returns:
+            An array of tools
+        """
+        providers = tuple(self.tool_providers)
+        cache: Optional["weakref.WeakKeyDictionary[PluginBase, Tuple[Tuple[object, ...], List[ToolBase]]]"] = (
+            getattr(wallet_client, WALLET_TOOL_CACHE_ATTR, None)
+        )
+        if cache is not None:
+            cached = cache.get(self)
+            if cached is not None and len(cached[0]) == len(providers) and all(
+                cached_provider is provider for cached_provider, provider in zip(cached[0], providers)
+            ):
+                return list(cached[1])
+
+        tools = self._create_tools(wallet_client)
+
+        if cache is None:
+            cache = weakref.WeakKeyDictionary()
+            try:
+                setattr(wallet_client, WALLET_TOOL_CACHE_ATTR, cache)
+            except AttributeError:
+                # Wallet clients without a __dict__ rebuild their tools on every call
+                return tools
+        cache[self] = (providers, tools)
+        return list(tools)
+
+    def _create_tools(self, wallet_client: TWalletClient) -> List[ToolBase]:
+        """
+        Builds the tools of every tool provider, bound to a wallet client.
+
+        The tools execute through a shallow copy of the plugin, which shares its providers,
+        caches and rate limiter. Tools cached on the wallet therefore do not keep the plugin
+        alive, while tools still in use keep working after the plugin itself is dropped.
+
         Args:
             wallet_client: The wallet client to use for tool execution
 
@@ -61,30 +199,85 @@ class PluginBase(Generic[TWalletClient], ABC):
             An array of tools
         """
         tools: List[ToolBase] = []
+        runner = copy.copy(self)
 
         for tool_provider in self.tool_providers:
-            # Get all methods of the tool provider instance
-            for attr_name in dir(tool_provider):
-                attr = getattr(tool_provider, attr_name)
-                # Check if the method has tool metadata
-                tool_metadata = getattr(attr, TOOL_METADATA_KEY, None)
-
-                if tool_metadata:
-                    tools.append(
-                        create_tool(
-                            {
-                                "name": tool_metadata.name,
-                                "description": tool_metadata.description,
-                                "parameters": tool_metadata.parameters["schema"],
-                            },
-                            lambda params, tool=tool_metadata: self._execute_tool(
-                                tool, tool_provider, wallet_client, params
-                            ),
-                        )
+            for tool_metadata in self.discover_tools(type(tool_provider)):
+                tools.append(
+                    create_tool(
+                        {
+                            "name": tool_metadata.name,
+                            "description": tool_metadata.description,
+                            "parameters": tool_metadata.parameters["schema"],
+                        },
+                        lambda params, tool=tool_metadata, provider=tool_provider: runner._execute_tool(
+                            tool, provider, wallet_client, params
+                        ),
+                        lambda params, tool=tool_metadata, provider=tool_provider: runner._execute_tool_async(
+                            tool, provider, wallet_client, params
+                        ),
+                        plugin_name=self.name,
                     )
+                )
 
         return tools
 
+    def _build_tool_args(
+        self,
+        tool_metadata: StoredToolMetadata,
+        wallet_client: WalletClientBase,
+        params: Any,
+    ) -> List[Any]:
+        """
+        Helper method to place the wallet client and parameters at the positions the tool method expects.
+
+        Args:
+            tool_metadata: The tool metadata
+            wallet_client: The wallet client to use
+            params: The parameters for the tool
+
+        Returns:
+            The positional arguments for the tool method
+        """
+        wallet_client_index = tool_metadata.wallet_client.get("index", 0)
+        parameters_index = tool_metadata.parameters.get("index", 0)
+        args = [None] * max(wallet_client_index or 0, parameters_index)
+
+        if wallet_client_index is not None:
+            args[wallet_client_index - 1] = wallet_client  # type: ignore
+
+        if parameters_index is not None:
+            args[parameters_index - 1] = params
+
+        return args
+
+    def _tool_cache_key(
+        self,
+        tool_metadata: StoredToolMetadata,
+        wallet_client: WalletClientBase,
+        params: Any,
+    ) -> Tuple[str, str]:
+        """
+        Helper method to build the cache and single-flight namespace and key of a tool call.
+
+        Tools that receive the wallet client are keyed by its chain and address as well, since
+        their results depend on the wallet.
+
+        Args:
+            tool_metadata: The tool metadata
+            wallet_client: The wallet client to use
+            params: The validated parameters for the tool
+
+        Returns:
+            The (namespace, key) pair
+        """
+        key_fn = (tool_metadata.cache or {}).get("key")
+        parts: List[Any] = [key_fn(params) if key_fn is not None else params]
+        if tool_metadata.wallet_client.get("index") is not None:
+            chain = wallet_client.get_chain()
+            parts.append([chain["type"], chain.get("id"), wallet_client.get_address()])
+        return f"{self.name}:{tool_metadata.name}", json.dumps(parts, sort_keys=True, default=str)
+
     def _execute_tool(
         self,
         tool_metadata: StoredToolMetadata,
@@ -93,7 +286,31 @@ class PluginBase(Generic[TWalletClient], ABC):
         params: Any,
     ) -> Any:
         """
-        Helper method to execute a tool with the correct arguments.
+        Helper method to execute a tool and shape its result according to the tool's result options.
+
+        Args:
+            tool: The tool metadata
+            tool_provider: The instance providing the tool
+            wallet_client: The wallet client to use
+            params: The parameters for the tool
+
+        Returns:
+            The result of the tool execution
+        """
+        result = self._get_tool_result(tool_metadata, tool_provider, wallet_client, params)
+        if tool_metadata.result is None:
+            return result
+        return shape_result(result, tool_metadata.result, default_result_cursor_store())
+
+    async def _execute_tool_async(
+        self,
+        tool_metadata: StoredToolMetadata,
+        tool_provider: Any,
+        wallet_client: WalletClientBase,
+        params: Any,
+    ) -> Any:
+        """
+        Async variant of _execute_tool, used when the tool is called from an event loop.
 
         Args:
             tool: The tool metadata
@@ -104,57 +321,154 @@ class PluginBase(Generic[TWalletClient], ABC):
         Returns:
             The result of the tool execution
         """
+        result = await self._get_tool_result_async(tool_metadata, tool_provider, wallet_client, params)
+        if tool_metadata.result is None:
+            return result
+        return shape_result(result, tool_metadata.result, default_result_cursor_store())
+
+    def _get_tool_result(
+        self,
+        tool_metadata: StoredToolMetadata,
+        tool_provider: Any,
+        wallet_client: WalletClientBase,
+        params: Any,
+    ) -> Any:
+        """
+        Helper method to get the raw result of a tool, serving results of cacheable tools from the
+        tool cache and coalescing concurrent identical calls of single-flight tools.
 
-        def _run_coroutine_in_new_thread(coro):
-            """Run a coroutine in a new thread with its own event loop."""
-            result = None
-            exception = None
-            
-            def run_coro():
-                nonlocal result, exception
-                loop = asyncio.new_event_loop()
-                try:
-                    result = loop.run_until_complete(coro)
-                except Exception as e:
-                    exception = e
-                finally:
-                    loop.close()
-            
-            thread = threading.Thread(target=run_coro)
-            thread.start()
-            thread.join()
-            
-            if exception:
-                raise exception
+        Args:
+            tool: The tool metadata
+            tool_provider: The instance providing the tool
+            wallet_client: The wallet client to use
+            params: The parameters for the tool
+
+        Returns:
+            The raw result of the tool execution
+        """
+        cache_options = tool_metadata.cache
+        if cache_options is None and not tool_metadata.single_flight:
+            return self._call_tool(tool_metadata, tool_provider, wallet_client, params)
+
+        namespace, key = self._tool_cache_key(tool_metadata, wallet_client, params)
+        if cache_options is not None:
+            hit, cached = self.tool_cache.get(namespace, key)
+            if hit:
+                return cached
+
+        def call() -> Any:
+            result = self._call_tool(tool_metadata, tool_provider, wallet_client, params)
+            if cache_options is not None:
+                self.tool_cache.set(namespace, key, result, cache_options["ttl"], cache_options.get("max_entries"))
             return result
 
-        wallet_client_index = tool_metadata.wallet_client.get("index", 0)
-        parameters_index = tool_metadata.parameters.get("index", 0)
-        args = [None] * max(wallet_client_index or 0, parameters_index)
+        if tool_metadata.single_flight:
+            return self.single_flight.do((namespace, key), call)
+        return call()
 
-        if wallet_client_index is not None:
-            args[wallet_client_index - 1] = wallet_client  # type: ignore
+    async def _get_tool_result_async(
+        self,
+        tool_metadata: StoredToolMetadata,
+        tool_provider: Any,
+        wallet_client: WalletClientBase,
+        params: Any,
+    ) -> Any:
+        """
+        Async variant of _get_tool_result, used when the tool is called from an event loop.
 
-        if parameters_index is not None:
-            args[parameters_index - 1] = params
+        Args:
+            tool: The tool metadata
+            tool_provider: The instance providing the tool
+            wallet_client: The wallet client to use
+            params: The parameters for the tool
+
+        Returns:
+            The raw result of the tool execution
+        """
+        cache_options = tool_metadata.cache
+        if cache_options is None and not tool_metadata.single_flight:
+            return await self._call_tool_async(tool_metadata, tool_provider, wallet_client, params)
+
+        namespace, key = self._tool_cache_key(tool_metadata, wallet_client, params)
+        if cache_options is not None:
+            hit, cached = await self.tool_cache.get_async(namespace, key)
+            if hit:
+                return cached
+
+        async def call() -> Any:
+            result = await self._call_tool_async(tool_metadata, tool_provider, wallet_client, params)
+            if cache_options is not None:
+                await self.tool_cache.set_async(
+                    namespace, key, result, cache_options["ttl"], cache_options.get("max_entries")
+                )
+            return result
+
+        if tool_metadata.single_flight:
+            return await self.single_flight.do_async((namespace, key), call)
+        return await call()
+
+    def _call_tool(
+        self,
+        tool_metadata: StoredToolMetadata,
+        tool_provider: Any,
+        wallet_client: WalletClientBase,
+        params: Any,
+    ) -> Any:
+        """
+        Helper method to call a tool method with the correct arguments.
 
+        Args:
+            tool: The tool metadata
+            tool_provider: The instance providing the tool
+            wallet_client: The wallet client to use
+            params: The parameters for the tool
+
+        Returns:
+            The result of the tool execution
+        """
+        args = self._build_tool_args(tool_metadata, wallet_client, params)
         method = getattr(tool_provider, tool_metadata.target.__name__)
-        result = method(*args)
+        with use_rate_limiter(self.rate_limiter):
+            result = method(*args)
 
-        # Handle coroutine results in three cases:
-        # 1. If there's an existing event loop and it's not running: use it directly with run_until_complete
-        # 2. If there's an existing event loop and it's running: create a new thread with its own event loop to avoid deadlock
-        # 3. If there's no event loop: create a new one and use it, then set it as the current event loop to be reused
-        if inspect.iscoroutine(result):
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    return _run_coroutine_in_new_thread(result)
-                else:
-                    return loop.run_until_complete(result)
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                return loop.run_until_complete(result)
-
-        return result
+            # Blocking callers get coroutine results run to completion; callers that are
+            # already inside an event loop should go through _execute_tool_async instead.
+            if inspect.iscoroutine(result):
+                return run_sync(result, cleanup=self.http_pool.release)
+
+            return result
+
+    async def _call_tool_async(
+        self,
+        tool_metadata: StoredToolMetadata,
+        tool_provider: Any,
+        wallet_client: WalletClientBase,
+        params: Any,
+    ) -> Any:
+        """
+        Helper method to call a tool method on the caller's event loop.
+
+        Coroutine tools are awaited directly. Synchronous tools (e.g. ones that block on
+        wallet RPC calls) are run in a worker thread so they do not stall the loop.
+
+        Args:
+            tool: The tool metadata
+            tool_provider: The instance providing the tool
+            wallet_client: The wallet client to use
+            params: The parameters for the tool
+
+        Returns:
+            The result of the tool execution
+        """
+        args = self._build_tool_args(tool_metadata, wallet_client, params)
+        method = getattr(tool_provider, tool_metadata.target.__name__)
+
+        with use_rate_limiter(self.rate_limiter):
+            if inspect.iscoroutinefunction(method):
+                return await method(*args)
+
+            result = await asyncio.to_thread(method, *args)
+            if inspect.iscoroutine(result):
+                return await result
+
+            return result
@@ -0,0 +1,343 @@
+import asyncio
+import contextvars
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Hashable, Iterator, Optional
+
+if TYPE_CHECKING:
+    import aiohttp
+
+# Shortest sleep between two scheduling attempts of the request at the head of a queue, in seconds
+_MIN_DELAY = 0.001
+
+
+@dataclass
+class RateLimit:
+    """
+    Token bucket settings for one upstream host
+
+    Attributes:
+        requests_per_second: Sustained request rate
+        burst: Number of requests that may be sent back to back after an idle period
+    """
+
+    requests_per_second: float
+    burst: int = 1
+
+    @classmethod
+    def per_minute(cls, requests: float, burst: int = 1) -> "RateLimit":
+        """
+        Creates a RateLimit from a per-minute quota, the unit most API plans are sold in
+
+        Args:
+            requests: Requests allowed per minute
+            burst: Number of requests that may be sent back to back
+        """
+        return cls(requests_per_second=requests / 60, burst=burst)
+
+
+class _Ticket:
+    # A queued request. Only the request at the head of its host's queue polls the bucket; the
+    # others wait on `waker`, which is resolved when they reach the head
+    __slots__ = ("loop", "waker")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.waker: Optional["asyncio.Future[None]"] = None
+
+    def wake(self) -> None:
+        waker = self.waker
+        if waker is None:
+            return
+        self.waker = None
+        try:
+            # The limiter may be shared between threads, each running its own loop
+            self.loop.call_soon_threadsafe(_resolve, waker)
+        except RuntimeError:
+            # The waiting loop is closed, so there is no one left to wake
+            pass
+
+
+def _resolve(waker: "asyncio.Future[None]") -> None:
+    if not waker.done():
+        waker.set_result(None)
+
+
+class _HostBucket:
+    def __init__(self, limit: Optional[RateLimit], now: float):
+        self.limit = limit
+        self.tokens = float(limit.burst) if limit is not None else 0.0
+        self.updated_at = now
+        self.blocked_until = 0.0
+        # Queued requests per tenant; tenants are served round-robin in insertion order
+        self.queues: "OrderedDict[Hashable, Deque[_Ticket]]" = OrderedDict()
+
+    def enqueue(self, tenant: Hashable, ticket: _Ticket) -> None:
+        queue = self.queues.get(tenant)
+        if queue is None:
+            queue = self.queues[tenant] = deque()
+        queue.append(ticket)
+
+    def remove(self, tenant: Hashable, ticket: _Ticket) -> None:
+        queue = self.queues.get(tenant)
+        if queue is None:
+            return
+        was_head = self.head() is ticket
+        try:
+            queue.remove(ticket)
+        except ValueError:
+            return
+        if not queue:
+            del self.queues[tenant]
+        if was_head:
+            self.wake_head()
+
+    def head(self) -> Optional[_Ticket]:
+        if not self.queues:
+            return None
+        return next(iter(self.queues.values()))[0]
+
+    def wake_head(self) -> None:
+        head = self.head()
+        if head is not None:
+            head.wake()
+
+    def try_acquire(self, tenant: Hashable, ticket: _Ticket, now: float) -> Optional[float]:
+        # Returns None when the ticket was granted, otherwise the delay before trying again:
+        # math.inf for tickets behind the head of the queue, which wait until they are woken
+        if self.limit is not None:
+            self.tokens = min(
+                float(self.limit.burst), self.tokens + (now - self.updated_at) * self.limit.requests_per_second
+            )
+        self.updated_at = now
+
+        head_tenant, head_queue = next(iter(self.queues.items()))
+        if head_tenant != tenant or head_queue[0] is not ticket:
+            return math.inf
+
+        if self.blocked_until > now:
+            return self.blocked_until - now
+
+        if self.limit is not None:
+            if self.tokens < 1:
+                return max(self._time_until_token(), _MIN_DELAY)
+            self.tokens -= 1
+
+        head_queue.popleft()
+        if head_queue:
+            # Let the other tenants go before this tenant's next request
+            self.queues.move_to_end(tenant)
+        else:
+            del self.queues[tenant]
+        self.wake_head()
+        return None
+
+    def _time_until_token(self) -> float:
+        if self.limit is None or self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.limit.requests_per_second
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter with one token bucket per upstream host
+
+    Requests that exceed the rate wait in a queue instead of failing. Only the request at the
+    head of a host's queue waits for the bucket to refill; the others sleep until they reach the
+    head, so a long queue costs no extra wakeups. Queued requests of different tenants (see
+    `rate_limit_tenant`) are served round-robin, so one busy tenant cannot starve the others.
+    When an upstream answers 429, the host is paused for the duration of its Retry-After header.
+
+    A limiter can be shared between plugin instances so they draw from the same quota.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, RateLimit]] = None,
+        default: Optional[RateLimit] = None,
+        default_retry_after: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Creates a new RateLimiter
+
+        Args:
+            limits: Rate limits keyed by host name, e.g. {"api.coingecko.com": RateLimit.per_minute(30)}
+            default: Rate limit for hosts missing from `limits`. When omitted, those hosts are only
+                paused after a 429 response
+            default_retry_after: Seconds a host is paused after a 429 response without Retry-After
+            clock: Monotonic time source, in seconds
+        """
+        self.limits = {host.lower(): limit for host, limit in (limits or {}).items()}
+        self.default = default
+        self.default_retry_after = default_retry_after
+        self.clock = clock
+        self._buckets: Dict[str, _HostBucket] = {}
+        self._lock = threading.Lock()
+
+    async def acquire(self, host: str, tenant: Optional[Hashable] = None) -> None:
+        """
+        Waits until a request to a host may be sent
+
+        Args:
+            host: The upstream host name
+            tenant: Tenant the request is made for. Defaults to the tenant of the current context
+        """
+        tenant = current_tenant() if tenant is None else tenant
+        loop = asyncio.get_running_loop()
+        ticket = _Ticket(loop)
+        with self._lock:
+            bucket = self._bucket(host)
+            bucket.enqueue(tenant, ticket)
+        granted = False
+        try:
+            while True:
+                waker = None
+                with self._lock:
+                    delay = bucket.try_acquire(tenant, ticket, self.clock())
+                    if delay == math.inf:
+                        # Registered under the lock, so the wakeup cannot be missed
+                        waker = ticket.waker = loop.create_future()
+                if delay is None:
+                    granted = True
+                    return
+                if waker is not None:
+                    await waker
+                else:
+                    await asyncio.sleep(max(delay, _MIN_DELAY))
+        finally:
+            if not granted:
+                with self._lock:
+                    bucket.remove(tenant, ticket)
+
+    def penalize(self, host: str, retry_after: Optional[float] = None) -> None:
+        """
+        Pauses requests to a host after it signalled that the rate limit was exceeded
+
+        Args:
+            host: The upstream host name
+            retry_after: Seconds to pause. Defaults to `default_retry_after`
+        """
+        delay = self.default_retry_after if retry_after is None else retry_after
+        with self._lock:
+            bucket = self._bucket(host)
+            bucket.blocked_until = max(bucket.blocked_until, self.clock() + delay)
+            bucket.tokens = 0.0
+
+    def _bucket(self, host: str) -> _HostBucket:
+        host = host.lower()
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _HostBucket(self.limits.get(host, self.default), self.clock())
+        return bucket
+
+
+_current_rate_limiter: contextvars.ContextVar[Optional[RateLimiter]] = contextvars.ContextVar(
+    "goat_current_rate_limiter", default=None
+)
+_current_tenant: contextvars.ContextVar[Hashable] = contextvars.ContextVar("goat_rate_limit_tenant", default=None)
+
+
+def current_rate_limiter() -> Optional[RateLimiter]:
+    """
+    Returns the rate limiter applied to HTTP requests made in the current context, if any
+    """
+    return _current_rate_limiter.get()
+
+
+@contextmanager
+def use_rate_limiter(rate_limiter: Optional[RateLimiter]) -> Iterator[None]:
+    """
+    Applies a rate limiter to the pooled HTTP requests made inside the block
+
+    Args:
+        rate_limiter: The limiter to apply, or None to disable limiting
+    """
+    token = _current_rate_limiter.set(rate_limiter)
+    try:
+        yield
+    finally:
+        _current_rate_limiter.reset(token)
+
+
+def current_tenant() -> Hashable:
+    """
+    Returns the tenant requests of the current context are attributed to
+    """
+    return _current_tenant.get()
+
+
+@contextmanager
+def rate_limit_tenant(tenant: Hashable) -> Iterator[None]:
+    """
+    Attributes the requests made inside the block to a tenant (e.g. an agent session or end user)
+    so rate-limited hosts are shared fairly between tenants
+
+    Args:
+        tenant: Identifies the tenant
+    """
+    token = _current_tenant.set(tenant)
+    try:
+        yield
+    finally:
+        _current_tenant.reset(token)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a Retry-After header given in seconds or as an HTTP date
+
+    Args:
+        value: The header value
+
+    Returns:
+        The delay in seconds, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def create_rate_limit_trace_config() -> "aiohttp.TraceConfig":
+    """
+    Returns an aiohttp TraceConfig applying the current rate limiter to a session's requests
+
+    Requests wait for the limiter before they are sent, and 429 responses pause their host.
+
+    Returns:
+        A TraceConfig to pass to aiohttp.ClientSession(trace_configs=[...])
+    """
+    import aiohttp
+
+    async def on_request_start(session: Any, context: Any, params: Any) -> None:
+        rate_limiter = _current_rate_limiter.get()
+        if rate_limiter is not None and params.url.host:
+            await rate_limiter.acquire(params.url.host)
+
+    async def on_request_end(session: Any, context: Any, params: Any) -> None:
+        if params.response.status != 429:
+            return
+        rate_limiter = _current_rate_limiter.get()
+        if rate_limiter is not None and params.url.host:
+            rate_limiter.penalize(params.url.host, parse_retry_after(params.response.headers.get("Retry-After")))
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
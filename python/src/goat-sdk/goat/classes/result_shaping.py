@@ -0,0 +1,243 @@
+import json
+import secrets
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel, Field
+
+from goat.classes.tool_base import ToolBase, create_tool
+from goat.classes.tool_result_cache import InMemoryToolResultCache
+from goat.decorators.tool import ToolResultOptions
+
+GET_MORE_RESULTS_TOOL_NAME = "get_more_results"
+
+_CURSOR_NAMESPACE = "cursors"
+
+# Projection tree: field name (or "*" for every key) -> subtree. An empty subtree keeps the whole value
+_Projection = Dict[str, "_Projection"]
+
+
+def project(value: Any, fields: Sequence[str]) -> Any:
+    """
+    Keeps only the given fields of a JSON-like value
+
+    Args:
+        value: The value to project
+        fields: Dotted paths of the fields to keep, e.g. ["pairs.baseToken.symbol"]. Paths descend
+            into every element of lists, and a "*" segment matches every key of a mapping
+
+    Returns:
+        A projected copy of the value. Missing fields are skipped
+    """
+    tree: _Projection = {}
+    for field in fields:
+        node = tree
+        for segment in field.split("."):
+            node = node.setdefault(segment, {})
+    return _project(value, tree)
+
+
+def _project(value: Any, tree: _Projection) -> Any:
+    if not tree:
+        return value
+    if isinstance(value, list):
+        return [_project(item, tree) for item in value]
+    if isinstance(value, dict):
+        wildcard = tree.get("*")
+        return {
+            key: _project(item, tree.get(key, wildcard))  # type: ignore[arg-type]
+            for key, item in value.items()
+            if key in tree or wildcard is not None
+        }
+    return value
+
+
+def encoded_size(value: Any) -> int:
+    """
+    Returns the size of a value encoded as JSON, in bytes
+    """
+    return len(json.dumps(value, default=str).encode())
+
+
+class GetMoreResultsParameters(BaseModel):
+    cursor: str = Field(description="The next_cursor returned in the continuation of a previous tool result")
+
+
+class ResultCursorStore:
+    """
+    Keeps the remainder of truncated tool results so they can be fetched page by page
+
+    Entries expire after a TTL, and the least recently used ones are dropped once the store is full.
+    """
+
+    def __init__(self, ttl: float = 900, max_entries: int = 256):
+        """
+        Creates a new ResultCursorStore
+
+        Args:
+            ttl: Seconds a truncated result stays available
+            max_entries: Maximum number of truncated results kept
+        """
+        self.ttl = ttl
+        self._entries = InMemoryToolResultCache(max_entries=max_entries)
+        self._tool: Optional[ToolBase] = None
+
+    def save(self, items: List[Any], is_mapping: bool, page_size: int, max_bytes: Optional[int]) -> str:
+        """
+        Stores the full list of items of a truncated result
+
+        Args:
+            items: The items, or (key, value) pairs of a mapping
+            is_mapping: Whether the items came from a mapping and pages are returned as mappings
+            page_size: Items returned per page
+            max_bytes: Byte budget of a page, if any
+
+        Returns:
+            A token identifying the stored items
+        """
+        token = secrets.token_urlsafe(12)
+        self._entries.set(_CURSOR_NAMESPACE, token, (items, is_mapping, page_size, max_bytes), self.ttl)
+        return token
+
+    def next_page(self, parameters: dict) -> Dict[str, Any]:
+        """
+        Returns the page of items a cursor points to
+
+        Args:
+            parameters: {"cursor": ...} as returned in a result's continuation
+
+        Returns:
+            {"items": page} plus a "continuation" when more items remain
+        """
+        token, _, offset = parameters["cursor"].rpartition(":")
+        hit, entry = self._entries.get(_CURSOR_NAMESPACE, token)
+        if not hit or not offset.isdigit():
+            raise ValueError("Unknown or expired cursor. Call the original tool again to get a fresh result.")
+        items, is_mapping, page_size, max_bytes = entry
+        start = int(offset)
+
+        def wrap(page: List[Any]) -> Dict[str, Any]:
+            shaped: Dict[str, Any] = {"items": dict(page) if is_mapping else page}
+            end = start + len(page)
+            if end < len(items):
+                shaped["continuation"] = _continuation(len(items), start, end, f"{token}:{end}")
+            return shaped
+
+        return wrap(_fit_page(items[start : start + page_size], wrap, max_bytes))
+
+    def get_more_results_tool(self) -> ToolBase:
+        """
+        Returns the tool the LLM calls with a continuation cursor to get the next page of a result
+        """
+        if self._tool is None:
+            self._tool = create_tool(
+                {
+                    "name": GET_MORE_RESULTS_TOOL_NAME,
+                    "description": (
+                        "Get the next page of a truncated tool result, using the next_cursor from its continuation"
+                    ),
+                    "parameters": GetMoreResultsParameters,
+                },
+                self.next_page,
+            )
+        return self._tool
+
+
+def shape_result(result: Any, options: ToolResultOptions, cursors: ResultCursorStore) -> Any:
+    """
+    Applies a tool's result options: field projection, list paging and the byte budget
+
+    When a list (or mapping) is cut, the result gets a "continuation" with the total number of
+    items and a next_cursor for the get_more_results tool. A list result is wrapped as
+    {"items": [...], "continuation": {...}} in that case.
+
+    Args:
+        result: The raw tool result
+        options: The tool's result options
+        cursors: Store keeping the remainder of cut results
+
+    Returns:
+        The shaped result
+    """
+    fields = options.get("fields")
+    if fields:
+        result = project(result, fields)
+
+    max_items = options.get("max_items")
+    max_bytes = options.get("max_bytes")
+    path = options.get("items")
+    target = _get_path(result, path) if path else result
+    if isinstance(target, (list, dict)) and (max_items is not None or max_bytes is not None):
+        is_mapping = isinstance(target, dict)
+        items = list(target.items()) if is_mapping else target
+        # Stand-in cursor of the real cursor's length, so the byte budget accounts for the continuation
+        cursor_placeholder = "_" * 16
+
+        def wrap(page: List[Any], cursor: str = cursor_placeholder) -> Any:
+            if len(page) == len(items):
+                return result
+            value = dict(page) if is_mapping else page
+            shaped = _set_path(result, path, value) if path else {"items": value}
+            shaped["continuation"] = _continuation(len(items), 0, len(page), f"{cursor}:{len(page)}")
+            return shaped
+
+        page = _fit_page(items[: max_items or len(items)], wrap, max_bytes)
+        if len(page) < len(items):
+            result = wrap(page, cursors.save(items, is_mapping, max_items or len(page), max_bytes))
+
+    if max_bytes is not None:
+        size = encoded_size(result)
+        if size > max_bytes:
+            preview = json.dumps(result, default=str).encode()[:max_bytes].decode(errors="ignore")
+            return {"truncated": True, "size": size, "preview": preview}
+    return result
+
+
+def _fit_page(page: List[Any], wrap: Any, max_bytes: Optional[int]) -> List[Any]:
+    # Halves the page until it fits the byte budget, keeping at least one item
+    if max_bytes is None:
+        return page
+    while len(page) > 1 and encoded_size(wrap(page)) > max_bytes:
+        page = page[: len(page) // 2]
+    return page
+
+
+def _continuation(total: int, start: int, end: int, cursor: str) -> Dict[str, Any]:
+    return {
+        "total": total,
+        "offset": start,
+        "returned": end - start,
+        "next_cursor": cursor,
+        "hint": f"Call {GET_MORE_RESULTS_TOOL_NAME} with next_cursor to get more items",
+    }
+
+
+def _get_path(value: Any, path: str) -> Any:
+    for segment in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(segment)
+    return value
+
+
+def _set_path(value: Dict[str, Any], path: str, new: Any) -> Dict[str, Any]:
+    # Copies the dicts along the path, leaving the original (possibly cached) result untouched
+    head, _, rest = path.partition(".")
+    copy = dict(value)
+    copy[head] = _set_path(value[head], rest, new) if rest else new
+    return copy
+
+
+_default_store: Optional[ResultCursorStore] = None
+_default_store_lock = threading.Lock()
+
+
+def default_result_cursor_store() -> ResultCursorStore:
+    """
+    Returns the process-wide ResultCursorStore shared by all plugins and the get_more_results tool
+    """
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = ResultCursorStore()
+        return _default_store
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _SyncCall:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls so they share one execution and its result
+
+    The first caller for a key runs the call; callers arriving while it is in flight wait for
+    it and receive the same result or exception. Nothing is kept once the call completes.
+    Blocking callers are coalesced across threads. Async callers are coalesced per event loop,
+    since a task cannot be awaited from another loop.
+    """
+
+    def __init__(self):
+        self._sync_calls: Dict[Hashable, _SyncCall] = {}
+        self._async_calls: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Task]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Runs `fn` unless a call with the same key is already in flight, then returns its result
+
+        Args:
+            key: Identifies identical calls
+            fn: The call to run
+
+        Returns:
+            The result of the shared call
+        """
+        with self._lock:
+            call = self._sync_calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._sync_calls[key] = _SyncCall()
+
+        if not leader:
+            call.done.wait()  # type: ignore[union-attr]
+        else:
+            try:
+                call.result = fn()  # type: ignore[union-attr]
+            except BaseException as e:
+                call.error = e  # type: ignore[union-attr]
+            finally:
+                with self._lock:
+                    self._sync_calls.pop(key, None)
+                call.done.set()  # type: ignore[union-attr]
+
+        if call.error is not None:  # type: ignore[union-attr]
+            raise call.error  # type: ignore[union-attr]
+        return call.result  # type: ignore[union-attr]
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Async variant of `do` for callers on an event loop
+
+        The shared call runs as its own task, so cancelling one caller does not cancel it for
+        the others.
+
+        Args:
+            key: Identifies identical calls
+            fn: Coroutine function running the call
+
+        Returns:
+            The result of the shared call
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            calls = self._async_calls.get(loop)
+            if calls is None:
+                calls = self._async_calls[loop] = {}
+            task = calls.get(key)
+            if task is None:
+                task = calls[key] = loop.create_task(fn())
+                task.add_done_callback(lambda done: _forget(calls, key, done))
+        return await asyncio.shield(task)
+
+
+def _forget(calls: Dict[Hashable, asyncio.Task], key: Hashable, task: asyncio.Task) -> None:
+    if calls.get(key) is task:
+        del calls[key]
+    # Mark the exception as retrieved in case every waiter was cancelled
+    if not task.cancelled():
+        task.exception()
+
+
+_default_single_flight: Optional[SingleFlight] = None
+_default_single_flight_lock = threading.Lock()
+
+
+def default_single_flight() -> SingleFlight:
+    """
+    Returns the process-wide SingleFlight shared by all plugins
+    """
+    global _default_single_flight
+    with _default_single_flight_lock:
+        if _default_single_flight is None:
+            _default_single_flight = SingleFlight()
+        return _default_single_flight
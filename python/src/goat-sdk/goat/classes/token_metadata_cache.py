@@ -0,0 +1,148 @@
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+
+from goat.types.token import TokenMetadata
+
+TokenMetadataKey = Tuple[str, str]
+
+
+class TokenMetadataStore(ABC):
+    """
+    Storage backend for a TokenMetadataCache
+    """
+
+    @abstractmethod
+    def get(self, key: TokenMetadataKey) -> Optional[TokenMetadata]:
+        pass
+
+    @abstractmethod
+    def set(self, key: TokenMetadataKey, metadata: TokenMetadata) -> None:
+        pass
+
+
+class InMemoryTokenMetadataStore(TokenMetadataStore):
+    """
+    Keeps token metadata in a dictionary for the lifetime of the process
+    """
+
+    def __init__(self):
+        self._entries: Dict[TokenMetadataKey, TokenMetadata] = {}
+
+    def get(self, key: TokenMetadataKey) -> Optional[TokenMetadata]:
+        return self._entries.get(key)
+
+    def set(self, key: TokenMetadataKey, metadata: TokenMetadata) -> None:
+        self._entries[key] = metadata
+
+
+class JSONFileTokenMetadataStore(InMemoryTokenMetadataStore):
+    """
+    Keeps token metadata in memory and persists it to a JSON file so it survives restarts
+    """
+
+    def __init__(self, path: str):
+        """
+        Creates a store backed by a JSON file, loading existing entries
+
+        Args:
+            path: Path of the JSON file. It is created on the first write
+        """
+        super().__init__()
+        self.path = path
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                data = json.load(f)
+            for chain, tokens in data.items():
+                for address, metadata in tokens.items():
+                    self._entries[(chain, address)] = metadata
+
+    def set(self, key: TokenMetadataKey, metadata: TokenMetadata) -> None:
+        super().set(key, metadata)
+        self._flush()
+
+    def _flush(self) -> None:
+        data: Dict[str, Dict[str, TokenMetadata]] = {}
+        for (chain, address), metadata in self._entries.items():
+            data.setdefault(chain, {})[address] = metadata
+
+        # Write to a temporary file first so a crash never leaves a truncated cache behind
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class TokenMetadataCache:
+    """
+    Cache of token name, symbol and decimals keyed by (chain key, token address)
+
+    Token metadata never changes once a token is deployed, so entries never expire.
+    Chain keys are namespaced strings such as "evm:1" or "solana:mainnet". Addresses
+    are stored as given, so callers normalize them first (e.g. lowercase EVM addresses).
+    """
+
+    def __init__(self, store: Optional[TokenMetadataStore] = None):
+        """
+        Creates a new TokenMetadataCache
+
+        Args:
+            store: Storage backend. Defaults to an InMemoryTokenMetadataStore
+        """
+        self.store = store or InMemoryTokenMetadataStore()
+        self._lock = threading.Lock()
+
+    def get(self, chain: str, address: str) -> Optional[TokenMetadata]:
+        """
+        Returns the cached metadata of a token, if any
+
+        Args:
+            chain: Chain key, e.g. "evm:1"
+            address: Normalized token address
+
+        Returns:
+            A copy of the cached metadata, or None
+        """
+        with self._lock:
+            metadata = self.store.get((chain, address))
+        return None if metadata is None else TokenMetadata(**metadata)
+
+    def update(self, chain: str, address: str, metadata: TokenMetadata) -> TokenMetadata:
+        """
+        Merges metadata fields into the cached entry of a token
+
+        Args:
+            chain: Chain key, e.g. "evm:1"
+            address: Normalized token address
+            metadata: Fields to store
+
+        Returns:
+            The merged metadata
+        """
+        with self._lock:
+            merged = TokenMetadata(**{**(self.store.get((chain, address)) or {}), **metadata})
+            self.store.set((chain, address), merged)
+        return TokenMetadata(**merged)
+
+
+_default_cache: Optional[TokenMetadataCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def default_token_metadata_cache() -> TokenMetadataCache:
+    """
+    Returns the process-wide TokenMetadataCache shared by wallet clients that are not given one
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = TokenMetadataCache()
+        return _default_cache
@@ -0,0 +1,144 @@
+import csv
+import json
+import threading
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, TypedDict
+
+
+class RegisteredToken(TypedDict):
+    """Token deployment registered in a TokenRegistry
+
+    Args:
+        chain: Chain key the token is deployed on (e.g. an EVM chain id or a Solana network)
+        address: Contract or mint address on that chain
+        symbol: Token symbol
+        name: Token name
+        decimals: Number of decimals
+    """
+    chain: Hashable
+    address: str
+    symbol: str
+    name: str
+    decimals: int
+
+
+class TokenRegistry:
+    """
+    Token deployments indexed by (chain, ticker), (chain, address) and chain
+
+    Lookups are dictionary hits instead of scans over the configured token list. When
+    several deployments share a ticker on one chain, the first one registered wins, which
+    matches the previous first-match behaviour of the wallet clients. Registries are meant
+    to be built once and shared between wallet instances.
+    """
+
+    def __init__(self, tokens: Iterable[RegisteredToken] = (), case_sensitive_addresses: bool = True):
+        """
+        Creates a new TokenRegistry
+
+        Args:
+            tokens: Initial token deployments
+            case_sensitive_addresses: Set to False for chains with case-insensitive addresses (e.g. EVM)
+        """
+        self.case_sensitive_addresses = case_sensitive_addresses
+        self._by_ticker: Dict[Tuple[Hashable, str], RegisteredToken] = {}
+        self._by_address: Dict[Tuple[Hashable, str], RegisteredToken] = {}
+        self._by_chain: Dict[Hashable, List[RegisteredToken]] = {}
+        self._tickers: Dict[str, List[Hashable]] = {}
+        self._lock = threading.Lock()
+        self.add_many(tokens)
+
+    def add(self, token: RegisteredToken) -> None:
+        """
+        Registers a token deployment
+
+        Args:
+            token: The deployment to register
+        """
+        self.add_many([token])
+
+    def add_many(self, tokens: Iterable[RegisteredToken]) -> None:
+        """
+        Registers several token deployments at once
+
+        Args:
+            tokens: The deployments to register
+        """
+        with self._lock:
+            for token in tokens:
+                chain = token["chain"]
+                ticker = token["symbol"].upper()
+                self._by_ticker.setdefault((chain, ticker), token)
+                self._by_address.setdefault((chain, self._normalize(token["address"])), token)
+                self._by_chain.setdefault(chain, []).append(token)
+                chains = self._tickers.setdefault(ticker, [])
+                if chain not in chains:
+                    chains.append(chain)
+
+    def get_by_ticker(self, chain: Hashable, ticker: str) -> Optional[RegisteredToken]:
+        """
+        Returns the deployment of a ticker on a chain, case-insensitively
+        """
+        return self._by_ticker.get((chain, ticker.upper()))
+
+    def get_by_address(self, chain: Hashable, address: str) -> Optional[RegisteredToken]:
+        """
+        Returns the deployment at an address on a chain
+        """
+        return self._by_address.get((chain, self._normalize(address)))
+
+    def get_chains_for_ticker(self, ticker: str) -> List[Hashable]:
+        """
+        Returns the chains a ticker is registered on, in registration order
+        """
+        return list(self._tickers.get(ticker.upper(), []))
+
+    def get_tokens_for_chain(self, chain: Hashable) -> List[RegisteredToken]:
+        """
+        Returns every deployment registered on a chain
+        """
+        return list(self._by_chain.get(chain, []))
+
+    def load_json(self, path: str) -> None:
+        """
+        Registers deployments from a JSON file
+
+        The file holds a list of objects with "chain", "address", "symbol", "name" and "decimals" keys.
+
+        Args:
+            path: Path of the JSON file
+        """
+        with open(path, "r") as f:
+            records = json.load(f)
+        self.add_many(_to_registered_token(record) for record in records)
+
+    def load_csv(self, path: str) -> None:
+        """
+        Registers deployments from a CSV file
+
+        The file has a header row with "chain", "address", "symbol", "name" and "decimals" columns.
+        Numeric chain values are loaded as integers.
+
+        Args:
+            path: Path of the CSV file
+        """
+        with open(path, "r", newline="") as f:
+            self.add_many(_to_registered_token(record) for record in csv.DictReader(f))
+
+    def __len__(self) -> int:
+        return sum(len(tokens) for tokens in self._by_chain.values())
+
+    def _normalize(self, address: str) -> str:
+        return address if self.case_sensitive_addresses else address.lower()
+
+
+def _to_registered_token(record: Dict) -> RegisteredToken:
+    chain = record["chain"]
+    if isinstance(chain, str) and chain.isdigit():
+        chain = int(chain)
+    return {
+        "chain": chain,
+        "address": record["address"],
+        "symbol": record["symbol"],
+        "name": record["name"],
+        "decimals": int(record["decimals"]),
+    }
@@ -1,16 +1,39 @@
+import asyncio
+import inspect
+import time
 from abc import ABC, abstractmethod
 from typing import (
     Any,
+    Awaitable,
     Callable,
+    Dict,
     Generic,
+    Literal,
+    Optional,
+    Tuple,
     Type,
     TypeVar,
     TypedDict,
 )
 from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+from goat.classes.instrumentation import instrument_tool_call, instrumentation_enabled
+from goat.utils.run_sync import run_sync
 
 TResult = TypeVar("TResult")
 
+ValidationMode = Literal["full", "trusted"]
+"""
+How a tool checks its parameters before executing
+
+- "full": validate the parameters against the tool's Pydantic model (the default)
+- "trusted": the caller already validated the parameters against the same model, e.g. an
+  adapter whose framework enforces the model as its argument schema. Missing optional fields
+  are filled from the model's defaults and nested models are dumped to plain values, but the
+  parameters are not validated again.
+"""
+
 
 class ToolConfig(TypedDict):
     """
@@ -43,6 +66,8 @@ class ToolBase(Generic[TResult], ABC):
         parameters: The Pydantic model class defining the tool's parameters
     """
 
+    __slots__ = ("name", "description", "parameters", "__weakref__")
+
     name: str
     description: str
     parameters: Type[BaseModel]
@@ -59,38 +84,240 @@ class ToolBase(Generic[TResult], ABC):
         self.description = config["description"]
         self.parameters = config["parameters"]
 
+    def validate_parameters(
+        self, parameters: dict[str, Any], validation_mode: ValidationMode = "full"
+    ) -> dict[str, Any]:
+        """
+        Converts raw tool parameters into the plain dictionary passed to the tool
+
+        Args:
+            parameters: The raw parameters
+            validation_mode: "full" to validate against the tool's Pydantic model, or "trusted" when
+                the caller already validated them against the same model
+
+        Returns:
+            The parameters as a dictionary with defaults applied
+        """
+        if validation_mode == "trusted":
+            prepared = _prepare_trusted_parameters(self.parameters, parameters)
+            if prepared is not None:
+                return prepared
+        elif validation_mode != "full":
+            raise ValueError(f"Unknown validation mode: {validation_mode}")
+        return self.parameters.model_validate(parameters).model_dump()
+
+    def json_schema(self) -> dict[str, Any]:
+        """
+        Returns the JSON schema of the tool's parameters
+
+        The schema is generated once per parameters model and shared by every tool using that
+        model, so it must be treated as read-only. Copy it (e.g. with `copy.deepcopy`) before
+        adapting it for a framework.
+
+        Returns:
+            The JSON schema of the parameters model
+        """
+        return get_json_schema(self.parameters)
+
     @abstractmethod
-    def execute(self, parameters: dict[str, Any]) -> TResult:
+    def execute(self, parameters: dict[str, Any], validation_mode: ValidationMode = "full") -> TResult:
         """
         Executes the tool with the provided parameters
 
         Args:
             parameters: The parameters for the tool execution, validated against the tool's Pydantic model
+            validation_mode: How the parameters are validated, see `ValidationMode`
 
         Returns:
             The result of the tool execution
         """
         pass
 
+    async def execute_async(self, parameters: dict[str, Any], validation_mode: ValidationMode = "full") -> TResult:
+        """
+        Executes the tool from within a running event loop
+
+        The default implementation runs `execute` in a worker thread so blocking tools
+        do not stall the loop. Tools backed by coroutines override this to await them
+        directly on the caller's loop.
+
+        Args:
+            parameters: The parameters for the tool execution, validated against the tool's Pydantic model
+            validation_mode: How the parameters are validated, see `ValidationMode`
+
+        Returns:
+            The result of the tool execution
+        """
+        return await asyncio.to_thread(self.execute, parameters, validation_mode)
+
+
+class FunctionTool(ToolBase[TResult]):
+    """
+    Tool that validates its parameters and delegates execution to plain callables
+
+    A single concrete class is shared by every tool built with `create_tool`, so creating a
+    tool only allocates a small slotted instance.
+    """
+
+    __slots__ = ("plugin_name", "_execute_fn", "_execute_async_fn")
+
+    def __init__(
+        self,
+        config: ToolConfig,
+        execute_fn: Callable[[dict[str, Any]], TResult],
+        execute_async_fn: Optional[Callable[[dict[str, Any]], Awaitable[TResult]]] = None,
+        plugin_name: Optional[str] = None,
+    ):
+        """
+        Creates a new FunctionTool instance
+
+        Args:
+            config: The configuration object for the tool containing name, description, and parameter model
+            execute_fn: The function to be called when the tool is executed
+            execute_async_fn: Optional coroutine function used by `execute_async`
+            plugin_name: Name of the plugin providing the tool, reported to instrumentation hooks
+        """
+        super().__init__(config)
+        if execute_async_fn is None and inspect.iscoroutinefunction(execute_fn):
+            execute_async_fn = execute_fn
+        self.plugin_name = plugin_name
+        self._execute_fn = execute_fn
+        self._execute_async_fn = execute_async_fn
+
+    def execute(self, parameters: dict[str, Any], validation_mode: ValidationMode = "full") -> TResult:
+        if not instrumentation_enabled():
+            # Validate parameters using the tool's schema before executing
+            return self._run(self.validate_parameters(parameters, validation_mode))
+
+        with instrument_tool_call(self.name, self.plugin_name) as event:
+            started = time.perf_counter()
+            try:
+                validated_params = self.validate_parameters(parameters, validation_mode)
+            finally:
+                validated = time.perf_counter()
+                event.validation_time = validated - started
+            try:
+                return self._run(validated_params)
+            finally:
+                event.execution_time = time.perf_counter() - validated
+
+    async def execute_async(self, parameters: dict[str, Any], validation_mode: ValidationMode = "full") -> TResult:
+        if not instrumentation_enabled():
+            return await self._run_async(self.validate_parameters(parameters, validation_mode))
+
+        with instrument_tool_call(self.name, self.plugin_name) as event:
+            started = time.perf_counter()
+            try:
+                validated_params = self.validate_parameters(parameters, validation_mode)
+            finally:
+                validated = time.perf_counter()
+                event.validation_time = validated - started
+            try:
+                return await self._run_async(validated_params)
+            finally:
+                event.execution_time = time.perf_counter() - validated
+
+    def _run(self, validated_params: dict[str, Any]) -> TResult:
+        result = self._execute_fn(validated_params)
+        if inspect.iscoroutine(result):
+            return run_sync(result)
+        return result
+
+    async def _run_async(self, validated_params: dict[str, Any]) -> TResult:
+        if self._execute_async_fn is not None:
+            return await self._execute_async_fn(validated_params)
+        result = await asyncio.to_thread(self._execute_fn, validated_params)
+        if inspect.iscoroutine(result):
+            return await result
+        return result
+
 
 def create_tool(
-    config: ToolConfig, execute_fn: Callable[[dict[str, Any]], TResult]
+    config: ToolConfig,
+    execute_fn: Callable[[dict[str, Any]], TResult],
+    execute_async_fn: Optional[Callable[[dict[str, Any]], Awaitable[TResult]]] = None,
+    plugin_name: Optional[str] = None,
 ) -> ToolBase[TResult]:
     """
     Creates a new Tool instance with the provided configuration and execution function
 
     Args:
         config: The configuration object for the tool containing name, description, and parameter model
-        execute_fn: The function to be called when the tool is executed
+        execute_fn: The function to be called when the tool is executed. If it returns a coroutine,
+            the coroutine is run to completion before returning.
+        execute_async_fn: Optional coroutine function used by `execute_async`. When omitted,
+            coroutine functions passed as `execute_fn` are awaited on the caller's loop and
+            plain functions are run in a worker thread.
+        plugin_name: Name of the plugin providing the tool, reported to instrumentation hooks
 
     Returns:
         A new Tool instance that validates parameters using the provided Pydantic model
     """
+    return FunctionTool(config, execute_fn, execute_async_fn, plugin_name)
+
+
+_json_schema_cache: Dict[Type[BaseModel], dict[str, Any]] = {}
+
+
+def get_json_schema(model: Type[BaseModel]) -> dict[str, Any]:
+    """
+    Returns the JSON schema of a parameters model, generated once per model
+
+    The returned schema is shared between callers and must be treated as read-only.
+
+    Args:
+        model: The Pydantic model class
+
+    Returns:
+        The model's JSON schema
+    """
+    schema = _json_schema_cache.get(model)
+    if schema is None:
+        schema = _json_schema_cache[model] = model.model_json_schema()
+    return schema
+
+
+_FieldDefaults = Tuple[Tuple[str, bool, Any, Optional[Callable[[], Any]]], ...]
+_field_defaults_cache: Dict[Type[BaseModel], _FieldDefaults] = {}
+
+
+def _get_field_defaults(model: Type[BaseModel]) -> _FieldDefaults:
+    # (name, required, default, default_factory) per field, computed once per model
+    defaults = _field_defaults_cache.get(model)
+    if defaults is None:
+        defaults = tuple(
+            (
+                name,
+                field.is_required(),
+                field.default,
+                field.default_factory if field.default is PydanticUndefined else None,
+            )
+            for name, field in model.model_fields.items()
+        )
+        _field_defaults_cache[model] = defaults
+    return defaults
+
+
+def _prepare_trusted_parameters(model: Type[BaseModel], parameters: dict[str, Any]) -> Optional[dict[str, Any]]:
+    # Returns None when a required field is missing, so the caller falls back to full validation
+    prepared: dict[str, Any] = {}
+    for name, required, default, default_factory in _get_field_defaults(model):
+        if name in parameters:
+            prepared[name] = _dump_value(parameters[name])
+        elif required:
+            return None
+        elif default_factory is not None:
+            prepared[name] = default_factory()  # type: ignore[call-arg]
+        else:
+            prepared[name] = _dump_value(default)
+    return prepared
 
-    class Tool(ToolBase):
-        def execute(self, parameters: dict[str, Any]) -> TResult:
-            # Validate parameters using the tool's schema before executing
-            validated_params = self.parameters.model_validate(parameters)
-            return execute_fn(validated_params.model_dump())
 
-    return Tool(config)
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, list):
+        return [_dump_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _dump_value(item) for key, item in value.items()}
+    return value
@@ -0,0 +1,178 @@
+import copy
+import math
+import re
+import threading
+import weakref
+from collections import Counter, OrderedDict
+from typing import Dict, List, Sequence, Tuple
+
+from goat.classes.tool_base import ToolBase
+
+_WORD = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+_STOP_WORDS = frozenset(
+    "a an and are as at be by for from get how i in is it me my of on or the this to what which with".split()
+)
+# Tool names carry more signal than the prose around them
+_NAME_WEIGHT = 3
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits text into lowercase search terms
+
+    snake_case and camelCase identifiers are split into words, stop words are dropped and
+    plurals are reduced to their singular (e.g. "getTokenPrices" -> ["token", "price"]).
+
+    Args:
+        text: The text to tokenize
+
+    Returns:
+        The search terms, in order
+    """
+    terms = []
+    for word in _WORD.findall(text):
+        word = word.lower()
+        if word in _STOP_WORDS:
+            continue
+        if len(word) > 4 and word.endswith("ies"):
+            word = word[:-3] + "y"
+        elif len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+
+def _tool_document(tool: ToolBase) -> List[str]:
+    parts = [tool.description]
+    for name, field in tool.json_schema().get("properties", {}).items():
+        parts.append(name)
+        parts.append(field.get("description", ""))
+    return tokenize(tool.name) * _NAME_WEIGHT + tokenize(" ".join(parts))
+
+
+class ToolIndex:
+    """
+    BM25 keyword index over tool names, descriptions and parameter docs
+
+    Used to send an LLM only the tools relevant to the current request instead of every tool
+    of every plugin. The index is built once from a tool list and works offline.
+    """
+
+    def __init__(self, tools: Sequence[ToolBase], k1: float = 1.5, b: float = 0.75):
+        """
+        Creates a new ToolIndex
+
+        Args:
+            tools: The tools to index
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+        """
+        self.tools = list(tools)
+        self.k1 = k1
+        self.b = b
+
+        documents = [_tool_document(tool) for tool in self.tools]
+        self._lengths = [len(document) for document in documents]
+        self._average_length = (sum(self._lengths) / len(documents)) if documents else 0.0
+        # term -> [(tool position, term frequency)]
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        for position, document in enumerate(documents):
+            for term, frequency in Counter(document).items():
+                self._postings.setdefault(term, []).append((position, frequency))
+
+        count = len(documents)
+        self._idf = {
+            term: math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.tools)
+
+    def scores(self, query: str) -> List[float]:
+        """
+        Scores every tool against a query
+
+        Args:
+            query: Free text, e.g. the user's latest message
+
+        Returns:
+            One BM25 score per tool, in index order. Tools sharing no term with the query score 0
+        """
+        scores = [0.0] * len(self.tools)
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            idf = self._idf[term]
+            for position, frequency in postings:
+                length_norm = 1 - self.b + self.b * self._lengths[position] / self._average_length
+                scores[position] += idf * frequency * (self.k1 + 1) / (frequency + self.k1 * length_norm)
+        return scores
+
+    def select_tools(self, query: str, k: int = 10) -> List[ToolBase]:
+        """
+        Returns the tools most relevant to a query
+
+        Args:
+            query: Free text, e.g. the user's latest message
+            k: Maximum number of tools to return
+
+        Returns:
+            Up to `k` tools, best match first. Ties keep the index order, so when few tools match
+            the query the list is filled up with the first indexed tools
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        scores = self.scores(query)
+        ranked = sorted(range(len(self.tools)), key=lambda position: -scores[position])
+        return [self.tools[position] for position in ranked[:k]]
+
+
+# id(tool) for each tool -> (weak references to the tools, index built over them with no tools attached).
+# Only the scoring data is cached so the cache never keeps tools (and the wallets and plugin state they
+# reference) alive; entries whose tools have been freed are dropped on the next miss.
+_index_cache: "OrderedDict[Tuple[int, ...], Tuple[Tuple[weakref.ref, ...], ToolIndex]]" = OrderedDict()
+_index_cache_lock = threading.Lock()
+_INDEX_CACHE_SIZE = 64
+
+
+def _with_tools(index: ToolIndex, tools: List[ToolBase]) -> ToolIndex:
+    # The scoring data is never mutated after construction, so copies can share it
+    bound = copy.copy(index)
+    bound.tools = tools
+    return bound
+
+
+def get_tool_index(tools: Sequence[ToolBase]) -> ToolIndex:
+    """
+    Returns a ToolIndex over a tool list, built once per distinct list of tools
+
+    Plugins reuse their tool instances per wallet, so repeated calls for the same wallet and
+    plugins (e.g. once per agent turn) share one index. The cache only references the tools
+    weakly and forgets an index once its tools are garbage collected.
+
+    Args:
+        tools: The tools to index
+
+    Returns:
+        The index
+    """
+    tools = list(tools)
+    key = tuple(id(tool) for tool in tools)
+    with _index_cache_lock:
+        entry = _index_cache.get(key)
+        # Ids can be reused once a tool is freed, so check the cached tools are the same objects
+        if entry is not None and all(ref() is tool for ref, tool in zip(entry[0], tools)):
+            _index_cache.move_to_end(key)
+            return _with_tools(entry[1], tools)
+
+    index = ToolIndex(tools)
+    refs = tuple(weakref.ref(tool) for tool in tools)
+    with _index_cache_lock:
+        for stale in [k for k, (rs, _) in _index_cache.items() if any(ref() is None for ref in rs)]:
+            del _index_cache[stale]
+        _index_cache[key] = (refs, _with_tools(index, []))
+        while len(_index_cache) > _INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    return index
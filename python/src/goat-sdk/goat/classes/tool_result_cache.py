@@ -0,0 +1,190 @@
+import asyncio
+import copy
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# (hit, value). A tuple instead of a sentinel so None results can be cached too
+CacheLookup = Tuple[bool, Any]
+
+
+class ToolResultCache(ABC):
+    """
+    Storage backend for cached tool results
+
+    Entries are grouped by namespace (one per plugin tool), so size limits apply per tool.
+    Backends hand out copies of the stored values, so a caller modifying a result cannot change
+    what later callers get.
+    """
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> CacheLookup:
+        """
+        Looks up a cached result
+
+        Args:
+            namespace: The tool the result belongs to
+            key: The cache key of the call
+
+        Returns:
+            (True, value) on a hit, (False, None) on a miss or an expired entry
+        """
+        pass
+
+    @abstractmethod
+    def set(self, namespace: str, key: str, value: Any, ttl: float, max_entries: Optional[int] = None) -> None:
+        """
+        Stores a result
+
+        Args:
+            namespace: The tool the result belongs to
+            key: The cache key of the call
+            value: The result to cache
+            ttl: Seconds the result stays valid
+            max_entries: Maximum number of entries kept for the namespace, if the backend supports it
+        """
+        pass
+
+    async def get_async(self, namespace: str, key: str) -> CacheLookup:
+        """Async variant of `get`. Backends doing network I/O override it"""
+        return self.get(namespace, key)
+
+    async def set_async(
+        self, namespace: str, key: str, value: Any, ttl: float, max_entries: Optional[int] = None
+    ) -> None:
+        """Async variant of `set`. Backends doing network I/O override it"""
+        self.set(namespace, key, value, ttl, max_entries)
+
+
+class InMemoryToolResultCache(ToolResultCache):
+    """
+    Per-process LRU cache with a time-to-live per entry
+
+    Values are deep-copied when stored and when returned. Results that cannot be copied are not
+    cached.
+    """
+
+    def __init__(self, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        """
+        Creates a new InMemoryToolResultCache
+
+        Args:
+            max_entries: Default maximum number of entries per namespace
+            clock: Monotonic time source, in seconds
+        """
+        self.max_entries = max_entries
+        self.clock = clock
+        self._namespaces: Dict[str, "OrderedDict[str, Tuple[float, Any]]"] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: str) -> CacheLookup:
+        with self._lock:
+            entries = self._namespaces.get(namespace)
+            entry = entries.get(key) if entries is not None else None
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= self.clock():
+                del entries[key]  # type: ignore[union-attr]
+                return False, None
+            entries.move_to_end(key)  # type: ignore[union-attr]
+        return True, copy.deepcopy(value)
+
+    def set(self, namespace: str, key: str, value: Any, ttl: float, max_entries: Optional[int] = None) -> None:
+        try:
+            value = copy.deepcopy(value)
+        except (TypeError, copy.Error):
+            return
+        limit = max_entries or self.max_entries
+        with self._lock:
+            entries = self._namespaces.setdefault(namespace, OrderedDict())
+            entries[key] = (self.clock() + ttl, value)
+            entries.move_to_end(key)
+            while len(entries) > limit:
+                entries.popitem(last=False)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """
+        Drops cached entries
+
+        Args:
+            namespace: Only drop the entries of this namespace. Drops everything when omitted
+        """
+        with self._lock:
+            if namespace is None:
+                self._namespaces.clear()
+            else:
+                self._namespaces.pop(namespace, None)
+
+
+class RedisToolResultCache(ToolResultCache):
+    """
+    Cache shared between processes through Redis
+
+    Results are stored as JSON with a Redis expiry; results that cannot be serialized to JSON
+    are not cached. Redis enforces the TTL, so `max_entries` is not applied.
+    """
+
+    def __init__(self, client: Any = None, url: Optional[str] = None, prefix: str = "goat:tool:"):
+        """
+        Creates a new RedisToolResultCache
+
+        Args:
+            client: A redis.Redis client. Created from `url` when omitted
+            url: Redis URL, e.g. "redis://localhost:6379/0", used when no client is given
+            prefix: Prefix of every key written by the cache
+        """
+        if client is None:
+            if url is None:
+                raise ValueError("RedisToolResultCache requires a client or a url")
+            try:
+                import redis
+            except ImportError as e:
+                raise ImportError(
+                    "RedisToolResultCache requires redis. Install it with `pip install goat-sdk[redis]`."
+                ) from e
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, namespace: str, key: str) -> CacheLookup:
+        raw = self.client.get(self._key(namespace, key))
+        if raw is None:
+            return False, None
+        return True, json.loads(raw)
+
+    def set(self, namespace: str, key: str, value: Any, ttl: float, max_entries: Optional[int] = None) -> None:
+        try:
+            raw = json.dumps(value)
+        except (TypeError, ValueError):
+            return
+        self.client.set(self._key(namespace, key), raw, px=max(1, int(ttl * 1000)))
+
+    async def get_async(self, namespace: str, key: str) -> CacheLookup:
+        return await asyncio.to_thread(self.get, namespace, key)
+
+    async def set_async(
+        self, namespace: str, key: str, value: Any, ttl: float, max_entries: Optional[int] = None
+    ) -> None:
+        await asyncio.to_thread(self.set, namespace, key, value, ttl, max_entries)
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}{namespace}:{key}"
+
+
+_default_cache: Optional[ToolResultCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def default_tool_result_cache() -> ToolResultCache:
+    """
+    Returns the process-wide ToolResultCache used by plugins that are not given one explicitly
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = InMemoryToolResultCache()
+        return _default_cache
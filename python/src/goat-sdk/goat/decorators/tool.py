@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Callable, Type, TypedDict
+from typing import Any, Callable, List, Optional, Type, TypedDict
 from typing_extensions import NotRequired
 import inspect
 from pydantic import BaseModel
@@ -8,6 +8,45 @@ from goat.classes.wallet_client_base import WalletClientBase
 from goat.utils.snake_case import snake_case
 
 
+class ToolCacheOptions(TypedDict):
+    """
+    Result caching options for a tool
+
+    Attributes:
+        ttl: Seconds a cached result stays valid
+        read_only: Must be True. Declares that the tool has no side effects, so a cached result
+            can stand in for a call
+        max_entries: Optional maximum number of cached results kept for the tool
+        key: Optional function mapping the validated parameters to the JSON-serializable part that
+            identifies a call. Defaults to all parameters
+    """
+
+    ttl: float
+    read_only: bool
+    max_entries: NotRequired[int]
+    key: NotRequired[Callable[[dict[str, Any]], Any]]
+
+
+class ToolResultOptions(TypedDict):
+    """
+    Shaping options for a tool's result, applied before the result is returned to the caller
+
+    Attributes:
+        fields: Optional dotted paths of the fields to keep, e.g. ["pairs.priceUsd", "pairs.baseToken.symbol"].
+            Paths descend into every element of lists and "*" matches every key of a mapping
+        items: Optional dotted path of the list (or mapping) to page through. Defaults to the result itself
+        max_items: Optional maximum number of items returned at once. The rest can be fetched with the
+            get_more_results tool, using the continuation cursor added to the result
+        max_bytes: Optional budget for the JSON-encoded result. Pages are shrunk to fit it, and results
+            that still exceed it are replaced by a truncated preview
+    """
+
+    fields: NotRequired[List[str]]
+    items: NotRequired[str]
+    max_items: NotRequired[int]
+    max_bytes: NotRequired[int]
+
+
 class ToolDecoratorParams(TypedDict):
     """
     Configuration parameters for the Tool decorator
@@ -16,11 +55,18 @@ class ToolDecoratorParams(TypedDict):
         name: Optional custom name for the tool. Defaults to the method name in snake_case
         description: A description of what the tool does
         parameters_schema: A Pydantic model class defining the tool's parameters
+        cache: Optional result caching options for read-only tools
+        single_flight: Whether concurrent calls with the same parameters share one execution.
+            Only for tools without side effects. Defaults to False
+        result: Optional projection, paging and size limits for large results
     """
 
     name: NotRequired[str]
     description: str
     parameters_schema: Type[BaseModel]
+    cache: NotRequired[ToolCacheOptions]
+    single_flight: NotRequired[bool]
+    result: NotRequired[ToolResultOptions]
 
 
 class ParameterMetadata(TypedDict):
@@ -58,6 +104,9 @@ class StoredToolMetadata:
         target: The decorated method
         parameters: Metadata about the tool's parameters
         wallet_client: Metadata about the tool's wallet client parameter
+        cache: Result caching options, or None if results are not cached
+        single_flight: Whether concurrent identical calls share one execution
+        result: Result shaping options, or None if results are returned as is
     """
 
     name: str
@@ -65,6 +114,9 @@ class StoredToolMetadata:
     target: Callable
     parameters: ParameterMetadata
     wallet_client: WalletClientMetadata
+    cache: Optional[ToolCacheOptions] = None
+    single_flight: bool = False
+    result: Optional[ToolResultOptions] = None
 
 
 TOOL_METADATA_KEY = "__goat_tool__"
@@ -83,6 +135,9 @@ def Tool(tool_params: ToolDecoratorParams) -> Any:
             - description (str): A description of what the tool does
             - name (str, optional): Custom name for the tool. Defaults to the method name in snake_case
             - parameters_schema (Type[BaseModel]): A Pydantic model class to validate parameters at runtime
+            - cache (ToolCacheOptions, optional): Cache results of a read-only tool for a TTL
+            - single_flight (bool, optional): Share one execution between concurrent identical calls
+            - result (ToolResultOptions, optional): Project, page and size-limit the tool's results
 
     Returns:
         A decorated method that includes parameter validation and tool metadata
@@ -105,6 +160,12 @@ def Tool(tool_params: ToolDecoratorParams) -> Any:
     def decorator(func):
         # Get validated parameters from method signature
         parameters_indexes = validate_decorator_parameters(func)
+        cache_options = tool_params.get("cache")
+        if cache_options is not None:
+            validate_cache_options(func, cache_options)
+        result_options = tool_params.get("result")
+        if result_options is not None:
+            validate_result_options(func, result_options)
 
         # Store metadata on the function
         tool_metadata = StoredToolMetadata(
@@ -116,6 +177,9 @@ def Tool(tool_params: ToolDecoratorParams) -> Any:
                 "schema": tool_params["parameters_schema"],
             },
             wallet_client={"index": parameters_indexes.get("wallet_client")},
+            cache=cache_options,
+            single_flight=tool_params.get("single_flight", False),
+            result=result_options,
         )
 
         # Store metadata directly on the function
@@ -181,3 +245,47 @@ def validate_decorator_parameters(method: Callable) -> dict[str, int]:
         result["wallet_client"] = wallet_client_index
 
     return result
+
+
+def validate_cache_options(method: Callable, cache_options: ToolCacheOptions) -> None:
+    """
+    Validates the cache options of a tool method.
+
+    Args:
+        method: The method being decorated
+        cache_options: The cache options passed to the decorator
+
+    Raises:
+        ValueError: If the options are invalid or the tool is not declared read-only
+    """
+    log_prefix = f"Method '{method.__name__}'"
+    if not cache_options.get("read_only"):
+        raise ValueError(
+            f"{log_prefix} enables caching without declaring read_only. "
+            "Only tools without side effects can have their results cached."
+        )
+    if cache_options.get("ttl", 0) <= 0:
+        raise ValueError(f"{log_prefix} has an invalid cache ttl. It must be a positive number of seconds.")
+    if cache_options.get("max_entries", 1) < 1:
+        raise ValueError(f"{log_prefix} has an invalid cache max_entries. It must be at least 1.")
+
+
+def validate_result_options(method: Callable, result_options: ToolResultOptions) -> None:
+    """
+    Validates the result shaping options of a tool method.
+
+    Args:
+        method: The method being decorated
+        result_options: The result options passed to the decorator
+
+    Raises:
+        ValueError: If the options are invalid
+    """
+    log_prefix = f"Method '{method.__name__}'"
+    fields = result_options.get("fields")
+    if fields is not None and (not fields or not all(isinstance(field, str) and field for field in fields)):
+        raise ValueError(f"{log_prefix} has invalid result fields. They must be non-empty dotted paths.")
+    if result_options.get("max_items", 1) < 1:
+        raise ValueError(f"{log_prefix} has an invalid result max_items. It must be at least 1.")
+    if result_options.get("max_bytes", 1) < 1:
+        raise ValueError(f"{log_prefix} has an invalid result max_bytes. It must be at least 1.")
@@ -3,4 +3,17 @@ from typing import TypedDict
 class Token(TypedDict):
     name: str
     symbol: str
-    decimals: int
\ No newline at end of file
+    decimals: int
+
+
+class TokenMetadata(TypedDict, total=False):
+    """Immutable on-chain token metadata; fields are only present once they are known
+
+    Args:
+        name: Token name
+        symbol: Token symbol
+        decimals: Number of decimals
+    """
+    name: str
+    symbol: str
+    decimals: int
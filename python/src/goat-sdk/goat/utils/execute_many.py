@@ -0,0 +1,88 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+from ..classes.http_session_pool import default_http_session_pool
+from ..classes.tool_base import ToolBase, ValidationMode
+from .run_sync import run_sync
+
+ToolCall = Tuple[ToolBase, dict[str, Any]]
+
+
+@dataclass
+class ToolCallResult:
+    """
+    Outcome of one call made through execute_many
+
+    Attributes:
+        tool_name: The name of the tool that was called
+        result: The value returned by the tool, or None if it raised
+        error: The exception raised by the tool, or None if it succeeded
+    """
+
+    tool_name: str
+    result: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """True when the call succeeded"""
+        return self.error is None
+
+
+async def execute_many_async(
+    calls: Sequence[ToolCall],
+    max_concurrency: int = 8,
+    validation_mode: ValidationMode = "full",
+) -> List[ToolCallResult]:
+    """
+    Runs independent tool calls concurrently on the running event loop
+
+    Coroutine tools are awaited on the loop and blocking tools (e.g. wallet RPC calls) run in
+    worker threads. At most `max_concurrency` calls are in flight at once, which also bounds
+    the number of worker threads in use.
+
+    Args:
+        calls: (tool, parameters) pairs
+        max_concurrency: Maximum number of calls running at the same time
+        validation_mode: How the parameters are validated, see `ValidationMode`
+
+    Returns:
+        One result per call, in the order of `calls`. A failing call is reported in its own
+        result and does not affect the others.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_call(tool: ToolBase, parameters: dict[str, Any]) -> ToolCallResult:
+        async with semaphore:
+            try:
+                return ToolCallResult(tool.name, result=await tool.execute_async(parameters, validation_mode))
+            except Exception as e:
+                return ToolCallResult(tool.name, error=e)
+
+    return list(await asyncio.gather(*(run_call(tool, parameters) for tool, parameters in calls)))
+
+
+def execute_many(
+    calls: Sequence[ToolCall],
+    max_concurrency: int = 8,
+    validation_mode: ValidationMode = "full",
+) -> List[ToolCallResult]:
+    """
+    Blocking variant of execute_many_async for callers without an event loop
+
+    Args:
+        calls: (tool, parameters) pairs
+        max_concurrency: Maximum number of calls running at the same time
+        validation_mode: How the parameters are validated, see `ValidationMode`
+
+    Returns:
+        One result per call, in the order of `calls`
+    """
+    return run_sync(
+        execute_many_async(calls, max_concurrency, validation_mode),
+        cleanup=default_http_session_pool().release,
+    )
@@ -1,18 +1,38 @@
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 from ..classes.plugin_base import PluginBase
+from ..classes.result_shaping import default_result_cursor_store
 from ..classes.tool_base import ToolBase
+from ..classes.tool_index import get_tool_index
 from ..classes.wallet_client_base import WalletClientBase
 
+# Attribute on wallet clients holding their core tools, so repeated get_tools calls reuse them
+CORE_TOOL_CACHE_ATTR = "_goat_core_tools"
+
 
 def get_tools(
-    wallet: WalletClientBase, plugins: Optional[List[PluginBase]] = None
+    wallet: WalletClientBase,
+    plugins: Optional[List[PluginBase]] = None,
+    query: Optional[str] = None,
+    k: int = 10,
 ) -> List[ToolBase]:
-    """Get all tools from the wallet and plugins."""
+    """Get all tools from the wallet and plugins.
+
+    When a plugin tool can truncate its results, the get_more_results tool is added so the LLM
+    can page through them.
+
+    Args:
+        wallet: A wallet client instance
+        plugins: List of plugin instances
+        query: When given, only the `k` tools most relevant to it are returned (see `ToolIndex`),
+            e.g. the user's latest message, to keep the tool list sent to the LLM short
+        k: Maximum number of tools returned for a query
+    """
     tools: List[ToolBase] = []
     plugins = plugins or []
 
     chain = wallet.get_chain()
-    core_tools = wallet.get_core_tools()
+    core_tools = _get_core_tools(wallet)
+    uses_result_cursors = False
 
     for plugin in plugins:
         if not plugin.supports_chain(chain):
@@ -24,5 +44,25 @@ def get_tools(
 
         plugin_tools = plugin.get_tools(wallet)
         tools.extend(plugin_tools)
+        uses_result_cursors = uses_result_cursors or plugin.uses_result_cursors()
+
+    selected = [*core_tools, *tools]
+    if query is not None:
+        selected = get_tool_index(selected).select_tools(query, k)
+    if uses_result_cursors:
+        # Kept out of the query selection: it is needed whenever a selected tool truncates its result
+        selected.append(default_result_cursor_store().get_more_results_tool())
+    return selected
+
 
-    return [*core_tools, *tools]
+def _get_core_tools(wallet: WalletClientBase) -> List[ToolBase]:
+    # Sending tools depend on enable_send, so a toggled wallet rebuilds its core tools
+    key = getattr(wallet, "enable_send", None)
+    cached: Optional[Tuple[Any, List[ToolBase]]] = getattr(wallet, CORE_TOOL_CACHE_ATTR, None)
+    if cached is None or cached[0] != key:
+        cached = (key, wallet.get_core_tools())
+        try:
+            setattr(wallet, CORE_TOOL_CACHE_ATTR, cached)
+        except AttributeError:
+            pass
+    return list(cached[1])
@@ -0,0 +1,63 @@
+import importlib
+import importlib.util
+import sys
+import types
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class _LazyPackage(types.ModuleType):
+    """
+    Module type of packages using `lazy_attributes`
+
+    Importing a submodule binds it on its package, which would shadow an export sharing the
+    submodule's name (e.g. `faucet_plugin` exported from `.faucet_plugin`) without `__getattr__`
+    ever running. Such bindings are replaced with the export itself.
+    """
+
+    _lazy_exports: Dict[str, str]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        target = self.__dict__.get("_lazy_exports", {}).get(name)
+        if target is not None and isinstance(value, types.ModuleType):
+            module_name, _, attribute = target.partition(":")
+            if value.__name__ == importlib.util.resolve_name(module_name, self.__name__):
+                value = getattr(value, attribute or name, value)
+        super().__setattr__(name, value)
+
+
+def lazy_attributes(
+    package: str, attributes: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Builds the PEP 562 `__getattr__` and `__dir__` of a package whose exports are imported on first use
+
+    Keeps `import package` cheap: heavy dependencies (chain SDKs, pydantic, aiohttp) are only loaded
+    when one of the attributes that needs them is accessed. Each attribute is imported once and then
+    stored on the package, so later lookups skip `__getattr__`.
+
+    Args:
+        package: The package's `__name__`
+        attributes: Maps each exported name to the module defining it, relative to the package
+            (e.g. {"EVMWalletClient": ".evm_wallet_client"}). Use "module:name" to export an
+            attribute under another name
+
+    Returns:
+        The `__getattr__` and `__dir__` functions to assign at the package's module level
+    """
+    module = sys.modules[package]
+    module.__dict__["_lazy_exports"] = attributes
+    module.__class__ = _LazyPackage
+
+    def __getattr__(name: str) -> Any:
+        module_name = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module_name, _, attribute = module_name.partition(":")
+        value = getattr(importlib.import_module(module_name, package), attribute or name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return __getattr__, __dir__
@@ -0,0 +1,22 @@
+import inspect
+from typing import Awaitable, TypeVar, Union
+
+T = TypeVar("T")
+
+
+async def maybe_await(value: Union[T, Awaitable[T]]) -> T:
+    """
+    Awaits a value if it is awaitable, otherwise returns it as is
+
+    Lets async tools call wallet clients that come in blocking and async flavours, e.g.
+    `await maybe_await(wallet_client.send_transaction(transaction))`.
+
+    Args:
+        value: A plain value or an awaitable
+
+    Returns:
+        The value, or the result of awaiting it
+    """
+    if inspect.isawaitable(value):
+        return await value
+    return value
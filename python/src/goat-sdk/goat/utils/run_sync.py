@@ -0,0 +1,62 @@
+import asyncio
+import contextvars
+import threading
+from typing import Any, Awaitable, Callable, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def _run_coroutine_in_new_thread(
+    coro: Coroutine[Any, Any, T], cleanup: Optional[Callable[[], Awaitable[None]]] = None
+) -> T:
+    """Run a coroutine in a new thread with its own event loop."""
+    result = None
+    exception = None
+
+    def run_coro():
+        nonlocal result, exception
+        loop = asyncio.new_event_loop()
+        try:
+            result = loop.run_until_complete(coro)
+        except Exception as e:
+            exception = e
+        finally:
+            if cleanup is not None:
+                loop.run_until_complete(cleanup())
+            loop.close()
+
+    # Carry the caller's context variables (e.g. the current instrumented tool call) into the thread
+    context = contextvars.copy_context()
+    thread = threading.Thread(target=context.run, args=(run_coro,))
+    thread.start()
+    thread.join()
+
+    if exception:
+        raise exception
+    return result  # type: ignore
+
+
+def run_sync(coro: Coroutine[Any, Any, T], cleanup: Optional[Callable[[], Awaitable[None]]] = None) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    Callers that already run inside an event loop should await the coroutine
+    instead (see `ToolBase.execute_async`); this is the fallback for blocking callers.
+
+    `cleanup` is awaited on the temporary loop of case 2 before that loop is closed,
+    e.g. to release loop-bound HTTP sessions.
+
+    Handles three cases:
+    1. If there's an existing event loop and it's not running: use it directly with run_until_complete
+    2. If there's an existing event loop and it's running: create a new thread with its own event loop to avoid deadlock
+    3. If there's no event loop: create a new one and use it, then set it as the current event loop to be reused
+    """
+    try:
+        loop = asyncio.get_event_loop()
+        if loop.is_running():
+            return _run_coroutine_in_new_thread(coro, cleanup)
+        else:
+            return loop.run_until_complete(coro)
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(coro)
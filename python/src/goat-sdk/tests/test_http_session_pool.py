@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from goat import HTTPSessionPool, HTTPSessionPoolOptions
+
+
+@pytest.mark.asyncio
+async def test_get_session_reuses_session_on_same_loop():
+    pool = HTTPSessionPool(HTTPSessionPoolOptions(limit_per_host=2))
+    first = await pool.get_session()
+    second = await pool.get_session()
+    assert first is second
+    assert first.connector.limit_per_host == 2
+    await pool.close()
+    assert first.closed
+
+
+@pytest.mark.asyncio
+async def test_sessions_keep_aiohttp_default_timeout_unless_configured():
+    default_pool = HTTPSessionPool()
+    configured_pool = HTTPSessionPool(HTTPSessionPoolOptions(timeout=10))
+    assert (await default_pool.get_session()).timeout.total == 300
+    assert (await configured_pool.get_session()).timeout.total == 10
+    await default_pool.close()
+    await configured_pool.close()
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_bound_to_their_loop():
+    pool = HTTPSessionPool()
+    session = await pool.get_session()
+
+    async def get_and_release():
+        other = await pool.get_session()
+        await pool.release()
+        return other
+
+    other = await asyncio.to_thread(asyncio.run, get_and_release())
+    assert other is not session
+    assert other.closed
+    assert not session.closed
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_sessions_of_closed_loops_are_closed_and_dropped():
+    pool = HTTPSessionPool()
+
+    def use_pool_on_new_loop():
+        loop = asyncio.new_event_loop()
+        try:
+            # No release(): the loop is discarded with its session still pooled
+            return loop.run_until_complete(pool.get_session())
+        finally:
+            loop.close()
+
+    stale = await asyncio.to_thread(use_pool_on_new_loop)
+    assert not stale.closed
+    assert len(pool._sessions) == 1
+
+    session = await pool.get_session()
+    assert stale.closed
+    assert [entry[1] for entry in pool._sessions.values()] == [session]
+    await pool.close()
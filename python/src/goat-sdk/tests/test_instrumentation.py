@@ -0,0 +1,110 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from pydantic import BaseModel
+
+from goat import (
+    HistogramCollector,
+    HTTPSessionPool,
+    add_instrumentation_hook,
+    create_tool,
+    instrument_httpx_client,
+    remove_instrumentation_hook,
+)
+
+
+class EmptyParameters(BaseModel):
+    pass
+
+
+@pytest.fixture
+def collector():
+    collector = HistogramCollector()
+    add_instrumentation_hook(collector)
+    yield collector
+    remove_instrumentation_hook(collector)
+
+
+def test_collector_records_latency_and_errors(collector):
+    def fail(parameters):
+        raise ValueError("boom")
+
+    ok = create_tool({"name": "ok", "description": "", "parameters": EmptyParameters}, lambda p: "ok", plugin_name="p")
+    failing = create_tool({"name": "fail", "description": "", "parameters": EmptyParameters}, fail, plugin_name="p")
+    ok.execute({})
+    ok.execute({})
+    with pytest.raises(ValueError):
+        failing.execute({})
+
+    assert collector.get("ok", "p").count == 2
+    assert collector.get("fail", "p").errors == 1
+    assert {tool for _, tool, _ in collector.slowest()} == {"ok", "fail"}
+
+
+@pytest.mark.asyncio
+async def test_pooled_requests_are_attributed_to_the_tool_call(collector):
+    app = web.Application()
+    app.router.add_post("/echo", _echo)
+    server = TestServer(app)
+    await server.start_server()
+    pool = HTTPSessionPool()
+
+    async def call_upstream(parameters):
+        session = await pool.get_session()
+        for _ in range(2):
+            async with session.post(server.make_url("/echo"), data=b"12345") as response:
+                await response.read()
+
+    tool = create_tool({"name": "fetch", "description": "", "parameters": EmptyParameters}, call_upstream)
+    await tool.execute_async({})
+    await pool.close()
+    await server.close()
+
+    histogram = collector.get("fetch")
+    assert histogram.upstream_calls == 2
+    assert histogram.upstream_bytes == 20
+
+
+def test_httpx_requests_are_attributed_to_the_tool_call(collector):
+    httpx = pytest.importorskip("httpx")
+    client = instrument_httpx_client(
+        httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=request.content)))
+    )
+    instrument_httpx_client(client)
+
+    def call_upstream(parameters):
+        for _ in range(2):
+            client.post("http://upstream/echo", content=b"12345")
+
+    tool = create_tool({"name": "fetch_httpx", "description": "", "parameters": EmptyParameters}, call_upstream)
+    tool.execute({})
+    # Requests outside of a tool call are not recorded
+    client.post("http://upstream/echo", content=b"12345")
+    client.close()
+
+    histogram = collector.get("fetch_httpx")
+    assert histogram.upstream_calls == 2
+    assert histogram.upstream_bytes == 20
+
+
+@pytest.mark.asyncio
+async def test_async_httpx_requests_are_attributed_to_the_tool_call(collector):
+    httpx = pytest.importorskip("httpx")
+    client = instrument_httpx_client(
+        httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b"ok")))
+    )
+
+    async def call_upstream(parameters):
+        await client.post("http://upstream/echo", content=b"12345")
+
+    tool = create_tool({"name": "fetch_httpx_async", "description": "", "parameters": EmptyParameters}, call_upstream)
+    await tool.execute_async({})
+    await client.aclose()
+
+    histogram = collector.get("fetch_httpx_async")
+    assert histogram.upstream_calls == 1
+    assert histogram.upstream_bytes == 7
+
+
+async def _echo(request):
+    return web.Response(body=await request.read())
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+import pytest
+
+import goat
+
+
+def test_import_does_not_load_dependencies():
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, goat; print('pydantic' in sys.modules, 'aiohttp' in sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_exports_load_on_first_access():
+    from goat.classes.plugin_base import PluginBase
+
+    assert goat.PluginBase is PluginBase
+    assert "PluginBase" in vars(goat)
+    assert set(goat.__all__) <= set(dir(goat))
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        goat.missing  # noqa: B018
+
+
+def test_export_named_like_its_submodule(tmp_path, monkeypatch):
+    package = tmp_path / "lazy_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text(
+        "from goat.utils.lazy_import import lazy_attributes\n"
+        "__getattr__, __dir__ = lazy_attributes(__name__, {'helper': '.helper', 'Other': '.other'})\n"
+    )
+    (package / "helper.py").write_text("def helper():\n    return 'helper'\n")
+    (package / "other.py").write_text("from .helper import helper\nclass Other:\n    pass\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    # Importing the submodule first (here through another export) must not shadow the export
+    import lazy_pkg
+
+    assert lazy_pkg.Other.__name__ == "Other"
+    from lazy_pkg import helper
+
+    assert helper() == "helper"
+    assert sys.modules["lazy_pkg.helper"].helper is helper
+    del sys.modules["lazy_pkg"], sys.modules["lazy_pkg.helper"], sys.modules["lazy_pkg.other"]
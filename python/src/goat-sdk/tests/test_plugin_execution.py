@@ -0,0 +1,215 @@
+import asyncio
+import gc
+import threading
+import weakref
+
+import pytest
+from pydantic import BaseModel, Field, ValidationError
+
+from goat import (
+    FunctionTool,
+    PluginBase,
+    WalletClientBase,
+    create_tool,
+    execute_many,
+    execute_many_async,
+    get_tools,
+)
+from goat.classes.plugin_base import WALLET_TOOL_CACHE_ATTR
+from goat.decorators.tool import Tool
+
+
+class EchoParameters(BaseModel):
+    value: str = Field(description="The value to echo")
+
+
+class DummyWalletClient(WalletClientBase):
+    def get_address(self) -> str:
+        return "0x0000000000000000000000000000000000000001"
+
+    def get_chain(self):
+        return {"type": "evm", "id": 1, "nativeCurrency": {"name": "Ether", "symbol": "ETH", "decimals": 18}}
+
+    def sign_message(self, message: str):
+        return {"signature": message}
+
+    def balance_of(self, address: str, token_address=None):
+        return {"decimals": 18, "symbol": "ETH", "name": "Ether", "value": "0", "in_base_units": "0"}
+
+
+class EchoService:
+    @Tool({
+        "description": "Echo a value from a coroutine",
+        "parameters_schema": EchoParameters
+    })
+    async def echo_async(self, parameters: dict):
+        return {"value": parameters["value"], "loop": asyncio.get_running_loop()}
+
+    @Tool({
+        "description": "Echo a value from a blocking function",
+        "parameters_schema": EchoParameters
+    })
+    def echo_sync(self, wallet_client: WalletClientBase, parameters: dict):
+        return {"value": parameters["value"], "thread": threading.get_ident()}
+
+
+class EchoPlugin(PluginBase):
+    def __init__(self):
+        super().__init__("echo", [EchoService()])
+
+    def supports_chain(self, chain) -> bool:
+        return True
+
+
+def _get_tool(name: str):
+    tools = EchoPlugin().get_tools(DummyWalletClient())
+    return next(t for t in tools if t.name == name)
+
+
+def test_execute_runs_coroutine_tools_without_a_loop():
+    result = _get_tool("echo_async").execute({"value": "hello"})
+    assert result["value"] == "hello"
+
+
+@pytest.mark.asyncio
+async def test_execute_async_awaits_on_callers_loop():
+    result = await _get_tool("echo_async").execute_async({"value": "hello"})
+    assert result["value"] == "hello"
+    assert result["loop"] is asyncio.get_running_loop()
+
+
+@pytest.mark.asyncio
+async def test_execute_async_offloads_blocking_tools():
+    result = await _get_tool("echo_sync").execute_async({"value": "hello"})
+    assert result["value"] == "hello"
+    assert result["thread"] != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_execute_inside_running_loop_still_completes():
+    result = _get_tool("echo_async").execute({"value": "hello"})
+    assert result["value"] == "hello"
+    assert result["loop"] is not asyncio.get_running_loop()
+
+
+def test_get_tools_reuses_tools_per_wallet():
+    plugin = EchoPlugin()
+    wallet = DummyWalletClient()
+    first = plugin.get_tools(wallet)
+    assert [t.name for t in plugin.get_tools(wallet)] == [t.name for t in first]
+    assert plugin.get_tools(wallet)[0] is first[0]
+    assert plugin.get_tools(DummyWalletClient())[0] is not first[0]
+    assert EchoPlugin.discover_tools(EchoService) is EchoPlugin.discover_tools(EchoService)
+
+
+def test_get_tools_cache_does_not_keep_plugins_alive():
+    wallet = DummyWalletClient()
+    for _ in range(100):
+        EchoPlugin().get_tools(wallet)
+    gc.collect()
+    assert len(getattr(wallet, WALLET_TOOL_CACHE_ATTR)) == 0
+
+    plugin = EchoPlugin()
+    tools = plugin.get_tools(wallet)
+    del plugin
+    gc.collect()
+    # Tools still in use keep working without their plugin
+    assert len(getattr(wallet, WALLET_TOOL_CACHE_ATTR)) == 0
+    assert tools[0].execute({"value": "hello"})["value"] == "hello"
+
+
+def test_tool_index_cache_does_not_keep_plugins_or_wallets_alive():
+    wallet = DummyWalletClient()
+    plugin = EchoPlugin()
+    assert [t.name for t in get_tools(wallet, [plugin], query="echo a value from a coroutine", k=2)][0] == "echo_async"
+    plugin_ref, wallet_ref = weakref.ref(plugin), weakref.ref(wallet)
+
+    del plugin, wallet
+    gc.collect()
+    assert plugin_ref() is None
+    assert wallet_ref() is None
+
+
+def test_get_tools_reuses_tools_after_the_list_is_dropped():
+    plugin = EchoPlugin()
+    wallet = DummyWalletClient()
+    first = [weakref.ref(tool) for tool in plugin.get_tools(wallet)]
+    gc.collect()
+    second = plugin.get_tools(wallet)
+    assert all(tool_ref() is tool for tool_ref, tool in zip(first, second))
+
+
+def test_tools_share_a_slotted_class():
+    tools = EchoPlugin().get_tools(DummyWalletClient())
+    assert all(type(t) is FunctionTool for t in tools)
+    assert not hasattr(tools[0], "__dict__")
+
+
+def test_json_schema_is_generated_once_per_model():
+    first, second = EchoPlugin().get_tools(DummyWalletClient())[:2]
+    assert first.json_schema() == EchoParameters.model_json_schema()
+    assert first.json_schema() is second.json_schema()
+
+
+class NestedParameters(BaseModel):
+    value: str
+    echo: EchoParameters
+    tags: list = Field(default_factory=list)
+    repeat: int = 1
+
+
+def _record_tool():
+    calls = []
+    tool = create_tool(
+        {"name": "record", "description": "Record parameters", "parameters": NestedParameters},
+        lambda parameters: calls.append(parameters) or parameters,
+    )
+    return tool, calls
+
+
+def test_trusted_validation_fills_defaults_and_dumps_models():
+    tool, _ = _record_tool()
+    trusted = tool.execute({"value": "a", "echo": EchoParameters(value="b")}, validation_mode="trusted")
+    full = tool.execute({"value": "a", "echo": {"value": "b"}})
+    assert trusted == full == {"value": "a", "echo": {"value": "b"}, "tags": [], "repeat": 1}
+
+
+def test_trusted_validation_falls_back_when_required_fields_are_missing():
+    tool, _ = _record_tool()
+    with pytest.raises(ValidationError):
+        tool.execute({"value": "a"}, validation_mode="trusted")
+
+
+def test_execute_many_keeps_order_and_reports_errors_per_call():
+    tools = {t.name: t for t in EchoPlugin().get_tools(DummyWalletClient())}
+    results = execute_many(
+        [
+            (tools["echo_async"], {"value": "a"}),
+            (tools["echo_sync"], {}),
+            (tools["echo_sync"], {"value": "c"}),
+        ],
+        max_concurrency=2,
+    )
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[0].result["value"] == "a"
+    assert isinstance(results[1].error, ValidationError)
+    assert results[2].result["value"] == "c"
+
+
+@pytest.mark.asyncio
+async def test_execute_many_async_bounds_concurrency():
+    running = 0
+    peak = 0
+
+    async def track(parameters):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return parameters["value"]
+
+    tool = create_tool({"name": "track", "description": "", "parameters": EchoParameters}, track)
+    results = await execute_many_async([(tool, {"value": str(i)}) for i in range(6)], max_concurrency=2)
+    assert [r.result for r in results] == [str(i) for i in range(6)]
+    assert peak == 2
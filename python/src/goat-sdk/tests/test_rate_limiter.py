@@ -0,0 +1,110 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from goat import HTTPSessionPool, RateLimit, RateLimiter, rate_limit_tenant, use_rate_limiter
+from goat.classes.rate_limiter import _HostBucket, parse_retry_after
+
+
+@pytest.mark.asyncio
+async def test_requests_are_paced_by_the_host_bucket():
+    limiter = RateLimiter({"api.example.com": RateLimit(requests_per_second=50)})
+    started = time.monotonic()
+    for _ in range(5):
+        await limiter.acquire("api.example.com")
+    # The first request uses the burst token, the next four wait 20ms each
+    assert time.monotonic() - started >= 0.075
+
+    started = time.monotonic()
+    await limiter.acquire("other.example.com")
+    assert time.monotonic() - started < 0.01
+
+
+@pytest.mark.asyncio
+async def test_queued_requests_are_shared_fairly_between_tenants():
+    limiter = RateLimiter(default=RateLimit(requests_per_second=200))
+    await limiter.acquire("api.example.com")  # drain the burst token
+    order = []
+
+    async def request(tenant):
+        with rate_limit_tenant(tenant):
+            await limiter.acquire("api.example.com")
+        order.append(tenant)
+
+    tasks = [asyncio.ensure_future(request("a")) for _ in range(4)]
+    await asyncio.sleep(0)
+    tasks += [asyncio.ensure_future(request("b")) for _ in range(2)]
+    await asyncio.gather(*tasks)
+    assert order == ["a", "b", "a", "b", "a", "a"]
+
+
+@pytest.mark.asyncio
+async def test_only_the_head_of_the_queue_polls_the_bucket(monkeypatch):
+    limiter = RateLimiter(default=RateLimit(requests_per_second=400))
+    await limiter.acquire("api.example.com")  # drain the burst token
+    attempts = []
+    try_acquire = _HostBucket.try_acquire
+
+    def counting_try_acquire(self, tenant, ticket, now):
+        attempts.append(ticket)
+        return try_acquire(self, tenant, ticket, now)
+
+    monkeypatch.setattr(_HostBucket, "try_acquire", counting_try_acquire)
+    await asyncio.gather(*(limiter.acquire("api.example.com") for _ in range(20)))
+
+    # Every request polls once when queued and then only while it is at the head, instead of
+    # every queued request polling each time a token is due
+    assert len(attempts) < 20 * 4
+
+
+@pytest.mark.asyncio
+async def test_cancelled_head_hands_over_to_the_next_request():
+    limiter = RateLimiter(default=RateLimit(requests_per_second=20))
+    await limiter.acquire("api.example.com")  # drain the burst token
+    head = asyncio.ensure_future(limiter.acquire("api.example.com"))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(limiter.acquire("api.example.com"))
+    await asyncio.sleep(0)
+    head.cancel()
+
+    started = time.monotonic()
+    await asyncio.wait_for(second, 1)
+    assert time.monotonic() - started < 0.09
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_the_host():
+    responses = []
+
+    async def handler(request):
+        status = 429 if not responses else 200
+        responses.append(status)
+        return web.json_response({}, status=status, headers={"Retry-After": "0.2"} if status == 429 else {})
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    server = TestServer(app)
+    await server.start_server()
+    pool = HTTPSessionPool()
+    session = await pool.get_session()
+
+    with use_rate_limiter(RateLimiter()):
+        async with session.get(server.make_url("/")) as response:
+            assert response.status == 429
+        started = time.monotonic()
+        async with session.get(server.make_url("/")) as response:
+            assert response.status == 200
+        assert time.monotonic() - started >= 0.15
+
+    await pool.close()
+    await server.close()
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,102 @@
+import pytest
+from pydantic import BaseModel
+
+from goat import PluginBase, ResultCursorStore, WalletClientBase, get_tools
+from goat.classes.result_shaping import encoded_size, project, shape_result
+from goat.decorators.tool import Tool
+
+PAIRS = {
+    "schemaVersion": "1.0.0",
+    "pairs": [{"pairAddress": f"0x{i}", "priceUsd": str(i), "txns": {"h24": {"buys": i}}} for i in range(10)],
+}
+
+
+def test_project_keeps_listed_fields():
+    assert project(PAIRS, ["pairs.pairAddress", "pairs.txns.h24.buys"])["pairs"][1] == {
+        "pairAddress": "0x1",
+        "txns": {"h24": {"buys": 1}},
+    }
+    assert project({"tokens": {"a": {"symbol": "A", "logo": "..."}}}, ["tokens.*.symbol"]) == {
+        "tokens": {"a": {"symbol": "A"}}
+    }
+
+
+def test_pages_through_a_nested_list():
+    cursors = ResultCursorStore()
+    shaped = shape_result(PAIRS, {"items": "pairs", "max_items": 4}, cursors)
+    assert [p["pairAddress"] for p in shaped["pairs"]] == ["0x0", "0x1", "0x2", "0x3"]
+    assert shaped["schemaVersion"] == "1.0.0" and len(PAIRS["pairs"]) == 10
+
+    seen = [p["pairAddress"] for p in shaped["pairs"]]
+    continuation = shaped["continuation"]
+    while continuation is not None:
+        page = cursors.next_page({"cursor": continuation["next_cursor"]})
+        seen += [p["pairAddress"] for p in page["items"]]
+        continuation = page.get("continuation")
+    assert seen == [f"0x{i}" for i in range(10)]
+
+
+def test_byte_budget_shrinks_pages_and_truncates_the_rest():
+    cursors = ResultCursorStore()
+    shaped = shape_result(PAIRS["pairs"], {"max_bytes": 300}, cursors)
+    assert encoded_size(shaped) <= 300
+    assert 0 < len(shaped["items"]) < 10 and shaped["continuation"]["total"] == 10
+
+    assert shape_result("x" * 1000, {"max_bytes": 100}, cursors)["truncated"] is True
+    assert shape_result(PAIRS["pairs"][:2], {"max_items": 5}, cursors) == PAIRS["pairs"][:2]
+
+
+def test_unknown_cursor():
+    with pytest.raises(ValueError, match="expired cursor"):
+        ResultCursorStore().next_page({"cursor": "missing:3"})
+
+
+class ListParameters(BaseModel):
+    pass
+
+
+class ListService:
+    @Tool({
+        "description": "List numbers",
+        "parameters_schema": ListParameters,
+        "result": {"max_items": 3},
+    })
+    def list_numbers(self, parameters: dict):
+        return list(range(7))
+
+
+class ListPlugin(PluginBase):
+    def __init__(self):
+        super().__init__("list", [ListService()])
+
+    def supports_chain(self, chain) -> bool:
+        return True
+
+
+class DummyWalletClient(WalletClientBase):
+    def get_address(self) -> str:
+        return "0x0000000000000000000000000000000000000001"
+
+    def get_chain(self):
+        return {"type": "evm", "id": 1}
+
+    def sign_message(self, message: str):
+        return {"signature": ""}
+
+    def balance_of(self, address: str):
+        return {"decimals": 18, "symbol": "ETH", "name": "Ether", "value": "0", "in_base_units": "0"}
+
+
+def test_plugin_tools_shape_results_and_expose_get_more_results():
+    tools = {t.name: t for t in get_tools(DummyWalletClient(), [ListPlugin()])}
+    first = tools["list_numbers"].execute({})
+    assert first["items"] == [0, 1, 2]
+    second = tools["get_more_results"].execute({"cursor": first["continuation"]["next_cursor"]})
+    assert second["items"] == [3, 4, 5]
+
+
+def test_result_options_are_validated():
+    with pytest.raises(ValueError, match="max_items"):
+        Tool({"description": "", "parameters_schema": ListParameters, "result": {"max_items": 0}})(
+            ListService.list_numbers
+        )
@@ -0,0 +1,77 @@
+import asyncio
+import threading
+
+import pytest
+
+from goat import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_async_calls_share_one_execution():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"price": 1}
+
+    results = await asyncio.gather(*(single_flight.do_async("price", fetch) for _ in range(5)))
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+
+    await single_flight.do_async("price", fetch)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_the_shared_call():
+    single_flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return "done"
+
+    first = asyncio.ensure_future(single_flight.do_async("key", fetch))
+    second = asyncio.ensure_future(single_flight.do_async("key", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == "done"
+
+
+def test_concurrent_sync_calls_share_one_execution_and_its_error():
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = 0
+
+    def fetch():
+        nonlocal calls
+        calls += 1
+        started.set()
+        release.wait()
+        raise ValueError("upstream failed")
+
+    errors = []
+
+    def call():
+        try:
+            single_flight.do("key", fetch)
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=call) for _ in range(3)]
+    for follower in followers:
+        follower.start()
+    # Give the followers time to join the in-flight call before it completes
+    threading.Event().wait(0.2)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert calls == 1
+    assert len(errors) == 4
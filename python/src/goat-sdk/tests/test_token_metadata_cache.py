@@ -0,0 +1,16 @@
+from goat import JSONFileTokenMetadataStore, TokenMetadataCache
+
+
+def test_update_merges_fields():
+    cache = TokenMetadataCache()
+    cache.update("evm:1", "0xabc", {"decimals": 6})
+    merged = cache.update("evm:1", "0xabc", {"name": "USD Coin", "symbol": "USDC"})
+    assert merged == {"decimals": 6, "name": "USD Coin", "symbol": "USDC"}
+    assert cache.get("evm:8453", "0xabc") is None
+
+
+def test_json_file_store_persists_entries(tmp_path):
+    path = str(tmp_path / "tokens.json")
+    TokenMetadataCache(JSONFileTokenMetadataStore(path)).update("solana:mainnet", "Mint111", {"decimals": 5})
+    reloaded = TokenMetadataCache(JSONFileTokenMetadataStore(path))
+    assert reloaded.get("solana:mainnet", "Mint111") == {"decimals": 5}
@@ -0,0 +1,33 @@
+import json
+
+from goat import TokenRegistry
+
+
+def test_lookups_by_ticker_address_and_chain():
+    registry = TokenRegistry(
+        [
+            {"chain": 1, "address": "0xAbC", "symbol": "USDC", "name": "USD Coin", "decimals": 6},
+            {"chain": 8453, "address": "0xDeF", "symbol": "USDC", "name": "USD Coin", "decimals": 6},
+        ],
+        case_sensitive_addresses=False,
+    )
+    assert registry.get_by_ticker(1, "usdc")["address"] == "0xAbC"
+    assert registry.get_by_address(8453, "0xdef")["chain"] == 8453
+    assert registry.get_by_ticker(10, "USDC") is None
+    assert registry.get_chains_for_ticker("usdc") == [1, 8453]
+    assert len(registry) == 2
+
+
+def test_bulk_loading_from_json_and_csv(tmp_path):
+    json_path = tmp_path / "tokens.json"
+    json_path.write_text(json.dumps([
+        {"chain": "mainnet", "address": "Mint111", "symbol": "BONK", "name": "Bonk", "decimals": 5},
+    ]))
+    csv_path = tmp_path / "tokens.csv"
+    csv_path.write_text("chain,address,symbol,name,decimals\n137,0x123,WETH,Wrapped Ether,18\n")
+
+    registry = TokenRegistry()
+    registry.load_json(str(json_path))
+    registry.load_csv(str(csv_path))
+    assert registry.get_by_address("mainnet", "Mint111")["symbol"] == "BONK"
+    assert registry.get_by_ticker(137, "weth")["decimals"] == 18
@@ -0,0 +1,69 @@
+import gc
+import weakref
+
+import pytest
+from pydantic import BaseModel, Field
+
+from goat import ToolIndex, create_tool, get_tool_index
+from goat.classes.tool_index import tokenize
+
+
+class PriceParameters(BaseModel):
+    coin_id: str = Field(description="The CoinGecko id of the coin")
+
+
+class SwapParameters(BaseModel):
+    input_mint: str = Field(description="Mint of the token to sell")
+    output_mint: str = Field(description="Mint of the token to buy")
+
+
+class AddressParameters(BaseModel):
+    pass
+
+
+def _tool(name, description, parameters=AddressParameters):
+    return create_tool({"name": name, "description": description, "parameters": parameters}, lambda p: p)
+
+
+TOOLS = [
+    _tool("get_address", "Get the address of the wallet"),
+    _tool("get_coin_price", "Get the price of a coin in a given currency", PriceParameters),
+    _tool("swap_tokens", "Swap one token for another on Jupiter", SwapParameters),
+    _tool("get_trending_coins", "List the coins trending on CoinGecko"),
+]
+
+
+def test_tokenize_splits_identifiers_and_plurals():
+    assert tokenize("getTokenPrices of swap_tokens") == ["token", "price", "swap", "token"]
+
+
+def test_select_tools_ranks_by_relevance():
+    index = ToolIndex(TOOLS)
+    assert [t.name for t in index.select_tools("what is the price of bitcoin?", k=1)] == ["get_coin_price"]
+    # Parameter descriptions are indexed too
+    assert index.select_tools("sell my mint", k=1)[0].name == "swap_tokens"
+
+
+def test_select_tools_fills_up_in_index_order():
+    index = ToolIndex(TOOLS)
+    assert [t.name for t in index.select_tools("trending", k=3)] == ["get_trending_coins", "get_address", "get_coin_price"]
+    with pytest.raises(ValueError):
+        index.select_tools("trending", k=0)
+
+
+def test_get_tool_index_is_built_once_per_tool_list():
+    index = get_tool_index(TOOLS)
+    again = get_tool_index(list(TOOLS))
+    assert again._postings is index._postings
+    assert again.tools == TOOLS
+    assert get_tool_index(TOOLS[:2])._postings is not index._postings
+
+
+def test_get_tool_index_does_not_keep_tools_alive():
+    tools = [_tool("get_balance", "Get the balance of the wallet"), _tool("transfer", "Send tokens")]
+    assert get_tool_index(tools).select_tools("balance", k=1) == tools[:1]
+    ref = weakref.ref(tools[0])
+
+    del tools
+    gc.collect()
+    assert ref() is None
@@ -0,0 +1,127 @@
+import pytest
+from pydantic import BaseModel
+
+from goat import InMemoryToolResultCache, PluginBase, WalletClientBase
+from goat.decorators.tool import Tool
+
+
+class QueryParameters(BaseModel):
+    query: str
+    page: int = 1
+
+
+class DummyWalletClient(WalletClientBase):
+    def __init__(self, address: str = "0x0000000000000000000000000000000000000001"):
+        super().__init__()
+        self.address = address
+
+    def get_address(self) -> str:
+        return self.address
+
+    def get_chain(self):
+        return {"type": "evm", "id": 1}
+
+    def sign_message(self, message: str):
+        return {"signature": message}
+
+    def balance_of(self, address: str, token_address=None):
+        raise NotImplementedError
+
+
+class CountingService:
+    def __init__(self):
+        self.calls = 0
+
+    @Tool({
+        "description": "Search with a cached result",
+        "parameters_schema": QueryParameters,
+        "cache": {"ttl": 60, "read_only": True, "key": lambda params: params["query"]},
+    })
+    def search(self, parameters: dict):
+        self.calls += 1
+        return {"query": parameters["query"], "call": self.calls}
+
+    @Tool({
+        "description": "Look up data of the wallet with a cached result",
+        "parameters_schema": QueryParameters,
+        "cache": {"ttl": 60, "read_only": True},
+    })
+    async def wallet_lookup(self, wallet_client: DummyWalletClient, parameters: dict):
+        self.calls += 1
+        return {"address": wallet_client.get_address(), "call": self.calls}
+
+
+class CountingPlugin(PluginBase):
+    def __init__(self, tool_cache):
+        self.service = CountingService()
+        super().__init__("counting", [self.service], tool_cache=tool_cache)
+
+    def supports_chain(self, chain) -> bool:
+        return True
+
+
+def _tools(plugin, wallet):
+    return {t.name: t for t in plugin.get_tools(wallet)}
+
+
+def test_cached_tool_results_are_reused_until_they_expire():
+    now = [0.0]
+    plugin = CountingPlugin(InMemoryToolResultCache(clock=lambda: now[0]))
+    search = _tools(plugin, DummyWalletClient())["search"]
+
+    assert search.execute({"query": "eth"})["call"] == 1
+    # The key function ignores the page
+    assert search.execute({"query": "eth", "page": 2})["call"] == 1
+    assert search.execute({"query": "btc"})["call"] == 2
+    now[0] = 61
+    assert search.execute({"query": "eth"})["call"] == 3
+
+
+@pytest.mark.asyncio
+async def test_wallet_tools_are_cached_per_wallet():
+    plugin = CountingPlugin(InMemoryToolResultCache())
+    first = _tools(plugin, DummyWalletClient("0x1"))["wallet_lookup"]
+    second = _tools(plugin, DummyWalletClient("0x2"))["wallet_lookup"]
+
+    assert (await first.execute_async({"query": "a"}))["call"] == 1
+    assert (await first.execute_async({"query": "a"}))["call"] == 1
+    assert (await second.execute_async({"query": "a"}))["call"] == 2
+
+
+def test_cached_tool_results_cannot_be_modified_by_callers():
+    plugin = CountingPlugin(InMemoryToolResultCache())
+    search = _tools(plugin, DummyWalletClient())["search"]
+
+    first = search.execute({"query": "eth"})
+    first["call"] = "changed"
+    hit = search.execute({"query": "eth"})
+    assert hit == {"query": "eth", "call": 1}
+    hit["query"] = "changed"
+    assert search.execute({"query": "eth"}) == {"query": "eth", "call": 1}
+
+
+def test_in_memory_cache_stores_copies():
+    cache = InMemoryToolResultCache()
+    value = {"items": [1, 2]}
+    cache.set("tool", "a", value, ttl=60)
+    value["items"].append(3)
+    _, cached = cache.get("tool", "a")
+    cached["items"].clear()
+    assert cache.get("tool", "a") == (True, {"items": [1, 2]})
+
+
+def test_in_memory_cache_evicts_least_recently_used_entries():
+    cache = InMemoryToolResultCache()
+    cache.set("tool", "a", 1, ttl=60, max_entries=2)
+    cache.set("tool", "b", 2, ttl=60, max_entries=2)
+    assert cache.get("tool", "a") == (True, 1)
+    cache.set("tool", "c", 3, ttl=60, max_entries=2)
+    assert cache.get("tool", "b") == (False, None)
+    assert cache.get("tool", "a") == (True, 1)
+
+
+def test_cache_requires_read_only_tools():
+    with pytest.raises(ValueError):
+        Tool({"description": "Send", "parameters_schema": QueryParameters, "cache": {"ttl": 60, "read_only": False}})(
+            lambda self, parameters: None
+        )
@@ -1,12 +1,13 @@
-import aiohttp
 from typing import Optional
 from goat.decorators.tool import Tool
+from goat.classes.http_session_pool import default_http_session_pool
 from .parameters import GetBalancesParameters
 
 class OneInchService:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key
         self.base_url = "https://api.1inch.dev"
+        self.http_pool = default_http_session_pool()
 
     @Tool({
         "name": "1inch_get_balances",
@@ -29,8 +30,8 @@ class OneInchService:
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if not response.ok:
-                    raise Exception(f"Failed to fetch balances: {response.status} {await response.text()}")
-                return await response.json()
+        session = await self.http_pool.get_session()
+        async with session.get(url, headers=headers) as response:
+            if not response.ok:
+                raise Exception(f"Failed to fetch balances: {response.status} {await response.text()}")
+            return await response.json()
@@ -1,17 +1,20 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from goat.classes.plugin_base import PluginBase
+from goat.classes.rate_limiter import RateLimiter
 from .service import CoinGeckoService
 
 
 @dataclass
 class CoinGeckoPluginOptions:
     api_key: str
+    rate_limiter: Optional[RateLimiter] = None
 
 
 class CoinGeckoPlugin(PluginBase):
     def __init__(self, options: CoinGeckoPluginOptions):
-        super().__init__("coingecko", [CoinGeckoService(options.api_key)])
+        super().__init__("coingecko", [CoinGeckoService(options.api_key)], rate_limiter=options.rate_limiter)
 
     def supports_chain(self, chain) -> bool:
         return True
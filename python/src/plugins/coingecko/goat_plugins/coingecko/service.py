@@ -1,28 +1,32 @@
-import aiohttp
 from goat.decorators.tool import Tool
+from goat.classes.http_session_pool import default_http_session_pool
 from .parameters import GetCoinPriceParameters, GetTrendingCoinsParameters, SearchCoinsParameters
 
 class CoinGeckoService:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://api.coingecko.com/api/v3"
+        self.http_pool = default_http_session_pool()
 
     @Tool({
         "description": "Get the list of trending coins from CoinGecko",
-        "parameters_schema": GetTrendingCoinsParameters
+        "parameters_schema": GetTrendingCoinsParameters,
+        "cache": {"ttl": 300, "read_only": True},
+        "single_flight": True
     })
     async def get_trending_coins(self, parameters: dict):
         """Get the list of trending coins from CoinGecko"""
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}/search/trending?x_cg_demo_api_key={self.api_key}"
-            async with session.get(url) as response:
-                if not response.ok:
-                    raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
-                return await response.json()
+        session = await self.http_pool.get_session()
+        url = f"{self.base_url}/search/trending?x_cg_demo_api_key={self.api_key}"
+        async with session.get(url) as response:
+            if not response.ok:
+                raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
+            return await response.json()
 
     @Tool({
         "description": "Get the price of a specific coin from CoinGecko",
-        "parameters_schema": GetCoinPriceParameters
+        "parameters_schema": GetCoinPriceParameters,
+        "single_flight": True
     })
     async def get_coin_price(self, parameters: dict):
         """Get the price of a specific coin from CoinGecko"""
@@ -36,16 +40,17 @@ class CoinGeckoService:
             "x_cg_demo_api_key": self.api_key
         }
         
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}/simple/price"
-            async with session.get(url, params=params) as response:
-                if not response.ok:
-                    raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
-                return await response.json()
+        session = await self.http_pool.get_session()
+        url = f"{self.base_url}/simple/price"
+        async with session.get(url, params=params) as response:
+            if not response.ok:
+                raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
+            return await response.json()
 
     @Tool({
         "description": "Search for coins on CoinGecko",
-        "parameters_schema": SearchCoinsParameters
+        "parameters_schema": SearchCoinsParameters,
+        "single_flight": True
     })
     async def search_coins(self, parameters: dict):
         """Search for coins on CoinGecko"""
@@ -54,21 +59,21 @@ class CoinGeckoService:
             "x_cg_demo_api_key": self.api_key
         }
         
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}/search"
-            async with session.get(url, params=params) as response:
-                if not response.ok:
-                    raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
-                data = await response.json()
-                
-                if parameters["exact_match"]:
-                    coins = data.get("coins", [])
-                    exact_matches = [
-                        coin for coin in coins 
-                        if coin.get("id") == parameters["query"] or 
-                           coin.get("symbol").lower() == parameters["query"].lower() or
-                           coin.get("name").lower() == parameters["query"].lower()
-                    ]
-                    data["coins"] = exact_matches
-                
-                return data
+        session = await self.http_pool.get_session()
+        url = f"{self.base_url}/search"
+        async with session.get(url, params=params) as response:
+            if not response.ok:
+                raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
+            data = await response.json()
+            
+            if parameters["exact_match"]:
+                coins = data.get("coins", [])
+                exact_matches = [
+                    coin for coin in coins 
+                    if coin.get("id") == parameters["query"] or 
+                       coin.get("symbol").lower() == parameters["query"].lower() or
+                       coin.get("name").lower() == parameters["query"].lower()
+                ]
+                data["coins"] = exact_matches
+            
+            return data
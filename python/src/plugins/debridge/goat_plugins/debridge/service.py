@@ -1,5 +1,5 @@
-import aiohttp
 from goat.decorators.tool import Tool
+from goat.classes.http_session_pool import default_http_session_pool
 from urllib.parse import urlencode
 from .parameters import (
     CancelExternalCallParameters,
@@ -19,16 +19,17 @@ class DebridgeService:
 
     def __init__(self):
         self.base_url = "https://dln.debridge.finance/v1.0"
+        self.http_pool = default_http_session_pool()
 
     async def _fetch(self, url: str, action: str):
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if not response.ok:
-                        raise Exception(
-                            f"HTTP error! status: {response.status} {await response.text()}"
-                        )
-                    return await response.json()
+            session = await self.http_pool.get_session()
+            async with session.get(url) as response:
+                if not response.ok:
+                    raise Exception(
+                        f"HTTP error! status: {response.status} {await response.text()}"
+                    )
+                return await response.json()
         except Exception as e:
             raise Exception(f"Failed to {action}: {e}")
 
@@ -36,6 +37,7 @@ class DebridgeService:
         "description":
         "Get details for the chains supported by the deBridge Liquidity Network",
         "parameters_schema": EmptyParameters,
+        "cache": {"ttl": 3600, "read_only": True},
     })
     async def get_supported_chains(self, parameters: dict):
         """Get details for the chains supported by the deBridge Liquidity Network"""
@@ -46,6 +48,13 @@ class DebridgeService:
         "description":
         "Get the token list supported by the deBridge Liquidity Network",
         "parameters_schema": GetTokenListParameters,
+        "cache": {"ttl": 3600, "read_only": True},
+        "result": {
+            "fields": ["tokens.*.address", "tokens.*.symbol", "tokens.*.name", "tokens.*.decimals"],
+            "items": "tokens",
+            "max_items": 50,
+            "max_bytes": 16000,
+        },
     })
     async def get_token_list(self, parameters: dict):
         """Get the token list supported by the deBridge Liquidity Network"""
@@ -1,5 +1,5 @@
-import aiohttp
 from goat.decorators.tool import Tool
+from goat.classes.http_session_pool import default_http_session_pool
 from .parameters import (
     GetPairsByChainAndPairParameters,
     SearchPairsParameters,
@@ -10,20 +10,22 @@ from .parameters import (
 class DexscreenerService:
     def __init__(self):
         self.base_url = "https://api.dexscreener.com/latest/dex"
+        self.http_pool = default_http_session_pool()
 
     async def _fetch(self, url: str, action: str):
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if not response.ok:
-                        raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
-                    return await response.json()
+            session = await self.http_pool.get_session()
+            async with session.get(url) as response:
+                if not response.ok:
+                    raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
+                return await response.json()
         except Exception as e:
             raise Exception(f"Failed to {action}: {e}")
 
     @Tool({
         "description": "Fetch pairs by chainId and pairId from Dexscreener",
-        "parameters_schema": GetPairsByChainAndPairParameters
+        "parameters_schema": GetPairsByChainAndPairParameters,
+        "single_flight": True
     })
     async def get_pairs_by_chain_and_pair(self, parameters: dict):
         url = f"{self.base_url}/pairs/{parameters['chainId']}/{parameters['pairId']}"
@@ -31,7 +33,18 @@ class DexscreenerService:
 
     @Tool({
         "description": "Search for DEX pairs matching a query string on Dexscreener",
-        "parameters_schema": SearchPairsParameters
+        "parameters_schema": SearchPairsParameters,
+        "single_flight": True,
+        "result": {
+            "fields": [
+                "pairs.chainId", "pairs.dexId", "pairs.url", "pairs.pairAddress", "pairs.baseToken",
+                "pairs.quoteToken", "pairs.priceUsd", "pairs.priceNative", "pairs.volume.h24",
+                "pairs.priceChange.h24", "pairs.liquidity.usd", "pairs.fdv", "pairs.marketCap",
+            ],
+            "items": "pairs",
+            "max_items": 10,
+            "max_bytes": 16000,
+        },
     })
     async def search_pairs(self, parameters: dict):
         query = parameters["query"]
@@ -40,7 +53,8 @@ class DexscreenerService:
 
     @Tool({
         "description": "Get all DEX pairs for given token addresses (up to 30) from Dexscreener",
-        "parameters_schema": GetTokenPairsParameters
+        "parameters_schema": GetTokenPairsParameters,
+        "single_flight": True
     })
     async def get_token_pairs_by_token_address(self, parameters: dict):
         addresses = ",".join(parameters["tokenAddresses"])
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
 from goat.classes.plugin_base import PluginBase
+from goat.classes.rate_limiter import RateLimiter
 from .service import FarcasterService
 
 
@@ -8,11 +9,16 @@ from .service import FarcasterService
 class FarcasterPluginOptions:
     api_key: str
     base_url: Optional[str] = None
+    rate_limiter: Optional[RateLimiter] = None
 
 
 class FarcasterPlugin(PluginBase):
     def __init__(self, options: FarcasterPluginOptions):
-        super().__init__("farcaster", [FarcasterService(options.api_key, options.base_url)])
+        super().__init__(
+            "farcaster",
+            [FarcasterService(options.api_key, options.base_url)],
+            rate_limiter=options.rate_limiter,
+        )
 
     def supports_chain(self, chain) -> bool:
         # farcaster is chain-agnostic
@@ -1,5 +1,5 @@
-import aiohttp
 from goat.decorators.tool import Tool
+from goat.classes.http_session_pool import default_http_session_pool
 from .parameters import (
     GetCastParameters,
     PublishCastParameters,
@@ -12,6 +12,7 @@ class FarcasterService:
     def __init__(self, api_key: str, base_url: str = "https://api.neynar.com/v2/farcaster"):
         self.api_key = api_key
         self.base_url = base_url
+        self.http_pool = default_http_session_pool()
 
     @Tool({"description": "Get a cast by its URL or hash", "parameters_schema": GetCastParameters})
     async def get_cast(self, parameters: dict):
@@ -50,8 +51,8 @@ class FarcasterService:
         headers = kwargs.pop("headers", {})
         headers["x-api-key"] = self.api_key
         headers["content-type"] = "application/json"
-        async with aiohttp.ClientSession() as session:
-            async with session.request(method, url, headers=headers, **kwargs) as response:
-                if not response.ok:
-                    raise Exception(f"HTTP error! status: {response.status}, text: {await response.text()}")
-                return await response.json()
+        session = await self.http_pool.get_session()
+        async with session.request(method, url, headers=headers, **kwargs) as response:
+            if not response.ok:
+                raise Exception(f"HTTP error! status: {response.status}, text: {await response.text()}")
+            return await response.json()
@@ -1,18 +1,15 @@
-import aiohttp
 import json
 from typing import Dict, Any
 
 from goat.decorators.tool import Tool
+from goat.classes.http_session_pool import default_http_session_pool
 from .parameters import BuyTokenParameters
-from goat_wallets.evm import EVMWalletClient
-from goat_wallets.solana import SolanaWalletClient
 
 # Import the base wallet client type for proper typing
 from goat.classes.wallet_client_base import WalletClientBase
 
-# Minimal imports for EVM transaction parsing (essential for functionality)
-import rlp
-from eth_utils import to_checksum_address, to_hex
+# The EVM and Solana wallet stacks (and rlp) are imported where a payment of that chain is
+# handled, so importing the plugin does not load both chains' SDKs
 
 
 def clean_null_values(obj):
@@ -27,6 +24,9 @@ def clean_null_values(obj):
 
 def parse_evm_transaction(serialized_tx: str) -> Dict[str, Any]:
     """Parse EVM transaction to extract to, value, and data (handles legacy and EIP-1559)."""
+    import rlp
+    from eth_utils import to_checksum_address, to_hex
+
     if not serialized_tx.startswith("0x"):
         serialized_tx = f"0x{serialized_tx}"
     
@@ -82,6 +82,7 @@ class CrossmintApiClient:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = self._get_base_url(api_key)
+        self.http_pool = default_http_session_pool()
 
     def _get_base_url(self, api_key: str) -> str:
         """Determine the base URL based on the API key format"""
@@ -97,12 +98,12 @@ class CrossmintApiClient:
             "Content-Type": "application/json",
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(f"{self.base_url}{path}", headers=headers, json=body) as response:
-                if not response.ok:
-                    error_text = await response.text()
-                    raise Exception(f"HTTP error! status: {response.status} {error_text}")
-                return await response.json()
+        session = await self.http_pool.get_session()
+        async with session.post(f"{self.base_url}{path}", headers=headers, json=body) as response:
+            if not response.ok:
+                error_text = await response.text()
+                raise Exception(f"HTTP error! status: {response.status} {error_text}")
+            return await response.json()
 
 
 class CrossmintHeadlessCheckoutService:
@@ -165,6 +166,8 @@ class CrossmintHeadlessCheckoutService:
 
             # Handle Solana transactions
             if payment_method == "solana":
+                from goat_wallets.solana import SolanaWalletClient
+
                 if not isinstance(wallet_client, SolanaWalletClient):
                     raise Exception("Solana wallet client required. Use a solana wallet client, or change the payment method to one supported by your wallet client")
 
@@ -174,6 +177,8 @@ class CrossmintHeadlessCheckoutService:
 
             # Handle EVM transactions
             if self._is_evm_blockchain(payment_method):
+                from goat_wallets.evm import EVMWalletClient
+
                 if not isinstance(wallet_client, EVMWalletClient):
                     raise Exception("EVM wallet client required. Use an evm wallet client, or change the payment method to one supported by your wallet client")
 
@@ -1,10 +1,11 @@
-import aiohttp
 from goat.decorators.tool import Tool
+from goat.classes.http_session_pool import default_http_session_pool
 from .parameters import JSONRpcBodyParameters
 
 class JSONRpcService:
     def __init__(self, endpoint: str):
         self.endpoint = endpoint
+        self.http_pool = default_http_session_pool()
 
     @Tool({
         "description": "Make a remote procedure call to a JSON RPC endpoint",
@@ -13,10 +14,10 @@ class JSONRpcService:
     async def JSONRpcFunc(self, parameters: dict):
         """Makes a POST request to the configured endpoint with the required JSON-RPC parameters."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.endpoint, json=parameters) as response:
-                    if not response.ok:
-                        raise Exception(f"HTTP error! status: {response.status}, body: {await response.text()}")
-                    return await response.json()
+            session = await self.http_pool.get_session()
+            async with session.post(self.endpoint, json=parameters) as response:
+                if not response.ok:
+                    raise Exception(f"HTTP error! status: {response.status}, body: {await response.text()}")
+                return await response.json()
         except Exception as e:
             raise Exception(f"Failed to call {self.endpoint}: {e}")
@@ -2,6 +2,8 @@ import base64
 import base58
 import aiohttp
 from goat.decorators.tool import Tool
+from goat.classes.http_session_pool import default_http_session_pool
+from goat.utils.maybe_await import maybe_await
 from goat_wallets.solana.wallet import SolanaTransaction
 from solders.message import MessageV0
 from solders.transaction import VersionedTransaction
@@ -13,10 +15,12 @@ class JupiterService:
     def __init__(self):
         self.base_url = "https://api.jup.ag/swap/v1"
         self._timeout = aiohttp.ClientTimeout(total=10)  # 10 second timeout
+        self.http_pool = default_http_session_pool()
 
     @Tool({
         "description": "Get a quote for a swap on the Jupiter DEX",
-        "parameters_schema": GetQuoteParameters
+        "parameters_schema": GetQuoteParameters,
+        "single_flight": True
     })
     async def get_quote(self, parameters: dict) -> dict:
         """Get a quote for swapping tokens using Jupiter."""
@@ -45,24 +49,24 @@ class JupiterService:
                 request_params['platformFeeBps'] = int(params.platformFeeBps)
                 
             print(f"Requesting quote with parameters: {request_params}")
-            async with aiohttp.ClientSession(timeout=self._timeout) as session:
-                async with session.get(f"{self.base_url}/quote", params=request_params) as response:
-                    response_text = await response.text()
-                    print(f"Got response: {response_text}")
-
-                    if response.status != 200:
-                        try:
-                            error_data = await response.json()
-                            raise Exception(
-                                f"Failed to get quote: {error_data.get('error', 'Unknown error')}")
-                        except:
-                            raise Exception(
-                                f"Failed to get quote: {response_text}")
-
-                    response_data = await response.json()
-                    QuoteResponse.model_validate(response_data)
-
-                    return response_data
+            session = await self.http_pool.get_session()
+            async with session.get(f"{self.base_url}/quote", params=request_params, timeout=self._timeout) as response:
+                response_text = await response.text()
+                print(f"Got response: {response_text}")
+
+                if response.status != 200:
+                    try:
+                        error_data = await response.json()
+                        raise Exception(
+                            f"Failed to get quote: {error_data.get('error', 'Unknown error')}")
+                    except:
+                        raise Exception(
+                            f"Failed to get quote: {response_text}")
+
+                response_data = await response.json()
+                QuoteResponse.model_validate(response_data)
+
+                return response_data
         except aiohttp.ClientResponseError as error:
             error_message = f"Failed to get quote: {str(error)}"
             if error.status != 404:  # Only try to parse response for non-404 errors
@@ -91,29 +95,29 @@ class JupiterService:
             }
 
             # Get swap transaction
-            async with aiohttp.ClientSession(timeout=self._timeout) as session:
-                async with session.post(f"{self.base_url}/swap", json=swap_request) as response:
-                    if response.status != 200:
-                        error_data = await response.json()
-                        raise Exception(
-                            f"Failed to create swap transaction: {error_data.get('error', 'Unknown error')}")
+            session = await self.http_pool.get_session()
+            async with session.post(f"{self.base_url}/swap", json=swap_request, timeout=self._timeout) as response:
+                if response.status != 200:
+                    error_data = await response.json()
+                    raise Exception(
+                        f"Failed to create swap transaction: {error_data.get('error', 'Unknown error')}")
 
-                    swap_response = await response.json()
-                    swap_transaction = swap_response.get("swapTransaction")
+                swap_response = await response.json()
+                swap_transaction = swap_response.get("swapTransaction")
 
-                    if not swap_transaction:
-                        raise Exception("No swap transaction returned")
+                if not swap_transaction:
+                    raise Exception("No swap transaction returned")
 
-                    base58_tx = base58.b58encode(
-                        base64.b64decode(swap_transaction)).decode()
+                base58_tx = base58.b58encode(
+                    base64.b64decode(swap_transaction)).decode()
 
-                    # Send the raw transaction directly
-                    result = wallet_client.send_raw_transaction(
-                        base58_tx)
+                # Send the raw transaction directly
+                result = await maybe_await(wallet_client.send_raw_transaction(
+                    base58_tx))
 
-                    return {
-                        "hash": result["hash"]
-                    }
+                return {
+                    "hash": result["hash"]
+                }
 
         except Exception as error:
             # if error includes 0x1771
@@ -1,12 +1,14 @@
-import aiohttp
 from goat.decorators.tool import Tool
+from goat.classes.http_session_pool import default_http_session_pool
+from goat.utils.maybe_await import maybe_await
 from goat_wallets.solana import SolanaWalletClient
 from .parameters import DepositUSDCParameters
 
 
 class LuloService:
     def __init__(self):
-        pass
+        self.base_url = "https://blink.lulo.fi"
+        self.http_pool = default_http_session_pool()
 
     @Tool({
         "description": "Deposit USDC into Lulo",
@@ -16,20 +18,20 @@ class LuloService:
         """Deposit USDC into Lulo."""
         try:
             response = await self._make_deposit_request(wallet_client, parameters["amount"])
-            tx = wallet_client.send_raw_transaction(response["transaction"])
+            tx = await maybe_await(wallet_client.send_raw_transaction(response["transaction"]))
             return tx["hash"]
         except Exception as error:
             raise Exception(f"Failed to deposit USDC: {error}")
 
     async def _make_deposit_request(self, wallet_client: SolanaWalletClient, amount: str):
         """Make a deposit request to Lulo."""
-        async with aiohttp.ClientSession() as session:
-            url = f"https://blink.lulo.fi/actions?amount={amount}&symbol=USDC"
-            async with session.post(
-                url,
-                headers={"Content-Type": "application/json"},
-                json={"account": wallet_client.get_address()}
-            ) as response:
-                if not response.ok:
-                    raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
-                return await response.json()
+        session = await self.http_pool.get_session()
+        url = f"{self.base_url}/actions?amount={amount}&symbol=USDC"
+        async with session.post(
+            url,
+            headers={"Content-Type": "application/json"},
+            json={"account": wallet_client.get_address()}
+        ) as response:
+            if not response.ok:
+                raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
+            return await response.json()
@@ -1,5 +1,5 @@
-import aiohttp
 from goat.decorators.tool import Tool
+from goat.classes.http_session_pool import default_http_session_pool
 from .parameters import (
     GetTokenDetailsParameters,
     GetTokenTradesParameters,
@@ -14,17 +14,18 @@ class NansenService:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://api.nansen.ai/v1"
+        self.http_pool = default_http_session_pool()
 
     async def _fetch(self, endpoint: str, action: str, params: dict[str, str] = {}):
         """Helper method to handle HTTP requests with error handling"""
         try:
             url = f"{self.base_url}{endpoint}"
             headers = {"api-key": self.api_key}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, headers=headers) as response:
-                    if not response.ok:
-                        raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
-                    return await response.json()
+            session = await self.http_pool.get_session()
+            async with session.get(url, params=params, headers=headers) as response:
+                if not response.ok:
+                    raise Exception(f"HTTP error! status: {response.status} {await response.text()}")
+                return await response.json()
         except Exception as e:
             raise Exception(f"Failed to {action}: {e}")
 
@@ -39,7 +40,8 @@ class NansenService:
 
     @Tool({
         "description": "Get trades for a specific token from Nansen",
-        "parameters_schema": GetTokenTradesParameters
+        "parameters_schema": GetTokenTradesParameters,
+        "result": {"max_items": 25, "max_bytes": 16000}
     })
     async def get_token_trades(self, parameters: dict):
         """Get trades for a specific token from Nansen"""
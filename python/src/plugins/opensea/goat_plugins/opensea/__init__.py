@@ -1,16 +1,19 @@
 from dataclasses import dataclass
+from typing import Optional
 from goat.classes.plugin_base import PluginBase
+from goat.classes.rate_limiter import RateLimiter
 from .service import OpenSeaService
 
 
 @dataclass
 class OpenSeaPluginOptions:
     api_key: str
+    rate_limiter: Optional[RateLimiter] = None
 
 
 class OpenSeaPlugin(PluginBase):
     def __init__(self, options: OpenSeaPluginOptions):
-        super().__init__("opensea", [OpenSeaService(options.api_key)])
+        super().__init__("opensea", [OpenSeaService(options.api_key)], rate_limiter=options.rate_limiter)
 
     def supports_chain(self, chain) -> bool:
         return True
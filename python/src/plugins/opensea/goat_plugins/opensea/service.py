@@ -1,5 +1,5 @@
-import aiohttp
 from goat.decorators.tool import Tool
+from goat.classes.http_session_pool import default_http_session_pool
 from .parameters import (
     GetNftCollectionStatisticsParameters,
     GetNftSalesParameters,
@@ -12,47 +12,50 @@ class OpenSeaService:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://api.opensea.io/api/v2"
+        self.http_pool = default_http_session_pool()
 
     @Tool({
         "description": "Get NFT collection statistics",
-        "parameters_schema": GetNftCollectionStatisticsParameters
+        "parameters_schema": GetNftCollectionStatisticsParameters,
+        "cache": {"ttl": 300, "read_only": True}
     })
     async def get_nft_collection_statistics(self, parameters: dict) -> NftCollectionStatisticsResponse:
         """Get statistics for an NFT collection from OpenSea"""
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}/collections/{parameters['collectionSlug']}/stats"
-            headers = {
-                "accept": "application/json",
-                "x-api-key": self.api_key
-            }
-            async with session.get(url, headers=headers) as response:
-                if not response.ok:
-                    raise Exception(f"Failed to get NFT collection statistics: HTTP {response.status} - {await response.text()}")
-                data = await response.json()
-                return NftCollectionStatisticsResponse.model_validate(data)
+        session = await self.http_pool.get_session()
+        url = f"{self.base_url}/collections/{parameters['collectionSlug']}/stats"
+        headers = {
+            "accept": "application/json",
+            "x-api-key": self.api_key
+        }
+        async with session.get(url, headers=headers) as response:
+            if not response.ok:
+                raise Exception(f"Failed to get NFT collection statistics: HTTP {response.status} - {await response.text()}")
+            data = await response.json()
+            return NftCollectionStatisticsResponse.model_validate(data)
 
     @Tool({
         "description": "Get recent NFT sales",
-        "parameters_schema": GetNftSalesParameters
+        "parameters_schema": GetNftSalesParameters,
+        "result": {"max_bytes": 8000}
     })
     async def get_nft_sales(self, parameters: dict) -> list:
         """Get recent NFT sales for a collection from OpenSea"""
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}/events/collection/{parameters['collectionSlug']}?event_type=sale&limit=5"
-            headers = {
-                "accept": "application/json",
-                "x-api-key": self.api_key
-            }
-            async with session.get(url, headers=headers) as response:
-                if not response.ok:
-                    raise Exception(f"Failed to get NFT sales: HTTP {response.status} - {await response.text()}")
-                data = await response.json()
-                sales_response = NftSalesResponse.model_validate(data)
-                
-                # Transform the response to match TypeScript implementation
-                return [{
-                    "name": event.nft.name,
-                    "seller": event.seller,
-                    "buyer": event.buyer,
-                    "price": float(event.payment.quantity) / 10 ** event.payment.decimals
-                } for event in sales_response.asset_events]
+        session = await self.http_pool.get_session()
+        url = f"{self.base_url}/events/collection/{parameters['collectionSlug']}?event_type=sale&limit=5"
+        headers = {
+            "accept": "application/json",
+            "x-api-key": self.api_key
+        }
+        async with session.get(url, headers=headers) as response:
+            if not response.ok:
+                raise Exception(f"Failed to get NFT sales: HTTP {response.status} - {await response.text()}")
+            data = await response.json()
+            sales_response = NftSalesResponse.model_validate(data)
+            
+            # Transform the response to match TypeScript implementation
+            return [{
+                "name": event.nft.name,
+                "seller": event.seller,
+                "buyer": event.buyer,
+                "price": float(event.payment.quantity) / 10 ** event.payment.decimals
+            } for event in sales_response.asset_events]
@@ -1,5 +1,5 @@
-import aiohttp
 from goat.decorators.tool import Tool
+from goat.classes.http_session_pool import default_http_session_pool
 from .parameters import GetTokenReportParameters, NoParameters
 
 
@@ -7,20 +7,21 @@ class RugCheckService:
     def __init__(self, jwt_token: str = "", base_url: str = "https://api.rugcheck.xyz/v1"):
         self.jwt_token = jwt_token
         self.base_url = base_url
+        self.http_pool = default_http_session_pool()
 
     async def _make_request(self, endpoint: str):
         headers = {
             "Content-Type": "application/json",
         }
         
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}{endpoint}"
-            async with session.get(url, headers=headers) as response:
-                if not response.ok:
-                    if response.status == 429:
-                        raise Exception("RugCheck API rate limit exceeded")
-                    raise Exception(f"RugCheck API request failed: {response.status}")
-                return await response.json()
+        session = await self.http_pool.get_session()
+        url = f"{self.base_url}{endpoint}"
+        async with session.get(url, headers=headers) as response:
+            if not response.ok:
+                if response.status == 429:
+                    raise Exception("RugCheck API rate limit exceeded")
+                raise Exception(f"RugCheck API request failed: {response.status}")
+            return await response.json()
 
     @Tool({
         "description": "Get recently detected tokens from RugCheck",
@@ -32,7 +33,8 @@ class RugCheckService:
 
     @Tool({
         "description": "Get trending tokens in the last 24h from RugCheck",
-        "parameters_schema": NoParameters
+        "parameters_schema": NoParameters,
+        "cache": {"ttl": 300, "read_only": True}
     })
     async def get_trending_tokens_24h(self, parameters: dict):
         """Get trending tokens in the last 24h from RugCheck"""
@@ -40,7 +42,8 @@ class RugCheckService:
 
     @Tool({
         "description": "Get tokens with the most votes in the last 24h from RugCheck",
-        "parameters_schema": NoParameters
+        "parameters_schema": NoParameters,
+        "cache": {"ttl": 300, "read_only": True}
     })
     async def get_most_voted_tokens_24h(self, parameters: dict):
         """Get tokens with the most votes in the last 24h from RugCheck"""
@@ -56,7 +59,8 @@ class RugCheckService:
 
     @Tool({
         "description": "Generate a report summary for the given token mint",
-        "parameters_schema": GetTokenReportParameters
+        "parameters_schema": GetTokenReportParameters,
+        "result": {"items": "risks", "max_items": 20, "max_bytes": 8000}
     })
     async def generate_token_report_summary(self, parameters: dict):
         """Generate a report summary for the given token mint"""
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
+from typing import Optional
 from goat.classes.plugin_base import PluginBase
+from goat.classes.rate_limiter import RateLimiter
 from .service import UniswapService
 
 
@@ -8,12 +10,17 @@ class UniswapPluginOptions:
     """Options for the UniswapPlugin."""
     api_key: str  # API key for external service integration
     base_url: str  # Base URL for Uniswap API
+    rate_limiter: Optional[RateLimiter] = None  # Client-side rate limit for the Uniswap API
 
 
 class UniswapPlugin(PluginBase):
     """Uniswap plugin for token swaps on supported EVM chains."""
     def __init__(self, options: UniswapPluginOptions):
-        super().__init__("uniswap", [UniswapService(options.api_key, options.base_url)])
+        super().__init__(
+            "uniswap",
+            [UniswapService(options.api_key, options.base_url)],
+            rate_limiter=options.rate_limiter,
+        )
 
     def supports_chain(self, chain) -> bool:
         """Check if the chain is supported by Uniswap.
@@ -3,6 +3,8 @@ import json
 from typing import Any, Dict, cast
 from eth_typing import HexStr
 from goat.decorators.tool import Tool
+from goat.classes.http_session_pool import default_http_session_pool
+from goat.utils.maybe_await import maybe_await
 from .parameters import CheckApprovalParameters, GetQuoteParameters
 from goat_wallets.evm import EVMTransaction, EVMTypedData
 from goat_wallets.evm import EVMWalletClient
@@ -13,6 +15,7 @@ class UniswapService:
     def __init__(self, api_key: str, base_url: str = "https://trade-api.gateway.uniswap.org/v1"):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")  # Remove trailing slash if present
+        self.http_pool = default_http_session_pool()
 
         # Map chain IDs to their string names
         self.chain_id_map = {
@@ -34,34 +37,34 @@ class UniswapService:
             "x-api-key": self.api_key
         }
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(url, json=parameters, headers=headers) as response:
-                    response_text = await response.text()
-                    try:
-                        response_json = json.loads(response_text)
-                    except json.JSONDecodeError:
-                        raise Exception(f"Invalid JSON response from {endpoint}: {response_text}")
-                    
-                    print(f"\nAPI Response for {endpoint}:")
-                    print(f"Status: {response.status}")
-                    print(f"Headers: {dict(response.headers)}")
-                    print(f"Body: {response_text}")
-                    
-                    if not response.ok:
-                        error_code = response_json.get("errorCode", "Unknown error")
-                        if error_code == "VALIDATION_ERROR":
-                            raise Exception("Invalid parameters provided to the API")
-                        elif error_code == "INSUFFICIENT_BALANCE":
-                            raise Exception("Insufficient balance for the requested operation")
-                        elif error_code == "RATE_LIMIT":
-                            raise Exception("API rate limit exceeded")
-                        else:
-                            raise Exception(f"API error: {error_code}")
-                    
-                    return response_json
-            except aiohttp.ClientError as e:
-                raise Exception(f"Network error while accessing {endpoint}: {str(e)}")
+        session = await self.http_pool.get_session()
+        try:
+            async with session.post(url, json=parameters, headers=headers) as response:
+                response_text = await response.text()
+                try:
+                    response_json = json.loads(response_text)
+                except json.JSONDecodeError:
+                    raise Exception(f"Invalid JSON response from {endpoint}: {response_text}")
+                
+                print(f"\nAPI Response for {endpoint}:")
+                print(f"Status: {response.status}")
+                print(f"Headers: {dict(response.headers)}")
+                print(f"Body: {response_text}")
+                
+                if not response.ok:
+                    error_code = response_json.get("errorCode", "Unknown error")
+                    if error_code == "VALIDATION_ERROR":
+                        raise Exception("Invalid parameters provided to the API")
+                    elif error_code == "INSUFFICIENT_BALANCE":
+                        raise Exception("Insufficient balance for the requested operation")
+                    elif error_code == "RATE_LIMIT":
+                        raise Exception("API rate limit exceeded")
+                    else:
+                        raise Exception(f"API error: {error_code}")
+                
+                return response_json
+        except aiohttp.ClientError as e:
+            raise Exception(f"Network error while accessing {endpoint}: {str(e)}")
 
     @Tool({
         "name": "uniswap_check_approval",
@@ -88,12 +91,12 @@ class UniswapService:
             # The spender address starts at position 34 (after function selector) and is 40 characters long
             raw_spender = "0x" + data[34:74]
             # Use wallet_client's resolve_address to get checksum address
-            spender = wallet_client.resolve_address(raw_spender)
+            spender = await maybe_await(wallet_client.resolve_address(raw_spender))
             # Convert max approval amount to integer
             max_approval = int("0x" + "f" * 64, 16)  # Max uint256 value
             
             transaction_params: EVMTransaction = {
-                "to": wallet_client.resolve_address(approval["to"]),
+                "to": await maybe_await(wallet_client.resolve_address(approval["to"])),
                 "abi": ERC20_ABI,
                 "functionName": "approve",
                 "args": [spender, max_approval],
@@ -101,7 +104,7 @@ class UniswapService:
             }
             
             # Send the transaction
-            transaction = wallet_client.send_transaction(transaction_params)
+            transaction = await maybe_await(wallet_client.send_transaction(transaction_params))
             return {
                 "status": "approved",
                 "txHash": transaction["hash"]
@@ -162,7 +165,7 @@ class UniswapService:
                     "primaryType": list(permit_data["types"].keys())[0],
                     "message": permit_data["values"]
                 }
-                signature = wallet_client.sign_typed_data(typed_data)
+                signature = await maybe_await(wallet_client.sign_typed_data(typed_data))
 
                 swap_params["permitData"] = permit_data
                 swap_params["signature"] = str(signature["signature"])
@@ -185,13 +188,13 @@ class UniswapService:
             
             # Create and cast the transaction parameters
             transaction_params = cast(EVMTransaction, {
-                "to": wallet_client.resolve_address(swap["to"]),
+                "to": await maybe_await(wallet_client.resolve_address(swap["to"])),
                 "value": value,
                 "data": HexStr(swap["data"])
             })
             
             # Send the transaction
-            transaction = wallet_client.send_transaction(transaction_params)
+            transaction = await maybe_await(wallet_client.send_transaction(transaction_params))
 
             return {
                 "txHash": transaction["hash"]
@@ -1,26 +1,58 @@
 """CrossMint wallet implementation for GOAT SDK."""
-from typing import Dict, Any, Union
+from typing import TYPE_CHECKING, Dict, Any
 
-from .api_client import CrossmintWalletsAPI
-from .faucet_plugin import faucet_plugin
-from .mint_plugin import mint_plugin
-from .wallet_plugin import wallets_plugin
-from .custodial_solana_wallet import custodial_factory
-from .evm_smart_wallet import EVMSmartWalletClient
-from .solana_smart_wallet import SolanaSmartWalletClient
-from .evm_smart_wallet import smart_wallet_factory as evm_smart_wallet_factory
-from .solana_smart_wallet_factory import SolanaSmartWalletFactory
+from goat.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .api_client import CrossmintWalletsAPI
+    from .waiter import Waiter
+    from .faucet_plugin import faucet_plugin
+    from .mint_plugin import mint_plugin
+    from .wallet_plugin import wallets_plugin
+    from .custodial_solana_wallet import custodial_factory
+    from .evm_smart_wallet import EVMSmartWalletClient
+    from .solana_smart_wallet import SolanaSmartWalletClient
+    from .evm_smart_wallet import smart_wallet_factory as evm_smart_wallet_factory
+    from .solana_smart_wallet_factory import SolanaSmartWalletFactory
+
+# The EVM and Solana stacks are only imported once a client or factory of that chain is used
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "CrossmintWalletsAPI": ".api_client",
+        "Waiter": ".waiter",
+        "faucet_plugin": ".faucet_plugin",
+        "mint_plugin": ".mint_plugin",
+        "wallets_plugin": ".wallet_plugin",
+        "custodial_factory": ".custodial_solana_wallet",
+        "EVMSmartWalletClient": ".evm_smart_wallet",
+        "SolanaSmartWalletClient": ".solana_smart_wallet",
+        "evm_smart_wallet_factory": ".evm_smart_wallet:smart_wallet_factory",
+        "SolanaSmartWalletFactory": ".solana_smart_wallet_factory",
+    },
+)
 
 
 def crossmint(api_key: str) -> Dict[str, Any]:
     """Initialize CrossMint SDK with API key.
 
+    Loads both the EVM and Solana stacks. Import the factories from their modules
+    (e.g. `goat_wallets.crossmint.evm_smart_wallet`) to load only one of them.
+
     Args:
         api_key: CrossMint API key
 
     Returns:
         Dict containing CrossMint wallet and plugin factories
     """
+    from .api_client import CrossmintWalletsAPI
+    from .custodial_solana_wallet import custodial_factory
+    from .evm_smart_wallet import smart_wallet_factory as evm_smart_wallet_factory
+    from .faucet_plugin import faucet_plugin
+    from .mint_plugin import mint_plugin
+    from .solana_smart_wallet_factory import SolanaSmartWalletFactory
+    from .wallet_plugin import wallets_plugin
+
     api_client = CrossmintWalletsAPI(api_key=api_key)
 
     return {
@@ -37,4 +69,5 @@ __all__ = [
     "crossmint",
     "EVMSmartWalletClient",
     "SolanaSmartWalletClient",
+    "Waiter",
 ]
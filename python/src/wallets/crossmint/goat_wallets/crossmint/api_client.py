@@ -6,24 +6,90 @@ from .parameters import (
     SolanaSmartWalletTransactionParams, DelegatedSignerPermission
 )
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 from urllib.parse import quote
-import time
+from goat import instrument_requests_session
 from goat_wallets.evm import EVMTypedData
+from .waiter import Waiter
 
 
 class CrossmintWalletsAPI:
     """Python implementation of CrossmintWalletsAPI."""
 
-    def __init__(self, api_key: str, base_url: str = "https://staging.crossmint.com"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://staging.crossmint.com",
+        session: Optional[requests.Session] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 50,
+        max_retries: int = 3,
+        backoff_factor: float = 0.2,
+        waiter: Optional[Waiter] = None,
+    ):
         """Initialize the Crossmint Wallets API client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the Crossmint API
+            session: Optional requests.Session to share warm connections between clients.
+                A shared session is not closed by close().
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum number of keep-alive connections per host
+            max_retries: Retries for idempotent GET requests on connection errors and 429/5xx responses
+            backoff_factor: Backoff factor between GET retries in seconds
+            waiter: Polling strategy used by the wait_for_* methods. Defaults to Waiter()
         """
         self.api_key = api_key
         self.base_url = f"{base_url}/api/v1-alpha2"
+        self.waiter = waiter or Waiter()
+        self._owns_session = session is None
+        self.session = session if session is not None else self._create_session(
+            pool_connections, pool_maxsize, max_retries, backoff_factor
+        )
+
+    @staticmethod
+    def _create_session(
+        pool_connections: int,
+        pool_maxsize: int,
+        max_retries: int,
+        backoff_factor: float,
+    ) -> requests.Session:
+        """Create a requests.Session with pooled keep-alive adapters.
+
+        Only GET requests are retried: signing and transaction POSTs are not idempotent.
+        """
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        instrument_requests_session(session)
+        return session
+
+    def close(self) -> None:
+        """Close the underlying HTTP session if this client created it."""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> "CrossmintWalletsAPI":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _request(
         self,
@@ -55,7 +121,7 @@ class CrossmintWalletsAPI:
 
         try:
             kwargs["timeout"] = timeout if timeout is not None else 30
-            response = requests.request(method, url, headers=headers, **kwargs)
+            response = self.session.request(method, url, headers=headers, **kwargs)
             response_body = response.json()
 
             if not response.ok:
@@ -703,13 +769,33 @@ class CrossmintWalletsAPI:
         endpoint = f"/wallets/{quote(wallet_locator)}/signers/{quote(signer_locator)}"
         return self._request(endpoint, method="GET")
 
-    def wait_for_action(self, action_id: str, interval: float = 1.0, max_attempts: int = 60) -> Dict[str, Any]:
+    def _get_waiter(self, interval: Optional[float]) -> Waiter:
+        """Return the client's waiter, or a copy starting from a caller-provided interval."""
+        if interval is None:
+            return self.waiter
+        return Waiter(
+            initial_interval=interval,
+            max_interval=max(interval, self.waiter.max_interval),
+            multiplier=self.waiter.multiplier,
+            jitter=self.waiter.jitter,
+            timeout=self.waiter.timeout,
+            sleep=self.waiter.sleep,
+        )
+
+    def wait_for_action(
+        self,
+        action_id: str,
+        interval: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """Wait for an action to complete.
 
         Args:
-            action_id: Action ID to wait for
-            interval: Time to wait between attempts in seconds
+            action_id: ID of the action to wait for
+            interval: Initial time to wait between attempts in seconds
             max_attempts: Maximum number of attempts to check status
+            timeout: Total time to wait in seconds. Defaults to the waiter's timeout
 
         Returns:
             Action response when completed
@@ -717,27 +803,30 @@ class CrossmintWalletsAPI:
         Raises:
             Exception: If action times out or fails
         """
-        attempts = 0
-        while attempts < max_attempts:
-            attempts += 1
-            endpoint = f"/actions/{quote(action_id)}"
-            response = self._request(endpoint)
-
-            if response.get("status") == "succeeded":
-                return response
-
-            time.sleep(interval)
-
-        raise Exception("Timed out waiting for action")
+        return self._get_waiter(interval).wait(
+            lambda: self._request(f"/actions/{quote(action_id)}"),
+            lambda response: response.get("status") == "succeeded",
+            description="action",
+            timeout=timeout,
+            max_attempts=max_attempts,
+        )
 
-    def wait_for_transaction(self, locator: str, transaction_id: str, interval: float = 1.0, max_attempts: int = 60) -> Dict[str, Any]:
+    def wait_for_transaction(
+        self,
+        locator: str,
+        transaction_id: str,
+        interval: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """Wait for a transaction to complete.
 
         Args:
             locator: Wallet locator string
             transaction_id: Transaction ID to wait for
-            interval: Time to wait between attempts in seconds
+            interval: Initial time to wait between attempts in seconds
             max_attempts: Maximum number of attempts to check status
+            timeout: Total time to wait in seconds. Defaults to the waiter's timeout
 
         Returns:
             Transaction response when completed
@@ -745,26 +834,30 @@ class CrossmintWalletsAPI:
         Raises:
             Exception: If transaction times out or fails
         """
-        attempts = 0
-        while attempts < max_attempts:
-            attempts += 1
-            response = self.check_transaction_status(locator, transaction_id)
-
-            if response["status"] in ["success", "completed", "failed"]:
-                return response
-
-            time.sleep(interval)
-
-        raise Exception("Timed out waiting for transaction")
+        return self._get_waiter(interval).wait(
+            lambda: self.check_transaction_status(locator, transaction_id),
+            _is_final_status,
+            description="transaction",
+            timeout=timeout,
+            max_attempts=max_attempts,
+        )
 
-    def wait_for_signature(self, locator: str, signature_id: str, interval: float = 1.0, max_attempts: int = 60) -> Dict[str, Any]:
+    def wait_for_signature(
+        self,
+        locator: str,
+        signature_id: str,
+        interval: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """Wait for a signature request to complete.
 
         Args:
             locator: Wallet locator string
             signature_id: Signature ID to wait for
-            interval: Time to wait between attempts in seconds
+            interval: Initial time to wait between attempts in seconds
             max_attempts: Maximum number of attempts to check status
+            timeout: Total time to wait in seconds. Defaults to the waiter's timeout
 
         Returns:
             Signature response when completed
@@ -772,17 +865,116 @@ class CrossmintWalletsAPI:
         Raises:
             Exception: If signature request times out or fails
         """
-        attempts = 0
-        while attempts < max_attempts:
-            attempts += 1
-            response = self.check_signature_status(signature_id, locator)
+        return self._get_waiter(interval).wait(
+            lambda: self.check_signature_status(signature_id, locator),
+            _is_final_status,
+            description="signature",
+            timeout=timeout,
+            max_attempts=max_attempts,
+        )
 
-            if response["status"] in ["success", "completed", "failed"]:
-                return response
+    def wait_for_transactions(
+        self,
+        locator: str,
+        transaction_ids: List[str],
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Wait for several transactions of a wallet in one polling loop.
 
-            time.sleep(interval)
+        Args:
+            locator: Wallet locator string
+            transaction_ids: Transaction IDs to wait for
+            timeout: Total time to wait in seconds. Defaults to the waiter's timeout
 
-        raise Exception("Timed out waiting for signature")
+        Returns:
+            Mapping of transaction ID to its final transaction response
+        """
+        return self.waiter.wait_many(
+            transaction_ids,
+            lambda transaction_id: self.check_transaction_status(locator, transaction_id),
+            _is_final_status,
+            description="transactions",
+            timeout=timeout,
+        )
+
+    def wait_for_signatures(
+        self,
+        locator: str,
+        signature_ids: List[str],
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Wait for several signature requests of a wallet in one polling loop.
+
+        Args:
+            locator: Wallet locator string
+            signature_ids: Signature IDs to wait for
+            timeout: Total time to wait in seconds. Defaults to the waiter's timeout
+
+        Returns:
+            Mapping of signature ID to its final signature response
+        """
+        return self.waiter.wait_many(
+            signature_ids,
+            lambda signature_id: self.check_signature_status(signature_id, locator),
+            _is_final_status,
+            description="signatures",
+            timeout=timeout,
+        )
+
+    async def wait_for_action_async(self, action_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Async variant of wait_for_action that does not block the event loop between polls."""
+        return await self.waiter.wait_async(
+            lambda: self._request(f"/actions/{quote(action_id)}"),
+            lambda response: response.get("status") == "succeeded",
+            description="action",
+            timeout=timeout,
+        )
+
+    async def wait_for_transaction_async(
+        self, locator: str, transaction_id: str, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Async variant of wait_for_transaction that does not block the event loop between polls."""
+        return await self.waiter.wait_async(
+            lambda: self.check_transaction_status(locator, transaction_id),
+            _is_final_status,
+            description="transaction",
+            timeout=timeout,
+        )
+
+    async def wait_for_signature_async(
+        self, locator: str, signature_id: str, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Async variant of wait_for_signature that does not block the event loop between polls."""
+        return await self.waiter.wait_async(
+            lambda: self.check_signature_status(signature_id, locator),
+            _is_final_status,
+            description="signature",
+            timeout=timeout,
+        )
+
+    async def wait_for_transactions_async(
+        self, locator: str, transaction_ids: List[str], timeout: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Async variant of wait_for_transactions; pending transactions are polled concurrently."""
+        return await self.waiter.wait_many_async(
+            transaction_ids,
+            lambda transaction_id: self.check_transaction_status(locator, transaction_id),
+            _is_final_status,
+            description="transactions",
+            timeout=timeout,
+        )
+
+    async def wait_for_signatures_async(
+        self, locator: str, signature_ids: List[str], timeout: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Async variant of wait_for_signatures; pending signature requests are polled concurrently."""
+        return await self.waiter.wait_many_async(
+            signature_ids,
+            lambda signature_id: self.check_signature_status(signature_id, locator),
+            _is_final_status,
+            description="signatures",
+            timeout=timeout,
+        )
 
     def create_wallet(self, wallet_type: str, linked_user: Optional[str] = None, config: Optional[Dict[str, Any]] = None, idempotency_key: Optional[str] = None) -> Dict[str, Any]:
         """Create a new wallet.
@@ -836,3 +1028,7 @@ class CrossmintWalletsAPI:
             wallet_type=f"{chain}-mpc-wallet",
             linked_user=f"userId:{user_id}"
         )
+
+
+def _is_final_status(response: Dict[str, Any]) -> bool:
+    return response["status"] in ["success", "completed", "failed"]
@@ -1,5 +1,4 @@
-import time
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 import base58
 from solders.instruction import Instruction
 from solders.pubkey import Pubkey
@@ -71,21 +70,21 @@ class CustodialSolanaWalletClient(SolanaWalletClient):
                 message
             )
             
-            while True:
-                status = self._client.check_signature_status(
+            status = self._client.waiter.wait(
+                lambda: self._client.check_signature_status(
                     response["id"],
                     self._address
-                )
-                
-                if status["status"] == "success":
-                    if not status.get("outputSignature"):
-                        raise ValueError("Signature is undefined")
-                    return Signature(signature=status["outputSignature"])
-                
-                if status["status"] == "failed":
-                    raise ValueError("Signature failed")
-                
-                time.sleep(3)  # Wait 3 seconds before checking again
+                ),
+                _is_settled,
+                description="signature"
+            )
+            
+            if status["status"] == "failed":
+                raise ValueError("Signature failed")
+            
+            if not status.get("outputSignature"):
+                raise ValueError("Signature is undefined")
+            return Signature(signature=status["outputSignature"])
                 
         except Exception as e:
             raise ValueError(f"Failed to sign message: {e}")
@@ -137,25 +136,25 @@ class CustodialSolanaWalletClient(SolanaWalletClient):
         
         # Wait for completion
         print(f"\nTransaction submitted with ID: {response['id']}")
-        while True:
-            status = self._client.check_transaction_status(
+        status = self._client.waiter.wait(
+            lambda: self._client.check_transaction_status(
                 self._locator,
                 response["id"]
+            ),
+            _is_settled,
+            description="transaction"
+        )
+        print(f"\nTransaction status: {status}")
+        
+        if status["status"] == "failed":
+            raise ValueError(
+                f"Transaction failed: {status.get('onChain', {}).get('txId')}, details: {status}"
             )
-            print(f"\nTransaction status: {status}")
-            
-            if status["status"] == "success":
-                return {
-                    "status": "success",
-                    "hash": status.get("onChain", {}).get("txId", "")
-                }
-            
-            if status["status"] == "failed":
-                raise ValueError(
-                    f"Transaction failed: {status.get('onChain', {}).get('txId')}, details: {status}"
-                )
-            
-            time.sleep(3)
+        
+        return {
+            "status": "success",
+            "hash": status.get("onChain", {}).get("txId", "")
+        }
     
     def balance_of(self, address: str, token_address: Optional[str] = None) -> Balance:
         """Get the SOL balance of an address.
@@ -191,24 +190,28 @@ class CustodialSolanaWalletClient(SolanaWalletClient):
             transaction
         )
         
-        while True:
-            status = self._client.check_transaction_status(
+        status = self._client.waiter.wait(
+            lambda: self._client.check_transaction_status(
                 self._locator,
                 response["id"]
+            ),
+            _is_settled,
+            description="transaction"
+        )
+        
+        if status["status"] == "failed":
+            raise ValueError(
+                f"Transaction failed: {status.get('onChain', {}).get('txId')}"
             )
-            
-            if status["status"] == "success":
-                return {
-                    "status": "success",
-                    "hash": status.get("onChain", {}).get("txId", "")
-                }
-            
-            if status["status"] == "failed":
-                raise ValueError(
-                    f"Transaction failed: {status.get('onChain', {}).get('txId')}"
-                )
-            
-            time.sleep(3)
+        
+        return {
+            "status": "success",
+            "hash": status.get("onChain", {}).get("txId", "")
+        }
+
+
+def _is_settled(status: Dict[str, Any]) -> bool:
+    return status["status"] in ["success", "failed"]
 
 
 def custodial_factory(api_client: CrossmintWalletsAPI):
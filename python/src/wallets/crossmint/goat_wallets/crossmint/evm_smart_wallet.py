@@ -1,10 +1,9 @@
-import time
 from typing import Any, Dict, List, Optional, TypedDict, Union, cast, NewType
 from goat.classes.wallet_client_base import Balance, Signature
 from goat.types.chain import EvmChain, NativeCurrency
 from goat_wallets.evm.types import EVMTypedData
 from goat_wallets.crossmint.solana_smart_wallet import LinkedUser
-from goat_wallets.evm import EVMWalletClient, EVMTransaction, EVMReadRequest, EVMReadResult
+from goat_wallets.evm import EVMWalletClient, EVMTransaction, EVMReadRequest, EVMReadResult, EncoderCache, Multicall3
 from web3.main import Web3
 from web3.providers.rpc import HTTPProvider
 from eth_typing import ChecksumAddress
@@ -33,6 +32,8 @@ Signer = Union[CustodialSigner, KeyPairSigner]
 
 # Use sync Web3 for encoding and address utilities
 w3_sync = Web3()
+# Calldata encoders for build_transaction_data, which never calls the chain
+_calldata_encoders = EncoderCache(w3_sync)
 
 def build_transaction_data(
     recipient_address: str,
@@ -51,16 +52,12 @@ def build_transaction_data(
     if not function_name:
         raise ValueError("Function name is required when ABI is provided")
     
-    contract = w3_sync.eth.contract(
-        address=w3_sync.to_checksum_address(recipient_address),
-        abi=abi
-    )
-    data = contract.get_function_by_name(function_name)(*args or []).build_transaction()['data']
+    encoder = _calldata_encoders.get(w3_sync.to_checksum_address(recipient_address), abi, function_name)
     
     return Call(
         to=recipient_address,
         value=str(value or 0),
-        data=data.hex()
+        data=encoder.encode(args or [])
     )
 
 
@@ -100,6 +97,9 @@ class EVMSmartWalletClient(EVMWalletClient, BaseWalletClient):
             self._ens = ENS.from_web3(ens_w3)
         else:
             self._ens = None
+        self._encoders = EncoderCache(self._w3)
+        self._multicall = Multicall3(self._w3, encoders=self._encoders)
+        self._chain_id: Optional[int] = None
         
         self._locator = get_evm_locator(address)
     
@@ -128,7 +128,7 @@ class EVMSmartWalletClient(EVMWalletClient, BaseWalletClient):
         """Get chain information."""
         return EvmChain(
             type="evm",
-            id=self._w3.eth.chain_id,
+            id=self.get_chain_id(),
             nativeCurrency=NativeCurrency(
                 name="Ether",
                 symbol="ETH",
@@ -137,8 +137,10 @@ class EVMSmartWalletClient(EVMWalletClient, BaseWalletClient):
         )
     
     def get_chain_id(self) -> int:
-        """Get chain ID."""
-        return self._w3.eth.chain_id
+        """Get chain ID, fetched from the provider once."""
+        if self._chain_id is None:
+            self._chain_id = self._w3.eth.chain_id
+        return self._chain_id
     
     def get_native_balance(self) -> int:
         """Get native balance of this wallet in base units."""
@@ -213,21 +215,21 @@ class EVMSmartWalletClient(EVMWalletClient, BaseWalletClient):
                 signature
             )
         
-        while True:
-            status = self._client.check_signature_status(
+        status = self._client.waiter.wait(
+            lambda: self._client.check_signature_status(
                 signature_id,
                 self._address
-            )
-            
-            if status["status"] == "success":
-                if not status.get("outputSignature"):
-                    raise ValueError("Signature is undefined")
-                return {"signature": status["outputSignature"]}
-            
-            if status["status"] == "failed":
-                raise ValueError("Signature failed")
-            
-            time.sleep(2)
+            ),
+            _is_settled,
+            description="signature"
+        )
+        
+        if status["status"] == "failed":
+            raise ValueError("Signature failed")
+        
+        if not status.get("outputSignature"):
+            raise ValueError("Signature is undefined")
+        return {"signature": status["outputSignature"]}
     
     def sign_typed_data(self, types: Dict[str, Any], primary_type: str, domain: Dict[str, Any], value: Dict[str, Any]) -> Signature:
         """Sign typed data."""
@@ -265,21 +267,21 @@ class EVMSmartWalletClient(EVMWalletClient, BaseWalletClient):
                 signature
             )
         
-        while True:
-            status = self._client.check_signature_status(
+        status = self._client.waiter.wait(
+            lambda: self._client.check_signature_status(
                 response["id"],
                 self._address
-            )
-            
-            if status["status"] == "success":
-                if not status.get("outputSignature"):
-                    raise ValueError("Signature is undefined")
-                return {"signature": status["outputSignature"]}
-            
-            if status["status"] == "failed":
-                raise ValueError("Signature failed")
-            
-            time.sleep(2)
+            ),
+            _is_settled,
+            description="signature"
+        )
+        
+        if status["status"] == "failed":
+            raise ValueError("Signature failed")
+        
+        if not status.get("outputSignature"):
+            raise ValueError("Signature is undefined")
+        return {"signature": status["outputSignature"]}
     
     def send_transaction(self, transaction: EVMTransaction) -> Dict[str, str]:
         """Send a single transaction."""
@@ -311,14 +313,18 @@ class EVMSmartWalletClient(EVMWalletClient, BaseWalletClient):
         if not abi:
             raise ValueError("Read request must include ABI for EVM")
 
-        contract = self._w3.eth.contract(
-            address=self.resolve_address(address),
-            abi=abi
-        )
-
-        result = contract.get_function_by_name(function_name)(*args).call()
+        encoder = self._encoders.get(self.resolve_address(address), abi, function_name)
         
-        return {"value": result}
+        return {"value": encoder.call(args)}
+    
+    def read_many(self, requests: List[EVMReadRequest]) -> List[EVMReadResult]:
+        """Read data from several smart contracts in one Multicall3 call, falling back to sequential reads."""
+        if len(requests) < 2:
+            return super().read_many(requests)
+        resolved: List[EVMReadRequest] = [
+            {**request, "address": self.resolve_address(request["address"])} for request in requests
+        ]
+        return self._multicall.read_many(resolved, fallback=super().read_many)
     
     def balance_of(self, address: str, token_address: Optional[str] = None) -> Balance:
         """Get ETH balance of an address."""
@@ -381,19 +387,23 @@ class EVMSmartWalletClient(EVMWalletClient, BaseWalletClient):
                 }]
             )
         
-        while True:
-            status = self._client.check_transaction_status(
+        status = self._client.waiter.wait(
+            lambda: self._client.check_transaction_status(
                 self._locator,
                 response["id"]
-            )
-            
-            if status["status"] in ["success", "failed"]:
-                return {
-                    "hash": status.get("onChain", {}).get("txId", ""),
-                    "status": status["status"]
-                }
-            
-            time.sleep(2)
+            ),
+            _is_settled,
+            description="transaction"
+        )
+        
+        return {
+            "hash": status.get("onChain", {}).get("txId", ""),
+            "status": status["status"]
+        }
+
+
+def _is_settled(status: Dict[str, Any]) -> bool:
+    return status["status"] in ["success", "failed"]
 
 
 def get_evm_locator(address: Optional[str] = None, linked_user: Optional[LinkedUser] = None) -> str:
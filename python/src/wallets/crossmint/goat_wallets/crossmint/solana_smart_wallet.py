@@ -1,4 +1,3 @@
-from time import sleep
 from typing import Dict, List, Optional, Any, TypedDict, Union
 import base58
 import base64
@@ -214,24 +213,23 @@ class SolanaSmartWalletClient(SolanaWalletClient, BaseWalletClient):
                 )
 
         # Wait for transaction success
-        while status["status"] != "success":
-            status = self._client.check_transaction_status(
-                self._locator,
-                transaction_id
+        if status["status"] != "success":
+            status = self._client.waiter.wait(
+                lambda: self._client.check_transaction_status(
+                    self._locator,
+                    transaction_id
+                ),
+                lambda status: status["status"] in ["success", "failed", "awaiting-approval"],
+                description="transaction"
             )
 
-            if status["status"] == "failed":
-                error = status.get("error", {})
-                raise ValueError(f"{error_prefix} failed: {error}")
-
-            if status["status"] == "awaiting-approval":
-                raise ValueError(
-                    f"{error_prefix} still awaiting approval after submission")
-
-            if status["status"] == "success":
-                break
+        if status["status"] == "failed":
+            error = status.get("error", {})
+            raise ValueError(f"{error_prefix} failed: {error}")
 
-            sleep(1)
+        if status["status"] == "awaiting-approval":
+            raise ValueError(
+                f"{error_prefix} still awaiting approval after submission")
 
         return status
 
@@ -0,0 +1,216 @@
+import asyncio
+import inspect
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Iterator, Optional, TypeVar, Union
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+
+class Waiter:
+    """Polls an operation until it reaches a terminal state.
+
+    Polls are spaced with exponential backoff and full jitter, bounded by a total timeout.
+    Subclass and override `intervals` (or pass a different `sleep`) to plug in another
+    schedule.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 0.5,
+        max_interval: float = 8.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.5,
+        timeout: Optional[float] = 120.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the waiter.
+
+        Args:
+            initial_interval: Delay before the second poll in seconds
+            max_interval: Upper bound for a single delay in seconds
+            multiplier: Factor applied to the delay after every poll
+            jitter: Fraction of each delay that is randomized (0 disables jitter)
+            timeout: Total time budget in seconds, or None to wait without a deadline
+            sleep: Blocking sleep function used by the synchronous variants
+        """
+        if initial_interval <= 0 or max_interval <= 0:
+            raise ValueError("Waiter intervals must be positive")
+        if multiplier < 1:
+            raise ValueError("Waiter multiplier must be at least 1")
+        if not 0 <= jitter <= 1:
+            raise ValueError("Waiter jitter must be between 0 and 1")
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.timeout = timeout
+        self.sleep = sleep
+
+    def intervals(self) -> Iterator[float]:
+        """Yield the delays to wait between successive polls."""
+        interval = self.initial_interval
+        while True:
+            yield interval * (1 - self.jitter * random.random())
+            interval = min(interval * self.multiplier, self.max_interval)
+
+    def wait(
+        self,
+        poll: Callable[[], T],
+        is_done: Callable[[T], bool],
+        description: str = "operation",
+        timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ) -> T:
+        """Block until `poll()` returns a value accepted by `is_done`.
+
+        Args:
+            poll: Function fetching the current state
+            is_done: Predicate returning True once the state is terminal
+            description: Name of the awaited operation, used in the timeout message
+            timeout: Overrides the waiter's total timeout for this call
+            max_attempts: Optional cap on the number of polls
+
+        Returns:
+            The first terminal state returned by `poll`
+
+        Raises:
+            TimeoutError: If the deadline or attempt cap is reached first
+        """
+        deadline = self._deadline(timeout)
+        intervals = self.intervals()
+        attempts = 0
+        while True:
+            result = poll()
+            attempts += 1
+            if is_done(result):
+                return result
+            delay = self._next_delay(intervals, deadline, attempts, max_attempts, description)
+            self.sleep(delay)
+
+    async def wait_async(
+        self,
+        poll: Callable[[], Union[T, Awaitable[T]]],
+        is_done: Callable[[T], bool],
+        description: str = "operation",
+        timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ) -> T:
+        """Async variant of `wait` that yields to the event loop between polls.
+
+        `poll` may be a coroutine function; a blocking `poll` is run in a worker thread.
+        """
+        deadline = self._deadline(timeout)
+        intervals = self.intervals()
+        attempts = 0
+        while True:
+            result = await _call_async(poll)
+            attempts += 1
+            if is_done(result):
+                return result
+            delay = self._next_delay(intervals, deadline, attempts, max_attempts, description)
+            await asyncio.sleep(delay)
+
+    def wait_many(
+        self,
+        keys: Iterable[K],
+        poll: Callable[[K], T],
+        is_done: Callable[[T], bool],
+        description: str = "operations",
+        timeout: Optional[float] = None,
+    ) -> Dict[K, T]:
+        """Wait for several operations in one polling loop.
+
+        Every round polls the keys that are still pending, then sleeps once.
+
+        Args:
+            keys: Identifiers of the operations to wait for
+            poll: Function fetching the current state of one operation
+            is_done: Predicate returning True once a state is terminal
+            description: Name of the awaited operations, used in the timeout message
+            timeout: Overrides the waiter's total timeout for this call
+
+        Returns:
+            Mapping of every key to its terminal state, in the order of `keys`
+
+        Raises:
+            TimeoutError: If some operations are still pending at the deadline
+        """
+        ordered = list(dict.fromkeys(keys))
+        pending = list(ordered)
+        results: Dict[K, T] = {}
+        deadline = self._deadline(timeout)
+        intervals = self.intervals()
+        attempts = 0
+        while pending:
+            for key in pending:
+                result = poll(key)
+                if is_done(result):
+                    results[key] = result
+            pending = [key for key in pending if key not in results]
+            attempts += 1
+            if not pending:
+                break
+            delay = self._next_delay(intervals, deadline, attempts, None, f"{len(pending)} {description}")
+            self.sleep(delay)
+        return {key: results[key] for key in ordered}
+
+    async def wait_many_async(
+        self,
+        keys: Iterable[K],
+        poll: Callable[[K], Union[T, Awaitable[T]]],
+        is_done: Callable[[T], bool],
+        description: str = "operations",
+        timeout: Optional[float] = None,
+    ) -> Dict[K, T]:
+        """Async variant of `wait_many`; the pending keys of a round are polled concurrently."""
+        ordered = list(dict.fromkeys(keys))
+        pending = list(ordered)
+        results: Dict[K, T] = {}
+        deadline = self._deadline(timeout)
+        intervals = self.intervals()
+        attempts = 0
+        while pending:
+            states = await asyncio.gather(*(_call_async(poll, key) for key in pending))
+            for key, result in zip(pending, states):
+                if is_done(result):
+                    results[key] = result
+            pending = [key for key in pending if key not in results]
+            attempts += 1
+            if not pending:
+                break
+            delay = self._next_delay(intervals, deadline, attempts, None, f"{len(pending)} {description}")
+            await asyncio.sleep(delay)
+        return {key: results[key] for key in ordered}
+
+    def _deadline(self, timeout: Optional[float]) -> Optional[float]:
+        budget = timeout if timeout is not None else self.timeout
+        return None if budget is None else time.monotonic() + budget
+
+    def _next_delay(
+        self,
+        intervals: Iterator[float],
+        deadline: Optional[float],
+        attempts: int,
+        max_attempts: Optional[int],
+        description: str,
+    ) -> float:
+        if max_attempts is not None and attempts >= max_attempts:
+            raise TimeoutError(f"Timed out waiting for {description}")
+        delay = next(intervals)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Timed out waiting for {description}")
+            delay = min(delay, remaining)
+        return delay
+
+
+async def _call_async(fn: Callable[..., Any], *args: Any) -> Any:
+    if inspect.iscoroutinefunction(fn):
+        return await fn(*args)
+    result = await asyncio.to_thread(fn, *args)
+    if inspect.isawaitable(result):
+        return await result
+    return result
@@ -128,3 +128,28 @@ def test_request_timeout_handling(custodial_api, test_email):
         )
     error_msg = str(exc.value).lower()
     assert any(msg in error_msg for msg in ["timeout", "timed out", "unreachable"])
+
+
+def test_session_reuses_pooled_adapter():
+    """Test that the client owns a keep-alive session with GET-only retries."""
+    api = CrossmintWalletsAPI(api_key="test", pool_maxsize=25)
+    adapter = api.session.get_adapter("https://staging.crossmint.com")
+    assert adapter._pool_maxsize == 25
+    assert "GET" in adapter.max_retries.allowed_methods
+    assert "POST" not in adapter.max_retries.allowed_methods
+    api.close()
+
+
+def test_shared_session_is_not_closed():
+    """Test that a caller-provided session outlives the client."""
+    class TrackingSession(requests.Session):
+        closed = False
+
+        def close(self):
+            self.closed = True
+            super().close()
+
+    session = TrackingSession()
+    with CrossmintWalletsAPI(api_key="test", session=session) as api:
+        assert api.session is session
+    assert not session.closed
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from goat_wallets.crossmint import CrossmintWalletsAPI, Waiter
+
+
+def _statuses(*values):
+    iterator = iter(values)
+    return lambda *_: {"status": next(iterator)}
+
+
+def _is_done(response):
+    return response["status"] in ["success", "failed"]
+
+
+def test_wait_backs_off_until_done():
+    delays = []
+    waiter = Waiter(initial_interval=1, max_interval=3, jitter=0, sleep=delays.append)
+    result = waiter.wait(_statuses("pending", "pending", "pending", "success"), _is_done)
+    assert result["status"] == "success"
+    assert delays == [1, 2, 3]
+
+
+def test_wait_raises_after_max_attempts():
+    waiter = Waiter(sleep=lambda _: None)
+    with pytest.raises(TimeoutError, match="Timed out waiting for signature"):
+        waiter.wait(lambda: {"status": "pending"}, _is_done, description="signature", max_attempts=3)
+
+
+def test_wait_many_polls_pending_keys_in_one_loop():
+    polls = []
+    statuses = {"a": _statuses("pending", "success"), "b": _statuses("failed")}
+
+    def poll(key):
+        polls.append(key)
+        return statuses[key]()
+
+    waiter = Waiter(jitter=0, sleep=lambda _: None)
+    results = waiter.wait_many(["a", "b"], poll, _is_done)
+    assert list(results) == ["a", "b"]
+    assert results["b"]["status"] == "failed"
+    assert polls == ["a", "b", "a"]
+
+
+def test_wait_async_yields_to_event_loop():
+    async def poll():
+        return {"status": "success"}
+
+    waiter = Waiter(initial_interval=0.01, timeout=1)
+    result = asyncio.run(waiter.wait_async(poll, _is_done))
+    assert result["status"] == "success"
+
+
+def test_wait_for_signatures_async_polls_every_signature():
+    polls = []
+    statuses = {"sig-a": _statuses("pending", "success"), "sig-b": _statuses("failed")}
+
+    def check_signature_status(signature_id, locator):
+        polls.append((signature_id, locator))
+        return statuses[signature_id]()
+
+    api = CrossmintWalletsAPI(api_key="test", waiter=Waiter(initial_interval=0.01, jitter=0, timeout=1))
+    api.check_signature_status = check_signature_status
+    results = asyncio.run(api.wait_for_signatures_async("wallet", ["sig-a", "sig-b"]))
+    api.close()
+    assert list(results) == ["sig-a", "sig-b"]
+    assert results["sig-a"]["status"] == "success"
+    assert sorted(polls) == [("sig-a", "wallet"), ("sig-a", "wallet"), ("sig-b", "wallet")]
@@ -1,11 +1,52 @@
-from .types import (
-    EVMTransaction, EVMReadRequest, EVMReadResult, EVMTypedData,
-    PaymasterOptions, EVMTransactionOptions, TypedDataDomain
+from typing import TYPE_CHECKING
+
+from goat.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .types import (
+        EVMTransaction, EVMReadRequest, EVMReadResult, EVMTypedData,
+        PaymasterOptions, EVMTransactionOptions, TypedDataDomain
+    )
+    from .evm_wallet_client import EVMWalletClient
+    from .async_evm_wallet_client import AsyncEVMWalletClient
+    from .evm_smart_wallet_client import EVMSmartWalletClient
+    from .tokens import USDC, PEPE, PREDEFINED_TOKENS, Token, DEFAULT_EVM_TOKEN_REGISTRY, build_evm_token_registry
+    from .abi import ERC20_ABI
+    from .nonce_manager import NonceManager, default_nonce_manager
+    from .encoding import EncoderCache, FunctionEncoder, ERC20_FUNCTIONS
+    from .multicall import Multicall3, MulticallUnavailableError, MULTICALL3_ADDRESS, MULTICALL3_ABI
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "EVMTransaction": ".types",
+        "EVMReadRequest": ".types",
+        "EVMReadResult": ".types",
+        "EVMTypedData": ".types",
+        "PaymasterOptions": ".types",
+        "EVMTransactionOptions": ".types",
+        "TypedDataDomain": ".types",
+        "EVMWalletClient": ".evm_wallet_client",
+        "AsyncEVMWalletClient": ".async_evm_wallet_client",
+        "EVMSmartWalletClient": ".evm_smart_wallet_client",
+        "USDC": ".tokens",
+        "PEPE": ".tokens",
+        "PREDEFINED_TOKENS": ".tokens",
+        "Token": ".tokens",
+        "DEFAULT_EVM_TOKEN_REGISTRY": ".tokens",
+        "build_evm_token_registry": ".tokens",
+        "ERC20_ABI": ".abi",
+        "NonceManager": ".nonce_manager",
+        "default_nonce_manager": ".nonce_manager",
+        "EncoderCache": ".encoding",
+        "FunctionEncoder": ".encoding",
+        "ERC20_FUNCTIONS": ".encoding",
+        "Multicall3": ".multicall",
+        "MulticallUnavailableError": ".multicall",
+        "MULTICALL3_ADDRESS": ".multicall",
+        "MULTICALL3_ABI": ".multicall",
+    },
 )
-from .evm_wallet_client import EVMWalletClient
-from .evm_smart_wallet_client import EVMSmartWalletClient
-from .tokens import USDC, PEPE, PREDEFINED_TOKENS, Token
-from .abi import ERC20_ABI
 
 __all__ = [
     "EVMTransaction",
@@ -13,6 +54,7 @@ __all__ = [
     "EVMReadResult",
     "EVMTypedData",
     "EVMWalletClient",
+    "AsyncEVMWalletClient",
     "EVMSmartWalletClient",
     "PaymasterOptions",
     "EVMTransactionOptions",
@@ -21,5 +63,16 @@ __all__ = [
     "PEPE",
     "PREDEFINED_TOKENS",
     "Token",
+    "DEFAULT_EVM_TOKEN_REGISTRY",
+    "build_evm_token_registry",
     "ERC20_ABI",
+    "NonceManager",
+    "default_nonce_manager",
+    "EncoderCache",
+    "FunctionEncoder",
+    "ERC20_FUNCTIONS",
+    "Multicall3",
+    "MulticallUnavailableError",
+    "MULTICALL3_ADDRESS",
+    "MULTICALL3_ABI",
 ]
@@ -0,0 +1,315 @@
+import asyncio
+import inspect
+import re
+from abc import ABC, abstractmethod
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional
+
+from goat.classes.tool_base import ToolBase, create_tool
+from goat.classes.wallet_client_base import Balance, Signature
+
+from .abi import ERC20_ABI
+from .evm_wallet_client import EVMWalletClient
+from .types import EVMTransaction, EVMReadRequest, EVMReadResult
+
+
+class AsyncEVMWalletClient(EVMWalletClient, ABC):
+    """Base class for EVM wallets whose chain calls are coroutines.
+
+    `read`, `read_many`, `balance_of`, `send_transaction`, `sign_typed_data` and the token
+    helpers built on them return awaitables, so a single event loop can drive many wallets
+    concurrently without a thread per call. `get_address`, `get_chain` and `sign_message` stay
+    synchronous: implementations learn the chain ID when they are created (see their async
+    factories) instead of asking the node on every call.
+
+    Plugins written against EVMWalletClient can support both flavours by awaiting the results
+    that are awaitable (see `goat.maybe_await`).
+    """
+
+    @abstractmethod
+    async def sign_typed_data(  # type: ignore[override]
+        self, types: Dict[str, Any], primary_type: str, domain: Dict[str, Any], value: Dict[str, Any]
+    ) -> Signature:
+        """Sign EIP-712 typed data with the wallet's private key."""
+        pass
+
+    @abstractmethod
+    async def send_transaction(self, transaction: EVMTransaction) -> Dict[str, str]:  # type: ignore[override]
+        """Send a transaction on the EVM chain."""
+        pass
+
+    @abstractmethod
+    async def read(self, request: EVMReadRequest) -> EVMReadResult:  # type: ignore[override]
+        """Read data from a smart contract."""
+        pass
+
+    async def read_many(self, requests: List[EVMReadRequest]) -> List[EVMReadResult]:  # type: ignore[override]
+        """Read data from several smart contract functions.
+
+        The default runs the reads concurrently; wallets backed by an RPC connection override
+        this to batch them into a single call.
+
+        Args:
+            requests: Read requests to execute
+
+        Returns:
+            One result per request, in order
+        """
+        return list(await asyncio.gather(*(self.read(request) for request in requests)))
+
+    @abstractmethod
+    async def get_native_balance(self) -> int:  # type: ignore[override]
+        """Get the native balance of the wallet in wei."""
+        pass
+
+    async def balance_of(self, address: str, token_address: Optional[str] = None) -> Balance:  # type: ignore[override]
+        """Get the balance of an address for native or ERC20 tokens.
+
+        Args:
+            address: The address to check
+            token_address: The ERC20 token address, or None for the native currency
+
+        Returns:
+            Balance information
+        """
+        chain = self.get_chain()
+
+        if token_address:
+            try:
+                chain_key = f"evm:{chain['id']}"
+                metadata = self.token_metadata_cache.get(chain_key, token_address.lower())
+                balance_request: EVMReadRequest = {
+                    "address": token_address,
+                    "abi": ERC20_ABI,
+                    "functionName": "balanceOf",
+                    "args": [address],
+                }
+
+                if metadata is not None and {"decimals", "name", "symbol"} <= metadata.keys():
+                    balance_result = await self.read(balance_request)
+                else:
+                    balance_result, decimals_result, name_result, symbol_result = await self.read_many([
+                        balance_request,
+                        {"address": token_address, "abi": ERC20_ABI, "functionName": "decimals", "args": []},
+                        {"address": token_address, "abi": ERC20_ABI, "functionName": "name", "args": []},
+                        {"address": token_address, "abi": ERC20_ABI, "functionName": "symbol", "args": []},
+                    ])
+                    metadata = self.token_metadata_cache.update(chain_key, token_address.lower(), {
+                        "decimals": int(decimals_result["value"]),
+                        "name": str(name_result["value"]),
+                        "symbol": str(symbol_result["value"]),
+                    })
+
+                balance_in_base_units = str(balance_result["value"])
+                return {
+                    "decimals": metadata["decimals"],
+                    "symbol": metadata["symbol"],
+                    "name": metadata["name"],
+                    "value": str(Decimal(balance_in_base_units) / (10 ** metadata["decimals"])),
+                    "in_base_units": balance_in_base_units,
+                }
+            except Exception as e:
+                raise ValueError(f"Failed to fetch token balance: {str(e)}")
+        else:
+            try:
+                balance_in_wei = await self.get_native_balance()
+                decimals = chain["nativeCurrency"]["decimals"]
+                return {
+                    "decimals": decimals,
+                    "symbol": chain["nativeCurrency"]["symbol"],
+                    "name": chain["nativeCurrency"]["name"],
+                    "value": str(Decimal(balance_in_wei) / (10 ** decimals)),
+                    "in_base_units": str(balance_in_wei),
+                }
+            except Exception as e:
+                raise ValueError(f"Failed to fetch native balance: {str(e)}")
+
+    async def _get_token_decimals(self, token_address: Optional[str] = None) -> int:  # type: ignore[override]
+        """Get the decimals for a token.
+
+        Args:
+            token_address: The token address, or None for native currency
+
+        Returns:
+            Number of decimals
+        """
+        if token_address:
+            try:
+                chain_key = f"evm:{self.get_chain()['id']}"
+                metadata = self.token_metadata_cache.get(chain_key, token_address.lower())
+                if metadata is not None and "decimals" in metadata:
+                    return metadata["decimals"]
+
+                decimals_result = await self.read({
+                    "address": token_address,
+                    "abi": ERC20_ABI,
+                    "functionName": "decimals",
+                    "args": []
+                })
+                decimals = int(decimals_result["value"])
+                self.token_metadata_cache.update(chain_key, token_address.lower(), {"decimals": decimals})
+                return decimals
+            except Exception as e:
+                raise ValueError(f"Failed to fetch token decimals: {str(e)}")
+
+        return self.get_chain()["nativeCurrency"]["decimals"]
+
+    async def convert_to_base_units(self, params: Dict[str, Any]) -> str:  # type: ignore[override]
+        """Convert a token amount to base units.
+
+        Args:
+            params: Parameters including amount and optional token address
+
+        Returns:
+            Amount in base units
+        """
+        amount = params["amount"]
+        try:
+            if not re.match(r'^[0-9]*\.?[0-9]+$', amount):
+                raise ValueError(f"Invalid amount format: {amount}")
+
+            decimals = await self._get_token_decimals(params.get("tokenAddress"))
+            return str(int(Decimal(amount) * (10 ** decimals)))
+        except Exception as e:
+            raise ValueError(f"Failed to convert to base units: {str(e)}")
+
+    async def convert_from_base_units(self, params: Dict[str, Any]) -> str:  # type: ignore[override]
+        """Convert a token amount from base units to decimal.
+
+        Args:
+            params: Parameters including amount and optional token address
+
+        Returns:
+            Human-readable amount
+        """
+        amount = params["amount"]
+        try:
+            if not re.match(r'^[0-9]+$', amount):
+                raise ValueError(f"Invalid base unit amount format: {amount}")
+
+            decimals = await self._get_token_decimals(params.get("tokenAddress"))
+            return str(Decimal(amount) / (10 ** decimals))
+        except Exception as e:
+            raise ValueError(f"Failed to convert from base units: {str(e)}")
+
+    async def send_token(self, params: Dict[str, Any]) -> Dict[str, str]:  # type: ignore[override]
+        """Send tokens (native or ERC20).
+
+        Args:
+            params: Parameters including recipient, amount, and optional token address
+
+        Returns:
+            Transaction receipt
+        """
+        if not self.enable_send:
+            raise ValueError("Sending tokens is disabled for this wallet")
+
+        recipient = params["recipient"]
+        amount_in_base_units = params["amountInBaseUnits"]
+        token_address = params.get("tokenAddress")
+
+        try:
+            if token_address:
+                return await self.send_transaction({
+                    "to": token_address,
+                    "abi": ERC20_ABI,
+                    "functionName": "transfer",
+                    "args": [recipient, int(amount_in_base_units)],
+                })
+            return await self.send_transaction({
+                "to": recipient,
+                "value": int(amount_in_base_units),
+            })
+        except Exception as e:
+            raise ValueError(f"Failed to send token: {str(e)}")
+
+    async def get_token_allowance(self, params: Dict[str, Any]) -> str:  # type: ignore[override]
+        """Get the allowance of an ERC20 token for a spender.
+
+        Args:
+            params: Parameters including token address, owner, and spender
+
+        Returns:
+            Allowance in base units
+        """
+        try:
+            allowance_result = await self.read({
+                "address": params["tokenAddress"],
+                "abi": ERC20_ABI,
+                "functionName": "allowance",
+                "args": [params["owner"], params["spender"]],
+            })
+            return str(allowance_result["value"])
+        except Exception as e:
+            raise ValueError(f"Failed to fetch allowance: {str(e)}")
+
+    async def approve(self, params: Dict[str, Any]) -> Dict[str, str]:  # type: ignore[override]
+        """Approve a spender to spend ERC20 tokens.
+
+        Args:
+            params: Parameters including token address, spender, and amount
+
+        Returns:
+            Transaction receipt
+        """
+        if not self.enable_send:
+            raise ValueError("Approval operations are disabled for this wallet")
+
+        amount = params["amount"]
+        try:
+            if not re.match(r'^[0-9]+$', amount):
+                raise ValueError(f"Invalid base unit amount format: {amount}")
+
+            return await self.send_transaction({
+                "to": params["tokenAddress"],
+                "abi": ERC20_ABI,
+                "functionName": "approve",
+                "args": [params["spender"], int(amount)],
+            })
+        except Exception as e:
+            raise ValueError(f"Failed to approve: {str(e)}")
+
+    async def revoke_approval(self, params: Dict[str, Any]) -> Dict[str, str]:  # type: ignore[override]
+        """Revoke approval for an ERC20 token from a spender.
+
+        Args:
+            params: Parameters including token address and spender
+
+        Returns:
+            Transaction receipt
+        """
+        return await self.approve({
+            "tokenAddress": params["tokenAddress"],
+            "spender": params["spender"],
+            "amount": "0",
+        })
+
+    def get_core_tools(self) -> List[ToolBase]:
+        """Get the core tools for this wallet client.
+
+        The tools are the ones of EVMWalletClient, except that `execute_async` awaits the
+        wallet's coroutines on the caller's event loop instead of going through a worker thread.
+
+        Returns:
+            List of tool definitions
+        """
+        return [
+            create_tool(
+                {"name": tool.name, "description": tool.description, "parameters": tool.parameters},
+                tool._execute_fn,  # type: ignore[attr-defined]
+                _awaiting(tool._execute_fn),  # type: ignore[attr-defined]
+            )
+            for tool in super().get_core_tools()
+        ]
+
+
+def _awaiting(fn: Callable[[Dict[str, Any]], Any]) -> Callable[[Dict[str, Any]], Any]:
+    # The core tool functions only call coroutine methods or non-blocking getters, so calling
+    # them on the loop is safe; the coroutine they return is awaited there as well
+    async def run(params: Dict[str, Any]) -> Any:
+        result = fn(params)
+        if inspect.isawaitable(result):
+            return await result
+        return result
+
+    return run
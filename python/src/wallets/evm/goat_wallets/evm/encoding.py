@@ -0,0 +1,177 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# The ERC-20 functions encoded without web3's contract machinery: name -> (selector, inputs, outputs)
+ERC20_FUNCTIONS: Dict[str, Tuple[bytes, Tuple[str, ...], Tuple[str, ...]]] = {
+    "transfer": (bytes.fromhex("a9059cbb"), ("address", "uint256"), ("bool",)),
+    "approve": (bytes.fromhex("095ea7b3"), ("address", "uint256"), ("bool",)),
+    "balanceOf": (bytes.fromhex("70a08231"), ("address",), ("uint256",)),
+    "allowance": (bytes.fromhex("dd62ed3e"), ("address", "address"), ("uint256",)),
+}
+
+EncoderKey = Tuple[str, str, str]
+
+
+class FunctionEncoder:
+    """Encodes calls to one function of a contract.
+
+    Calls to the standard ERC-20 functions with checksummed address and integer arguments are
+    ABI-encoded directly from their selector; other calls go through a web3 contract built once
+    for the encoder, so they are validated and encoded exactly as web3 does.
+    """
+
+    def __init__(self, web3: Any, address: str, abi: List[Dict[str, Any]], function_name: str):
+        """Prepare the encoder.
+
+        Args:
+            web3: A web3.Web3 instance. Calls are only made through it by `call`
+            address: Checksummed address of the contract
+            abi: ABI of the contract
+            function_name: Name of the function
+        """
+        self._web3 = web3
+        self.address = address
+        self.function_name = function_name
+        self._abi = abi
+        self._erc20 = _match_erc20_function(abi, function_name)
+        self._contract: Any = None
+
+    def encode(self, args: Sequence[Any] = ()) -> str:
+        """Encode the calldata of a call.
+
+        Args:
+            args: The function arguments
+
+        Returns:
+            The 0x-prefixed calldata
+        """
+        if self._is_direct(args):
+            from eth_abi import encode
+
+            selector, inputs, _ = self._erc20  # type: ignore[misc]
+            return "0x" + (selector + encode(list(inputs), list(args))).hex()
+        contract = self._web3_contract()
+        # web3 v7 renamed encodeABI to encode_abi
+        encode_abi = getattr(contract, "encode_abi", None) or contract.encodeABI
+        return encode_abi(self.function_name, args=list(args))
+
+    def call(self, args: Sequence[Any] = ()) -> Any:
+        """Call the function with `eth_call` and decode its result as web3 contract calls do.
+
+        Args:
+            args: The function arguments
+
+        Returns:
+            The decoded result
+        """
+        if not self._is_direct(args):
+            return getattr(self._web3_contract().functions, self.function_name)(*args).call()
+
+        from eth_abi import decode
+        from web3.exceptions import BadFunctionCallOutput
+
+        data = self._web3.eth.call({"to": self.address, "data": self.encode(args)})
+        if not data:
+            raise BadFunctionCallOutput(
+                f"Could not decode {self.function_name} output: {self.address} returned no data"
+            )
+        (value,) = decode(list(self._erc20[2]), bytes(data))  # type: ignore[index]
+        return value
+
+    def _is_direct(self, args: Sequence[Any]) -> bool:
+        # Arguments web3 would normalize or reject, like ENS names or addresses without a valid
+        # checksum, take the web3 path
+        if self._erc20 is None:
+            return False
+        from eth_utils.address import is_checksum_address
+
+        return len(args) == len(self._erc20[1]) and all(
+            is_checksum_address(arg) if abi_type == "address" else isinstance(arg, int) and not isinstance(arg, bool)
+            for abi_type, arg in zip(self._erc20[1], args)
+        )
+
+    def _web3_contract(self) -> Any:
+        if self._contract is None:
+            self._contract = self._web3.eth.contract(address=self.address, abi=self._abi)
+        return self._contract
+
+
+class EncoderCache:
+    """LRU cache of FunctionEncoders keyed on (ABI hash, contract address, function name).
+
+    Building a web3 contract parses its whole ABI, so wallets reuse encoders across calls. ABIs
+    are hashed once per ABI object and must not be mutated after their first use.
+    """
+
+    def __init__(self, web3: Any, max_entries: int = 256):
+        """Initialize the cache.
+
+        Args:
+            web3: The web3.Web3 instance encoders make their calls with
+            max_entries: Maximum number of encoders kept
+        """
+        self._web3 = web3
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[EncoderKey, FunctionEncoder]" = OrderedDict()
+        # id(abi) -> (abi, hash). Holding the ABI keeps its id from being reused
+        self._abi_hashes: Dict[int, Tuple[List[Dict[str, Any]], str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, address: str, abi: List[Dict[str, Any]], function_name: str) -> FunctionEncoder:
+        """Return the encoder of a contract function, preparing it on a miss.
+
+        Args:
+            address: Checksummed address of the contract
+            abi: ABI of the contract
+            function_name: Name of the function
+
+        Returns:
+            The function encoder
+        """
+        key = (self._abi_hash(abi), address, function_name)
+        with self._lock:
+            encoder = self._entries.get(key)
+            if encoder is not None:
+                self._entries.move_to_end(key)
+                return encoder
+
+        encoder = FunctionEncoder(self._web3, address, abi, function_name)
+        with self._lock:
+            self._entries[key] = encoder
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return encoder
+
+    def _abi_hash(self, abi: List[Dict[str, Any]]) -> str:
+        cached = self._abi_hashes.get(id(abi))
+        if cached is not None and cached[0] is abi:
+            return cached[1]
+        abi_hash = hashlib.sha256(json.dumps(abi, sort_keys=True).encode()).hexdigest()
+        with self._lock:
+            if len(self._abi_hashes) >= self.max_entries:
+                self._abi_hashes.clear()
+            self._abi_hashes[id(abi)] = (abi, abi_hash)
+        return abi_hash
+
+
+def _match_erc20_function(
+    abi: List[Dict[str, Any]], function_name: str
+) -> Optional[Tuple[bytes, Tuple[str, ...], Tuple[str, ...]]]:
+    # Only take the direct path when the ABI declares exactly the standard, non-overloaded function
+    standard = ERC20_FUNCTIONS.get(function_name)
+    if standard is None:
+        return None
+    entries = [
+        entry for entry in abi if entry.get("type", "function") == "function" and entry.get("name") == function_name
+    ]
+    if len(entries) != 1:
+        return None
+    inputs = tuple(item.get("type") for item in entries[0].get("inputs", []))
+    outputs = tuple(item.get("type") for item in entries[0].get("outputs", []))
+    if (inputs, outputs) != standard[1:]:
+        return None
+    return standard
@@ -6,9 +6,11 @@ import re
 from goat.classes.wallet_client_base import Balance, Signature, WalletClientBase
 from goat.types.chain import EvmChain
 from goat.classes.tool_base import ToolBase, create_tool
+from goat.classes.token_metadata_cache import TokenMetadataCache, default_token_metadata_cache
+from goat.classes.token_registry import TokenRegistry
 
 from .abi import ERC20_ABI
-from .tokens import PREDEFINED_TOKENS
+from .tokens import PREDEFINED_TOKENS, DEFAULT_EVM_TOKEN_REGISTRY, build_evm_token_registry
 from .types import EVMTransaction, EVMReadRequest, EVMReadResult
 from .params import (
     GetBalanceParameters,
@@ -30,16 +32,31 @@ class EVMOptions:
 class EVMWalletClient(WalletClientBase, ABC):
     """Base class for EVM wallet implementations."""
 
-    def __init__(self, tokens=None, enable_send=True):
+    def __init__(
+        self,
+        tokens=None,
+        enable_send=True,
+        token_metadata_cache: Optional[TokenMetadataCache] = None,
+        token_registry: Optional[TokenRegistry] = None,
+    ):
         """Initialize the EVM wallet client.
         
         Args:
             tokens: List of token configurations
             enable_send: Whether to enable send functionality
+            token_metadata_cache: Cache for ERC20 name, symbol and decimals. Defaults to the process-wide cache
+            token_registry: Prebuilt token index to share between wallets. Takes precedence over tokens
         """
         WalletClientBase.__init__(self)
         self.tokens = tokens or PREDEFINED_TOKENS
+        if token_registry is not None:
+            self.token_registry = token_registry
+        elif tokens:
+            self.token_registry = build_evm_token_registry(tokens)
+        else:
+            self.token_registry = DEFAULT_EVM_TOKEN_REGISTRY
         self.enable_send = enable_send
+        self.token_metadata_cache = token_metadata_cache or default_token_metadata_cache()
 
     def get_chain(self) -> EvmChain:
         """Get the chain type for EVM."""
@@ -84,6 +101,20 @@ class EVMWalletClient(WalletClientBase, ABC):
         """Read data from a smart contract."""
         pass
 
+    def read_many(self, requests: List[EVMReadRequest]) -> List[EVMReadResult]:
+        """Read data from several smart contract functions.
+
+        Wallets backed by an RPC connection override this to batch the reads into a
+        single call; the default reads sequentially.
+
+        Args:
+            requests: Read requests to execute
+
+        Returns:
+            One result per request, in order
+        """
+        return [self.read(request) for request in requests]
+
     @abstractmethod
     def get_native_balance(self) -> int:
         """Get the native balance of the wallet in wei."""
@@ -102,38 +133,38 @@ class EVMWalletClient(WalletClientBase, ABC):
         
         if token_address:
             try:
-                balance_result = self.read({
-                    "address": token_address,
-                    "abi": ERC20_ABI,
-                    "functionName": "balanceOf",
-                    "args": [address],
-                })
-                
-                decimals_result = self.read({
-                    "address": token_address,
-                    "abi": ERC20_ABI,
-                    "functionName": "decimals",
-                    "args": []
-                })
+                chain_key = f"evm:{chain['id']}"
+                metadata = self.token_metadata_cache.get(chain_key, token_address.lower())
                 
-                name_result = self.read({
-                    "address": token_address,
-                    "abi": ERC20_ABI,
-                    "functionName": "name",
-                    "args": []
-                })
-                
-                symbol_result = self.read({
-                    "address": token_address,
-                    "abi": ERC20_ABI,
-                    "functionName": "symbol",
-                    "args": []
-                })
+                if metadata is not None and {"decimals", "name", "symbol"} <= metadata.keys():
+                    balance_result = self.read({
+                        "address": token_address,
+                        "abi": ERC20_ABI,
+                        "functionName": "balanceOf",
+                        "args": [address],
+                    })
+                else:
+                    balance_result, decimals_result, name_result, symbol_result = self.read_many([
+                        {
+                            "address": token_address,
+                            "abi": ERC20_ABI,
+                            "functionName": "balanceOf",
+                            "args": [address],
+                        },
+                        {"address": token_address, "abi": ERC20_ABI, "functionName": "decimals", "args": []},
+                        {"address": token_address, "abi": ERC20_ABI, "functionName": "name", "args": []},
+                        {"address": token_address, "abi": ERC20_ABI, "functionName": "symbol", "args": []},
+                    ])
+                    metadata = self.token_metadata_cache.update(chain_key, token_address.lower(), {
+                        "decimals": int(decimals_result["value"]),
+                        "name": str(name_result["value"]),
+                        "symbol": str(symbol_result["value"]),
+                    })
                 
                 balance_in_base_units = str(balance_result["value"])
-                token_decimals = int(decimals_result["value"])
-                token_name = str(name_result["value"])
-                token_symbol = str(symbol_result["value"])
+                token_decimals = metadata["decimals"]
+                token_name = metadata["name"]
+                token_symbol = metadata["symbol"]
                 
                 balance_value = str(Decimal(balance_in_base_units) / (10 ** token_decimals))
                 
@@ -175,16 +206,16 @@ class EVMWalletClient(WalletClientBase, ABC):
         chain_id = chain["id"]
         upper_ticker = ticker.upper()
         
-        for token in self.tokens:
-            if token["symbol"].upper() == upper_ticker:
-                if chain_id in token["chains"]:
-                    return {
-                        "symbol": token["symbol"],
-                        "contractAddress": token["chains"][chain_id]["contractAddress"],
-                        "decimals": token["decimals"],
-                        "name": token["name"],
-                    }
-                raise ValueError(f"Token {ticker} not configured for chain {chain_id}")
+        token = self.token_registry.get_by_ticker(chain_id, upper_ticker)
+        if token is not None:
+            return {
+                "symbol": token["symbol"],
+                "contractAddress": token["address"],
+                "decimals": token["decimals"],
+                "name": token["name"],
+            }
+        if self.token_registry.get_chains_for_ticker(upper_ticker):
+            raise ValueError(f"Token {ticker} not configured for chain {chain_id}")
         
         if upper_ticker == chain["nativeCurrency"]["symbol"].upper() or upper_ticker == "ETH":
             return {
@@ -207,13 +238,20 @@ class EVMWalletClient(WalletClientBase, ABC):
         """
         if token_address:
             try:
+                chain_key = f"evm:{self.get_chain()['id']}"
+                metadata = self.token_metadata_cache.get(chain_key, token_address.lower())
+                if metadata is not None and "decimals" in metadata:
+                    return metadata["decimals"]
+                
                 decimals_result = self.read({
                     "address": token_address,
                     "abi": ERC20_ABI,
                     "functionName": "decimals",
                     "args": []
                 })
-                return int(decimals_result["value"])
+                decimals = int(decimals_result["value"])
+                self.token_metadata_cache.update(chain_key, token_address.lower(), {"decimals": decimals})
+                return decimals
             except Exception as e:
                 raise ValueError(f"Failed to fetch token decimals: {str(e)}")
         
@@ -0,0 +1,189 @@
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .encoding import EncoderCache
+from .types import EVMReadRequest, EVMReadResult
+
+# Multicall3 is deployed at the same address on most EVM chains: https://www.multicall3.com
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    }
+]
+
+
+class MulticallUnavailableError(Exception):
+    """Raised when the Multicall3 contract cannot be used on the connected chain."""
+
+
+class Multicall3:
+    """Batches contract reads into a single `eth_call` to the Multicall3 contract.
+
+    Once the contract turns out to be missing on the connected chain, later batches go
+    straight to the fallback reader.
+    """
+
+    def __init__(self, web3: Any, address: str = MULTICALL3_ADDRESS, encoders: Optional[EncoderCache] = None):
+        """Initialize the batcher.
+
+        Args:
+            web3: A connected web3.Web3 instance, or a web3.AsyncWeb3 instance for `read_many_async`
+            address: Address of the Multicall3 contract
+            encoders: Encoder cache to share with the wallet. Defaults to one owned by the batcher
+        """
+        self._web3 = web3
+        self._encoders = encoders or EncoderCache(web3)
+        self._contract = web3.eth.contract(address=web3.to_checksum_address(address), abi=MULTICALL3_ABI)
+        self.available = True
+
+    def read_many(
+        self,
+        requests: List[EVMReadRequest],
+        fallback: Optional[Callable[[List[EVMReadRequest]], List[EVMReadResult]]] = None,
+    ) -> List[EVMReadResult]:
+        """Execute read requests in one round trip.
+
+        Args:
+            requests: Read requests with checksummed addresses
+            fallback: Reader used when Multicall3 is unavailable. Without it, the error is raised
+
+        Returns:
+            One result per request, in order
+
+        Raises:
+            MulticallUnavailableError: If Multicall3 is unavailable and no fallback is given
+            ValueError: If one of the batched calls reverts
+        """
+        if self.available:
+            try:
+                return self._aggregate(requests)
+            except MulticallUnavailableError:
+                self.available = False
+                if fallback is None:
+                    raise
+        if fallback is None:
+            raise MulticallUnavailableError("Multicall3 is not available on this chain")
+        return fallback(requests)
+
+    async def read_many_async(
+        self,
+        requests: List[EVMReadRequest],
+        fallback: Optional[Callable[[List[EVMReadRequest]], Awaitable[List[EVMReadResult]]]] = None,
+    ) -> List[EVMReadResult]:
+        """Async variant of `read_many` for batchers created with a web3.AsyncWeb3 instance.
+
+        Args:
+            requests: Read requests with checksummed addresses
+            fallback: Coroutine function reading the requests when Multicall3 is unavailable
+
+        Returns:
+            One result per request, in order
+        """
+        if self.available:
+            try:
+                return await self._aggregate_async(requests)
+            except MulticallUnavailableError:
+                self.available = False
+                if fallback is None:
+                    raise
+        if fallback is None:
+            raise MulticallUnavailableError("Multicall3 is not available on this chain")
+        return await fallback(requests)
+
+    def _aggregate(self, requests: List[EVMReadRequest]) -> List[EVMReadResult]:
+        from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+
+        calls, output_types = self._encode_calls(requests)
+        try:
+            results = self._contract.functions.aggregate3(calls).call()
+        except (BadFunctionCallOutput, ContractLogicError) as e:
+            # No contract (empty return data) or a reverting contract at the Multicall3 address
+            raise MulticallUnavailableError(f"Multicall3 call failed: {e}") from e
+        return self._decode_results(requests, output_types, results)
+
+    async def _aggregate_async(self, requests: List[EVMReadRequest]) -> List[EVMReadResult]:
+        from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+
+        calls, output_types = self._encode_calls(requests)
+        try:
+            results = await self._contract.functions.aggregate3(calls).call()
+        except (BadFunctionCallOutput, ContractLogicError) as e:
+            raise MulticallUnavailableError(f"Multicall3 call failed: {e}") from e
+        return self._decode_results(requests, output_types, results)
+
+    def _encode_calls(self, requests: List[EVMReadRequest]) -> Tuple[List[Tuple[str, bool, Any]], List[Any]]:
+        calls = []
+        output_types = []
+        for request in requests:
+            abi_entry = _find_function_abi(request)
+            encoder = self._encoders.get(request["address"], request["abi"], request["functionName"])
+            call_data = encoder.encode(request.get("args", []))
+            calls.append((request["address"], True, call_data))
+            output_types.append(abi_entry.get("outputs", []))
+        return calls, output_types
+
+    def _decode_results(
+        self, requests: List[EVMReadRequest], output_types: List[Any], results: List[Any]
+    ) -> List[EVMReadResult]:
+        if len(results) != len(requests):
+            raise MulticallUnavailableError("Multicall3 returned an unexpected number of results")
+
+        values: List[EVMReadResult] = []
+        for request, outputs, (success, return_data) in zip(requests, output_types, results):
+            if not success:
+                raise ValueError(f"Call to {request['functionName']} on {request['address']} reverted")
+            try:
+                values.append({"value": self._decode(outputs, return_data)})
+            except Exception as e:
+                raise ValueError(
+                    f"Failed to decode {request['functionName']} result from {request['address']}: {e}"
+                ) from e
+        return values
+
+    def _decode(self, outputs: List[Dict[str, Any]], data: bytes) -> Any:
+        from eth_utils.abi import collapse_if_tuple
+
+        types = [collapse_if_tuple(output) for output in outputs]
+        decoded = [
+            self._web3.to_checksum_address(value) if abi_type == "address" else value
+            for abi_type, value in zip(types, self._web3.codec.decode(types, data))
+        ]
+        if len(decoded) == 1:
+            return decoded[0]
+        return decoded
+
+
+def _find_function_abi(request: EVMReadRequest) -> Dict[str, Any]:
+    args = request.get("args", [])
+    for entry in request["abi"]:
+        if (
+            entry.get("type", "function") == "function"
+            and entry.get("name") == request["functionName"]
+            and len(entry.get("inputs", [])) == len(args)
+        ):
+            return entry
+    raise ValueError(f"Function {request['functionName']} not found in ABI")
@@ -0,0 +1,100 @@
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+NonceKey = Tuple[int, str]
+
+
+class NonceManager:
+    """Hands out transaction nonces per account without asking the node for every send.
+
+    The first nonce of an account is read from the node (its pending transaction count); later
+    ones are counted up locally, so several transactions from one account can be in flight at
+    once. Reservations are thread-safe; the node is read outside the manager's lock, so only
+    reservations for the same account wait on it.
+
+    When a send fails, call `release`: if the failed nonce is the last one handed out it is
+    reused, otherwise the account is resynced from the node on its next reservation, which also
+    recovers from nonces used by other processes.
+    """
+
+    def __init__(self):
+        self._next: Dict[NonceKey, int] = {}
+        self._lock = threading.Lock()
+        # Serializes the node reads of each account, so concurrent first reservations fetch once
+        self._fetch_locks: Dict[NonceKey, threading.Lock] = {}
+
+    def reserve(self, chain_id: int, address: str, fetch_nonce: Callable[[], int]) -> int:
+        """Reserve the next nonce of an account.
+
+        Args:
+            chain_id: The chain the transaction is sent on
+            address: The sending account
+            fetch_nonce: Reads the account's pending transaction count from the node. Only
+                called for accounts the manager does not track yet, or after a resync
+
+        Returns:
+            The nonce to use
+        """
+        key = (chain_id, address.lower())
+        with self._lock:
+            nonce = self._take(key)
+            if nonce is not None:
+                return nonce
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+
+        with fetch_lock:
+            with self._lock:
+                # Another thread may have fetched the nonce while this one waited
+                nonce = self._take(key)
+                if nonce is not None:
+                    return nonce
+            nonce = fetch_nonce()
+            with self._lock:
+                self._next[key] = nonce + 1
+            return nonce
+
+    def _take(self, key: NonceKey) -> Optional[int]:
+        # Called with the lock held
+        nonce = self._next.get(key)
+        if nonce is not None:
+            self._next[key] = nonce + 1
+        return nonce
+
+    def release(self, chain_id: int, address: str, nonce: int) -> None:
+        """Give back a reserved nonce whose transaction was not sent.
+
+        Args:
+            chain_id: The chain the transaction was meant for
+            address: The sending account
+            nonce: The nonce returned by `reserve`
+        """
+        key = (chain_id, address.lower())
+        with self._lock:
+            if self._next.get(key) == nonce + 1:
+                self._next[key] = nonce
+            else:
+                # Later nonces are already handed out, so this one would leave a gap
+                self._next.pop(key, None)
+
+    def resync(self, chain_id: int, address: str) -> None:
+        """Forget the local nonce of an account so the next reservation reads it from the node.
+
+        Args:
+            chain_id: The chain of the account
+            address: The account
+        """
+        with self._lock:
+            self._next.pop((chain_id, address.lower()), None)
+
+
+_default_nonce_manager: Optional[NonceManager] = None
+_default_nonce_manager_lock = threading.Lock()
+
+
+def default_nonce_manager() -> NonceManager:
+    """Return the process-wide NonceManager shared by wallets that do not get their own."""
+    global _default_nonce_manager
+    with _default_nonce_manager_lock:
+        if _default_nonce_manager is None:
+            _default_nonce_manager = NonceManager()
+        return _default_nonce_manager
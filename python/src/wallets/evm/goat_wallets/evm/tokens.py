@@ -1,6 +1,7 @@
 from typing import Dict, List, TypedDict, Literal, Optional
 
 from goat.types.token import Token as CoreToken
+from goat.classes.token_registry import TokenRegistry
 
 class TokenChainInfo(TypedDict):
     contractAddress: str
@@ -32,3 +33,25 @@ PEPE: Token = {
 }
 
 PREDEFINED_TOKENS: List[Token] = [USDC, PEPE]
+
+
+def build_evm_token_registry(tokens: List[Token]) -> TokenRegistry:
+    """Index a list of EVM token configurations by chain id, ticker and contract address."""
+    return TokenRegistry(
+        (
+            {
+                "chain": chain_id,
+                "address": chain_info["contractAddress"],
+                "symbol": token["symbol"],
+                "name": token["name"],
+                "decimals": token["decimals"],
+            }
+            for token in tokens
+            for chain_id, chain_info in token["chains"].items()
+        ),
+        case_sensitive_addresses=False,
+    )
+
+
+# Shared by every wallet client that uses the predefined tokens
+DEFAULT_EVM_TOKEN_REGISTRY = build_evm_token_registry(PREDEFINED_TOKENS)
@@ -0,0 +1,93 @@
+import copy
+
+import pytest
+
+web3 = pytest.importorskip("web3")
+
+from web3.exceptions import InvalidAddress  # noqa: E402
+
+from goat_wallets.evm import ERC20_FUNCTIONS, EncoderCache, FunctionEncoder  # noqa: E402
+
+TOKEN = web3.Web3.to_checksum_address("0x" + "cd" * 20)
+OWNER = web3.Web3.to_checksum_address("0x" + "ab" * 20)
+
+
+def _function(name, inputs, outputs):
+    return {
+        "type": "function",
+        "name": name,
+        "stateMutability": "nonpayable",
+        "inputs": [{"name": f"arg{i}", "type": t} for i, t in enumerate(inputs)],
+        "outputs": [{"name": "", "type": t} for t in outputs],
+    }
+
+
+ERC20_ABI = [_function(name, inputs, outputs) for name, (_, inputs, outputs) in ERC20_FUNCTIONS.items()] + [
+    _function("decimals", (), ("uint8",))
+]
+
+
+def _web3_encode(w3, abi, function_name, args):
+    contract = w3.eth.contract(address=TOKEN, abi=abi)
+    return (getattr(contract, "encode_abi", None) or contract.encodeABI)(function_name, args=args)
+
+
+@pytest.fixture
+def w3():
+    return web3.Web3()
+
+
+@pytest.mark.parametrize(
+    "function_name, args",
+    [
+        ("transfer", [OWNER, 10**18]),
+        ("approve", [OWNER, 2**256 - 1]),
+        ("balanceOf", [OWNER]),
+        ("allowance", [OWNER, TOKEN]),
+    ],
+)
+def test_direct_encoding_matches_web3(w3, function_name, args):
+    encoder = FunctionEncoder(w3, TOKEN, ERC20_ABI, function_name)
+    assert encoder._is_direct(args)
+    assert encoder.encode(args) == _web3_encode(w3, ERC20_ABI, function_name, args)
+
+
+def test_other_functions_are_encoded_by_web3(w3):
+    encoder = FunctionEncoder(w3, TOKEN, ERC20_ABI, "decimals")
+    assert not encoder._is_direct([])
+    assert encoder.encode() == "0x313ce567"
+
+
+@pytest.mark.parametrize("address", [OWNER.lower(), "0x" + "AB" * 20, OWNER[:-1] + OWNER[-1].swapcase()])
+def test_addresses_without_a_valid_checksum_are_rejected_like_web3(w3, address):
+    encoder = FunctionEncoder(w3, TOKEN, ERC20_ABI, "transfer")
+    assert not encoder._is_direct([address, 1])
+    with pytest.raises(InvalidAddress):
+        encoder.encode([address, 1])
+
+
+def test_non_standard_signatures_are_encoded_by_web3(w3):
+    abi = [_function("transfer", ("address", "uint256", "bytes"), ("bool",))]
+    encoder = FunctionEncoder(w3, TOKEN, abi, "transfer")
+    assert not encoder._is_direct([OWNER, 1, b""])
+    assert encoder.encode([OWNER, 1, b""]) == _web3_encode(w3, abi, "transfer", [OWNER, 1, b""])
+
+
+def test_cache_reuses_encoders_per_abi_address_and_function(w3):
+    cache = EncoderCache(w3)
+    encoder = cache.get(TOKEN, ERC20_ABI, "transfer")
+    assert cache.get(TOKEN, ERC20_ABI, "transfer") is encoder
+    # ABIs are keyed by content, not identity
+    assert cache.get(TOKEN, copy.deepcopy(ERC20_ABI), "transfer") is encoder
+    assert cache.get(OWNER, ERC20_ABI, "transfer") is not encoder
+    assert cache.get(TOKEN, ERC20_ABI, "approve") is not encoder
+
+
+def test_cache_evicts_least_recently_used_encoders(w3):
+    cache = EncoderCache(w3, max_entries=2)
+    transfer = cache.get(TOKEN, ERC20_ABI, "transfer")
+    approve = cache.get(TOKEN, ERC20_ABI, "approve")
+    assert cache.get(TOKEN, ERC20_ABI, "transfer") is transfer
+    cache.get(TOKEN, ERC20_ABI, "balanceOf")
+    assert cache.get(TOKEN, ERC20_ABI, "transfer") is transfer
+    assert cache.get(TOKEN, ERC20_ABI, "approve") is not approve
@@ -0,0 +1,148 @@
+from typing import Any, Callable, Dict, List
+
+import pytest
+
+web3 = pytest.importorskip("web3")
+
+from eth_abi import decode, encode  # noqa: E402
+from web3.providers.base import BaseProvider  # noqa: E402
+
+from goat_wallets.evm import MULTICALL3_ADDRESS, Multicall3, MulticallUnavailableError  # noqa: E402
+
+TOKEN = web3.Web3.to_checksum_address("0x" + "cd" * 20)
+OWNER = web3.Web3.to_checksum_address("0x" + "ab" * 20)
+
+ABI = [
+    {
+        "type": "function",
+        "name": "balanceOf",
+        "inputs": [{"name": "owner", "type": "address"}],
+        "outputs": [{"name": "", "type": "uint256"}],
+    },
+    {"type": "function", "name": "decimals", "inputs": [], "outputs": [{"name": "", "type": "uint8"}]},
+    {"type": "function", "name": "owner", "inputs": [], "outputs": [{"name": "", "type": "address"}]},
+    {
+        "type": "function",
+        "name": "reserves",
+        "inputs": [],
+        "outputs": [{"name": "a", "type": "uint112"}, {"name": "b", "type": "uint112"}],
+    },
+]
+
+# Return data of each function when called through the fake Multicall3 contract
+RETURN_DATA = {
+    "70a08231": encode(["uint256"], [10**18]),
+    "313ce567": encode(["uint8"], [6]),
+    "8da5cb5b": encode(["address"], [OWNER.lower()]),
+    "75172a8b": encode(["uint112", "uint112"], [1, 2]),
+}
+
+
+class FakeCallProvider(BaseProvider):
+    """Answers eth_call requests with a handler taking the call's `to` and calldata."""
+
+    def __init__(self, handle_call: Callable[[str, bytes], Any], code: str = "0x6080"):
+        super().__init__()
+        self.handle_call = handle_call
+        self.code = code
+        self.calls: List[Dict[str, Any]] = []
+
+    def make_request(self, method: str, params: Any) -> Dict[str, Any]:
+        if method == "eth_chainId":
+            return {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+        if method == "eth_getCode":
+            return {"jsonrpc": "2.0", "id": 1, "result": self.code}
+        assert method == "eth_call"
+        self.calls.append(params[0])
+        result = self.handle_call(params[0]["to"], bytes.fromhex(params[0]["data"][2:]))
+        if isinstance(result, Exception):
+            return {"jsonrpc": "2.0", "id": 1, "error": {"code": 3, "message": str(result), "data": "0x"}}
+        return {"jsonrpc": "2.0", "id": 1, "result": "0x" + result.hex()}
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
+
+
+def _aggregate3(reverting: tuple = ()) -> Callable[[str, bytes], bytes]:
+    def handle_call(to: str, data: bytes) -> bytes:
+        assert to.lower() == MULTICALL3_ADDRESS.lower()
+        assert data[:4].hex() == "82ad56cb"
+        (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+        results = []
+        for target, allow_failure, call_data in calls:
+            assert allow_failure
+            selector = call_data[:4].hex()
+            if selector in reverting:
+                results.append((False, b""))
+            else:
+                results.append((True, RETURN_DATA[selector]))
+        return encode(["(bool,bytes)[]"], [results])
+
+    return handle_call
+
+
+def _request(function_name: str, args: list = []) -> Dict[str, Any]:
+    return {"address": TOKEN, "abi": ABI, "functionName": function_name, "args": args}
+
+
+def _fallback(calls: list) -> Callable[[list], list]:
+    def read_many(requests):
+        calls.append(requests)
+        return [{"value": request["functionName"]} for request in requests]
+
+    return read_many
+
+
+def test_aggregate3_results_are_decoded_in_order():
+    provider = FakeCallProvider(_aggregate3())
+    multicall = Multicall3(web3.Web3(provider))
+    results = multicall.read_many(
+        [_request("balanceOf", [OWNER]), _request("decimals"), _request("owner"), _request("reserves")]
+    )
+    assert results == [{"value": 10**18}, {"value": 6}, {"value": OWNER}, {"value": [1, 2]}]
+    assert len(provider.calls) == 1
+
+
+def test_a_reverting_call_fails_the_batch_but_keeps_multicall_in_use():
+    provider = FakeCallProvider(_aggregate3(reverting=("313ce567",)))
+    multicall = Multicall3(web3.Web3(provider))
+    fallback_calls: list = []
+    with pytest.raises(ValueError, match="Call to decimals on .* reverted"):
+        multicall.read_many([_request("balanceOf", [OWNER]), _request("decimals")], fallback=_fallback(fallback_calls))
+    assert multicall.available
+    assert fallback_calls == []
+
+
+def test_missing_contract_falls_back_to_individual_reads():
+    provider = FakeCallProvider(lambda to, data: b"", code="0x")
+    multicall = Multicall3(web3.Web3(provider))
+    fallback_calls: list = []
+    requests = [_request("balanceOf", [OWNER]), _request("decimals")]
+
+    assert multicall.read_many(requests, fallback=_fallback(fallback_calls)) == [
+        {"value": "balanceOf"},
+        {"value": "decimals"},
+    ]
+    assert not multicall.available
+
+    # Later batches skip the Multicall3 call
+    multicall.read_many(requests, fallback=_fallback(fallback_calls))
+    assert len(provider.calls) == 1
+    assert len(fallback_calls) == 2
+
+
+def test_reverting_contract_falls_back_to_individual_reads():
+    provider = FakeCallProvider(lambda to, data: Exception("execution reverted"))
+    multicall = Multicall3(web3.Web3(provider))
+    fallback_calls: list = []
+    multicall.read_many([_request("decimals"), _request("owner")], fallback=_fallback(fallback_calls))
+    assert not multicall.available
+    assert len(fallback_calls) == 1
+
+
+def test_unavailable_multicall_without_fallback_raises():
+    multicall = Multicall3(web3.Web3(FakeCallProvider(lambda to, data: b"", code="0x")))
+    with pytest.raises(MulticallUnavailableError):
+        multicall.read_many([_request("decimals"), _request("owner")])
+    with pytest.raises(MulticallUnavailableError):
+        multicall.read_many([_request("decimals"), _request("owner")])
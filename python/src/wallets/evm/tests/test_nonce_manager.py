@@ -0,0 +1,84 @@
+import threading
+
+from goat_wallets.evm import NonceManager
+
+ADDRESS = "0x00000000000000000000000000000000000000Aa"
+
+
+def test_reserve_hands_out_consecutive_nonces_across_threads():
+    manager = NonceManager()
+    fetches = []
+
+    def fetch_nonce():
+        fetches.append(1)
+        return 5
+
+    nonces = []
+    lock = threading.Lock()
+
+    def reserve_many():
+        for _ in range(25):
+            nonce = manager.reserve(1, ADDRESS, fetch_nonce)
+            with lock:
+                nonces.append(nonce)
+
+    threads = [threading.Thread(target=reserve_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(nonces) == list(range(5, 205))
+    assert len(fetches) == 1
+
+
+def test_reserve_fetches_without_blocking_other_accounts():
+    manager = NonceManager()
+    manager.reserve(1, ADDRESS, lambda: 0)
+    fetching = threading.Event()
+    unblock = threading.Event()
+
+    def slow_fetch():
+        fetching.set()
+        unblock.wait(5)
+        return 7
+
+    other = threading.Thread(target=manager.reserve, args=(1, "0x" + "b" * 40, slow_fetch))
+    other.start()
+    try:
+        assert fetching.wait(5)
+        # The tracked account is served while the other account's node read is in flight
+        reserved = []
+        tracked = threading.Thread(target=lambda: reserved.append(manager.reserve(1, ADDRESS, lambda: 100)))
+        tracked.start()
+        tracked.join(1)
+        assert reserved == [1]
+    finally:
+        unblock.set()
+        other.join()
+    assert manager.reserve(1, "0x" + "B" * 40, lambda: 100) == 8
+
+
+def test_release_reuses_the_last_unsent_nonce():
+    manager = NonceManager()
+    assert manager.reserve(1, ADDRESS, lambda: 3) == 3
+    assert manager.reserve(1, ADDRESS, lambda: 3) == 4
+    manager.release(1, ADDRESS, 4)
+    assert manager.reserve(1, ADDRESS, lambda: 100) == 4
+
+
+def test_release_of_an_earlier_nonce_resyncs_from_the_node():
+    manager = NonceManager()
+    manager.reserve(1, ADDRESS, lambda: 3)
+    manager.reserve(1, ADDRESS, lambda: 3)
+    manager.release(1, ADDRESS, 3)
+    assert manager.reserve(1, ADDRESS, lambda: 9) == 9
+
+
+def test_resync_reads_the_nonce_from_the_node_again():
+    manager = NonceManager()
+    manager.reserve(1, ADDRESS, lambda: 3)
+    manager.resync(1, ADDRESS.lower())
+    assert manager.reserve(1, ADDRESS, lambda: 12) == 12
+    # Nonces are tracked per chain
+    assert manager.reserve(2, ADDRESS, lambda: 0) == 0
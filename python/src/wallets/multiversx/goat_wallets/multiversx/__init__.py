@@ -1,13 +1,30 @@
-from .types import (
-    MultiversXTransactionStatus, )
+from typing import TYPE_CHECKING
 
-from .wallet import (
-    MultiversXWalletClient,
-    MultiversXSeedphraseWalletClient,
-    multiversx_wallet,
-)
+from goat.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .types import (
+        MultiversXTransactionStatus, )
+
+    from .wallet import (
+        MultiversXWalletClient,
+        MultiversXSeedphraseWalletClient,
+        multiversx_wallet,
+    )
 
-from .send_egld import SendEGLDPlugin, send_egld
+    from .send_egld import SendEGLDPlugin, send_egld
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "MultiversXTransactionStatus": ".types",
+        "MultiversXWalletClient": ".wallet",
+        "MultiversXSeedphraseWalletClient": ".wallet",
+        "multiversx_wallet": ".wallet",
+        "SendEGLDPlugin": ".send_egld",
+        "send_egld": ".send_egld",
+    },
+)
 
 __all__ = [
     "MultiversXTransactionStatus",
@@ -1,11 +1,42 @@
-from .wallet import (
-    SolanaWalletClient,
-    SolanaKeypairWalletClient,
-    SolanaTransaction,
-    SolanaOptions,
-    solana,
+from typing import TYPE_CHECKING
+
+from goat.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .wallet import (
+        SolanaWalletClient,
+        SolanaKeypairWalletClient,
+        SolanaTransaction,
+        SolanaOptions,
+        solana,
+    )
+    from .async_wallet import AsyncSolanaWalletClient, AsyncSolanaKeypairWalletClient, async_solana
+    from .tokens import (
+        USDC, USDT, BONK, SPL_TOKENS, Token, SolanaNetwork,
+        DEFAULT_SPL_TOKEN_REGISTRY, build_solana_token_registry,
+    )
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "SolanaWalletClient": ".wallet",
+        "SolanaKeypairWalletClient": ".wallet",
+        "SolanaTransaction": ".wallet",
+        "SolanaOptions": ".wallet",
+        "solana": ".wallet",
+        "AsyncSolanaWalletClient": ".async_wallet",
+        "AsyncSolanaKeypairWalletClient": ".async_wallet",
+        "async_solana": ".async_wallet",
+        "USDC": ".tokens",
+        "USDT": ".tokens",
+        "BONK": ".tokens",
+        "SPL_TOKENS": ".tokens",
+        "Token": ".tokens",
+        "SolanaNetwork": ".tokens",
+        "DEFAULT_SPL_TOKEN_REGISTRY": ".tokens",
+        "build_solana_token_registry": ".tokens",
+    },
 )
-from .tokens import USDC, USDT, BONK, SPL_TOKENS, Token, SolanaNetwork
 
 __all__ = [
     "SolanaWalletClient",
@@ -13,10 +44,15 @@ __all__ = [
     "SolanaTransaction",
     "SolanaOptions",
     "solana",
+    "AsyncSolanaWalletClient",
+    "AsyncSolanaKeypairWalletClient",
+    "async_solana",
     "USDC",
     "USDT",
     "BONK",
     "SPL_TOKENS",
     "Token",
-    "SolanaNetwork"
+    "SolanaNetwork",
+    "DEFAULT_SPL_TOKEN_REGISTRY",
+    "build_solana_token_registry",
 ]
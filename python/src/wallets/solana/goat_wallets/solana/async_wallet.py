@@ -0,0 +1,314 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional
+
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.instruction import Instruction
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from solders.signature import Signature as TransactionSignature
+from solders.transaction import VersionedTransaction
+from spl.token.async_client import AsyncToken
+from spl.token.constants import TOKEN_PROGRAM_ID
+from spl.token.instructions import get_associated_token_address
+
+from goat.classes.wallet_client_base import Balance
+from goat.classes.tool_base import ToolBase, create_tool
+from goat.classes.token_metadata_cache import TokenMetadataCache
+from goat.classes.token_registry import TokenRegistry
+from goat.utils.maybe_await import maybe_await
+
+from .tokens import Token
+from .wallet import (
+    _SEND_OPTIONS,
+    SolanaKeypairWalletClient,
+    SolanaOptions,
+    SolanaTransaction,
+    SolanaWalletClient,
+)
+
+
+class AsyncSolanaWalletClient(SolanaWalletClient, ABC):
+    """Base class for Solana wallets driven by a `solana.rpc.async_api.AsyncClient`.
+
+    Balances, sends, confirmations and lookup table fetches are coroutines, so waiting for a
+    transaction to confirm does not block the other tools running on the event loop. Token info
+    and unit conversions only use the token registry and metadata cache, and stay synchronous.
+
+    Plugins written against SolanaWalletClient can support both flavours by awaiting the results
+    that are awaitable (see `goat.maybe_await`).
+    """
+
+    client: AsyncClient  # type: ignore[assignment]
+
+    @abstractmethod
+    async def send_transaction(self, transaction: SolanaTransaction) -> Dict[str, str]:  # type: ignore[override]
+        """Send a transaction on the Solana chain and wait for its confirmation."""
+        pass
+
+    @abstractmethod
+    async def send_raw_transaction(self, transaction: str) -> Dict[str, str]:  # type: ignore[override]
+        """Send a raw transaction on the Solana chain and wait for its confirmation."""
+        pass
+
+    async def confirm_transaction(self, signature: TransactionSignature) -> None:
+        """Wait until a transaction is confirmed, polling without blocking the event loop.
+
+        Args:
+            signature: The signature of the transaction
+        """
+        await self.client.confirm_transaction(signature, commitment=Confirmed)
+
+    async def balance_of(self, address: str, token_address: Optional[str] = None) -> Balance:  # type: ignore[override]
+        """Get the balance of an address for SOL or SPL tokens.
+
+        Args:
+            address: The address to get the balance of
+            token_address: The token mint address, if None checks SOL balance
+
+        Returns:
+            Balance information
+        """
+        owner_pubkey = Pubkey.from_string(address)
+
+        if token_address:
+            try:
+                token_account = get_associated_token_address(owner_pubkey, Pubkey.from_string(token_address))
+
+                try:
+                    # Missing token accounts make the balance call fail, which reads as a zero balance
+                    token_balance = await self.client.get_token_account_balance(token_account)
+                    balance_in_base_units = token_balance.value.amount
+                except Exception:
+                    balance_in_base_units = "0"
+
+                return self._token_balance(token_address, balance_in_base_units)
+            except Exception as e:
+                raise ValueError(f"Failed to fetch token balance: {str(e)}")
+        else:
+            try:
+                return self._sol_balance((await self.client.get_balance(owner_pubkey)).value)
+            except Exception as e:
+                raise ValueError(f"Failed to fetch SOL balance: {str(e)}")
+
+    async def send_token(self, params: Dict[str, Any]) -> Dict[str, str]:  # type: ignore[override]
+        """Send tokens (SOL or SPL).
+
+        Args:
+            params: Parameters including recipient, amount, and optional token address
+
+        Returns:
+            Transaction receipt
+        """
+        if not self.enable_send:
+            raise ValueError("Sending tokens is disabled for this wallet")
+
+        recipient = params["recipient"]
+        amount_in_base_units = params["baseUnitsAmount"]
+        token_address = params.get("tokenAddress")
+
+        try:
+            create_destination_account = False
+            mint_decimals = 0
+            if token_address:
+                destination_token_account = get_associated_token_address(
+                    Pubkey.from_string(recipient), Pubkey.from_string(token_address)
+                )
+                dest_account_info, mint_decimals = await asyncio.gather(
+                    self.client.get_account_info(destination_token_account),
+                    self._get_mint_decimals(token_address),
+                )
+                create_destination_account = dest_account_info.value is None
+
+            transaction_data: SolanaTransaction = {
+                "instructions": self._transfer_instructions(
+                    recipient, amount_in_base_units, token_address, create_destination_account, mint_decimals
+                ),
+                "address_lookup_table_addresses": None,
+                "accounts_to_sign": None,
+                "signer": None
+            }
+            return await self.send_transaction(transaction_data)
+        except Exception as e:
+            asset_type = "token" if token_address else "SOL"
+            raise ValueError(f"Failed to send {asset_type}: {str(e)}")
+
+    async def _get_mint_decimals(self, token_address: str) -> int:  # type: ignore[override]
+        """Get the decimals of a mint from the metadata cache, or from the chain on a miss.
+
+        Args:
+            token_address: The token mint address
+
+        Returns:
+            Number of decimals
+        """
+        chain_key = f"solana:{self.network}"
+        metadata = self.token_metadata_cache.get(chain_key, token_address)
+        if metadata is not None and "decimals" in metadata:
+            return metadata["decimals"]
+
+        try:
+            # get_mint_info does not sign anything, so any payer will do
+            token = AsyncToken(self.client, Pubkey.from_string(token_address), TOKEN_PROGRAM_ID, Keypair())
+            mint_decimals = (await token.get_mint_info()).decimals
+            self.token_metadata_cache.update(chain_key, token_address, {"decimals": mint_decimals})
+            return mint_decimals
+        except Exception as e:
+            print(f"Warning: Could not get mint info, using token info: {str(e)}")
+            token_info = self.token_registry.get_by_address(self.network, token_address)
+            return token_info["decimals"] if token_info else 9
+
+    async def decompile_versioned_transaction_to_instructions(  # type: ignore[override]
+        self, versioned_transaction: VersionedTransaction
+    ) -> Optional[List[Instruction]]:
+        """Decompile a versioned transaction into its constituent instructions.
+
+        Args:
+            versioned_transaction: The versioned transaction to decompile
+
+        Returns:
+            List of instructions from the transaction
+        """
+        return self._decompile_instructions(
+            versioned_transaction,
+            await self.get_address_lookup_table_accounts(self._lookup_table_keys(versioned_transaction)),
+        )
+
+    async def get_address_lookup_table_accounts(  # type: ignore[override]
+        self, keys: List[str]
+    ) -> List[Optional[AddressLookupTableAccount]]:
+        """Get address lookup table accounts for the given addresses, fetching them concurrently.
+
+        Args:
+            keys: List of lookup table addresses
+
+        Returns:
+            One lookup table account per address, or None where it could not be fetched
+        """
+        responses = await asyncio.gather(
+            *(self.client.get_account_info(Pubkey.from_string(key)) for key in keys), return_exceptions=True
+        )
+
+        lookup_table_accounts = []
+        for key, response in zip(keys, responses):
+            if isinstance(response, BaseException):
+                print(f"Error getting account info for {key}: {response}")
+                lookup_table_accounts.append(None)
+            else:
+                lookup_table_accounts.append(self._decode_lookup_table(key, response.value))
+        return lookup_table_accounts
+
+    def get_core_tools(self) -> List[ToolBase]:
+        """Get the core tools for this wallet client.
+
+        The tools are the ones of SolanaWalletClient, except that `execute_async` awaits the
+        wallet's coroutines on the caller's event loop instead of going through a worker thread.
+
+        Returns:
+            List of tool definitions
+        """
+        return [
+            create_tool(
+                {"name": tool.name, "description": tool.description, "parameters": tool.parameters},
+                tool._execute_fn,  # type: ignore[attr-defined]
+                _awaiting(tool._execute_fn),  # type: ignore[attr-defined]
+            )
+            for tool in super().get_core_tools()
+        ]
+
+
+class AsyncSolanaKeypairWalletClient(AsyncSolanaWalletClient):
+    """An async Solana wallet client implementation using a local keypair for signing."""
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        keypair: Keypair,
+        options: Optional[SolanaOptions] = None,
+        tokens: Optional[List[Token]] = None,
+        enable_send: Optional[bool] = None,
+        token_metadata_cache: Optional[TokenMetadataCache] = None,
+        token_registry: Optional[TokenRegistry] = None,
+    ):
+        """Initialize the async Solana keypair wallet client.
+
+        Args:
+            client: An async Solana RPC client instance
+            keypair: A Solders Keypair object
+            options: Configuration options
+            tokens: List of token configurations (overrides options.tokens if provided)
+            enable_send: Whether to enable send functionality (overrides options.enable_send if provided)
+            token_metadata_cache: Cache for mint decimals. Defaults to the process-wide cache
+            token_registry: Prebuilt token index to share between wallets. Takes precedence over tokens
+        """
+        super().__init__(client, options, tokens, enable_send, token_metadata_cache, token_registry)  # type: ignore[arg-type]
+        self.keypair = keypair
+
+    get_address = SolanaKeypairWalletClient.get_address
+    sign_message = SolanaKeypairWalletClient.sign_message
+    _sign_transaction = SolanaKeypairWalletClient._sign_transaction
+    _sign_raw_transaction = SolanaKeypairWalletClient._sign_raw_transaction
+
+    async def send_transaction(self, transaction: SolanaTransaction) -> Dict[str, str]:  # type: ignore[override]
+        """Send a transaction on the Solana chain."""
+        recent_blockhash = (await self.client.get_latest_blockhash()).value.blockhash
+
+        result = await self.client.send_transaction(
+            self._sign_transaction(transaction, recent_blockhash), opts=_SEND_OPTIONS
+        )
+        await self.confirm_transaction(result.value)
+
+        return {"hash": str(result.value)}
+
+    async def send_raw_transaction(self, transaction: str) -> Dict[str, str]:  # type: ignore[override]
+        """Send a raw transaction on the Solana chain.
+
+        Args:
+            transaction: Base64 encoded transaction string
+
+        Returns:
+            Dict containing the transaction hash
+        """
+        result = await self.client.send_transaction(self._sign_raw_transaction(transaction), opts=_SEND_OPTIONS)
+        await self.confirm_transaction(result.value)
+
+        return {"hash": str(result.value)}
+
+
+def async_solana(
+    client: AsyncClient,
+    keypair: Keypair,
+    options: Optional[SolanaOptions] = None,
+    tokens: Optional[List[Token]] = None,
+    enable_send: Optional[bool] = None,
+    token_metadata_cache: Optional[TokenMetadataCache] = None,
+    token_registry: Optional[TokenRegistry] = None,
+) -> AsyncSolanaKeypairWalletClient:
+    """Create an async Solana wallet client with keypair.
+
+    Args:
+        client: An async Solana RPC client
+        keypair: A Solders Keypair object
+        options: Configuration options
+        tokens: List of token configurations (overrides options.tokens if provided)
+        enable_send: Whether to enable send functionality (overrides options.enable_send if provided)
+        token_metadata_cache: Cache for mint decimals. Defaults to the process-wide cache
+        token_registry: Prebuilt token index to share between wallets. Takes precedence over tokens
+
+    Returns:
+        An async Solana wallet client
+    """
+    return AsyncSolanaKeypairWalletClient(
+        client, keypair, options, tokens, enable_send, token_metadata_cache, token_registry
+    )
+
+
+def _awaiting(fn: Callable[[Dict[str, Any]], Any]) -> Callable[[Dict[str, Any]], Any]:
+    # The core tool functions only call coroutine methods or registry lookups, so calling them
+    # on the loop is safe; the coroutine they return is awaited there as well
+    async def run(params: Dict[str, Any]) -> Any:
+        return await maybe_await(fn(params))
+
+    return run
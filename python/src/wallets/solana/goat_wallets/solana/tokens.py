@@ -1,6 +1,7 @@
 from typing import Dict, List, Literal
 
 from goat.types.token import Token as CoreToken
+from goat.classes.token_registry import RegisteredToken, TokenRegistry
 
 class Token(CoreToken):
     mintAddress: str
@@ -40,3 +41,32 @@ SPL_TOKENS: Dict[SolanaNetwork, List[Token]] = {
     "devnet": [USDC_DEVNET],
     "testnet": [],
 }
+
+
+def build_solana_token_registry(tokens: Dict[SolanaNetwork, List[Token]]) -> TokenRegistry:
+    """Index SPL token configurations by network, ticker and mint address."""
+    return TokenRegistry(
+        {
+            "chain": network,
+            "address": token["mintAddress"],
+            "symbol": token["symbol"],
+            "name": token["name"],
+            "decimals": token["decimals"],
+        }
+        for network, network_tokens in tokens.items()
+        for token in network_tokens
+    )
+
+
+def to_spl_token(token: RegisteredToken) -> Token:
+    """Convert a registry entry back to an SPL token configuration."""
+    return {
+        "name": token["name"],
+        "symbol": token["symbol"],
+        "decimals": token["decimals"],
+        "mintAddress": token["address"],
+    }
+
+
+# Shared by every wallet client that uses the predefined tokens
+DEFAULT_SPL_TOKEN_REGISTRY = build_solana_token_registry(SPL_TOKENS)
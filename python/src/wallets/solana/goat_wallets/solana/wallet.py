@@ -8,6 +8,7 @@ from solana.rpc.api import Client as SolanaClient
 from solana.rpc.types import TxOpts
 from solana.rpc.commitment import Confirmed
 from solders.pubkey import Pubkey
+from solders.hash import Hash
 from solders.keypair import Keypair
 from solders.instruction import Instruction, AccountMeta, CompiledInstruction
 from solders.message import Message, MessageV0
@@ -18,11 +19,14 @@ from spl.token.instructions import get_associated_token_address, create_associat
 from spl.token.client import Token as SplToken
 import nacl.signing
 
+from goat.classes.instrumentation import instrument_httpx_client
 from goat.classes.wallet_client_base import Balance, Signature, WalletClientBase
 from goat.types.chain import Chain, SolanaChain
 from goat.classes.tool_base import ToolBase, create_tool
+from goat.classes.token_metadata_cache import TokenMetadataCache, default_token_metadata_cache
+from goat.classes.token_registry import TokenRegistry
 
-from .tokens import SPL_TOKENS, Token, SolanaNetwork
+from .tokens import SPL_TOKENS, Token, SolanaNetwork, DEFAULT_SPL_TOKEN_REGISTRY, build_solana_token_registry, to_spl_token
 from .params import (
     ConvertToBaseUnitsParameters,
     ConvertFromBaseUnitsParameters,
@@ -31,6 +35,14 @@ from .params import (
 )
 
 
+# Preflight-checked sends used by the keypair clients
+_SEND_OPTIONS = TxOpts(
+    skip_preflight=False,
+    max_retries=10,
+    preflight_commitment=Confirmed,
+)
+
+
 class SolanaTransaction(TypedDict):
     """Transaction parameters for Solana transactions."""
 
@@ -49,10 +61,25 @@ class SolanaOptions:
         self.enable_send = enable_send
 
 
+def _instrument_client(client: Any) -> None:
+    # Count the RPC requests of solana-py's HTTP providers as upstream calls of the running tool call
+    session = getattr(getattr(client, "_provider", None), "session", None)
+    if session is not None:
+        instrument_httpx_client(session)
+
+
 class SolanaWalletClient(WalletClientBase, ABC):
     """Base class for Solana wallet implementations."""
 
-    def __init__(self, client: SolanaClient, options: Optional[SolanaOptions] = None, tokens: Optional[List[Token]] = None, enable_send: Optional[bool] = None):
+    def __init__(
+        self,
+        client: SolanaClient,
+        options: Optional[SolanaOptions] = None,
+        tokens: Optional[List[Token]] = None,
+        enable_send: Optional[bool] = None,
+        token_metadata_cache: Optional[TokenMetadataCache] = None,
+        token_registry: Optional[TokenRegistry] = None,
+    ):
         """Initialize the Solana wallet client.
 
         Args:
@@ -60,13 +87,23 @@ class SolanaWalletClient(WalletClientBase, ABC):
             options: Configuration options
             tokens: List of token configurations (overrides options.tokens if provided)
             enable_send: Whether to enable send functionality (overrides options.enable_send if provided)
+            token_metadata_cache: Cache for mint decimals. Defaults to the process-wide cache
+            token_registry: Prebuilt token index to share between wallets. Takes precedence over tokens
         """
         super().__init__()
         self.client = client
+        _instrument_client(client)
         self.options = options or SolanaOptions()
         self.network = self.options.network
         self.tokens = tokens if tokens is not None else self.options.tokens
         self.enable_send = enable_send if enable_send is not None else self.options.enable_send
+        self.token_metadata_cache = token_metadata_cache or default_token_metadata_cache()
+        if token_registry is not None:
+            self.token_registry = token_registry
+        elif self.tokens is SPL_TOKENS.get(self.network):
+            self.token_registry = DEFAULT_SPL_TOKEN_REGISTRY
+        else:
+            self.token_registry = build_solana_token_registry({self.network: self.tokens})
 
     def get_chain(self) -> SolanaChain:
         """Get the chain type for Solana."""
@@ -126,43 +163,48 @@ class SolanaWalletClient(WalletClientBase, ABC):
                 except Exception:
                     balance_in_base_units = "0"
                 
-                token_info = next((t for t in self.tokens if t["mintAddress"] == token_address), None)
-                
-                if token_info:
-                    decimals = token_info["decimals"]
-                    symbol = token_info["symbol"]
-                    name = token_info["name"]
-                else:
-                    decimals = 9  # Default
-                    symbol = "TOKEN"
-                    name = "Unknown Token"
-                
-                balance_value = str(Decimal(balance_in_base_units) / (10 ** decimals))
-                
-                return {
-                    "decimals": decimals,
-                    "symbol": symbol,
-                    "name": name,
-                    "value": balance_value,
-                    "in_base_units": balance_in_base_units,
-                }
+                return self._token_balance(token_address, balance_in_base_units)
             except Exception as e:
                 raise ValueError(f"Failed to fetch token balance: {str(e)}")
         else:
             try:
-                balance_lamports = self.client.get_balance(owner_pubkey).value
-                chain = self.get_chain()
-                
-                return {
-                    "decimals": chain["nativeCurrency"]["decimals"],
-                    "symbol": chain["nativeCurrency"]["symbol"],
-                    "name": chain["nativeCurrency"]["name"],
-                    "value": str(Decimal(balance_lamports) / (10 ** 9)),  # 9 decimals for SOL
-                    "in_base_units": str(balance_lamports),
-                }
+                return self._sol_balance(self.client.get_balance(owner_pubkey).value)
             except Exception as e:
                 raise ValueError(f"Failed to fetch SOL balance: {str(e)}")
 
+    def _token_balance(self, token_address: str, balance_in_base_units: str) -> Balance:
+        """Format an SPL token balance using the token registry or the metadata cache."""
+        token_info = self.token_registry.get_by_address(self.network, token_address)
+        
+        if token_info:
+            decimals = token_info["decimals"]
+            symbol = token_info["symbol"]
+            name = token_info["name"]
+        else:
+            metadata = self.token_metadata_cache.get(f"solana:{self.network}", token_address) or {}
+            decimals = metadata.get("decimals", 9)  # Default
+            symbol = metadata.get("symbol", "TOKEN")
+            name = metadata.get("name", "Unknown Token")
+        
+        return {
+            "decimals": decimals,
+            "symbol": symbol,
+            "name": name,
+            "value": str(Decimal(balance_in_base_units) / (10 ** decimals)),
+            "in_base_units": balance_in_base_units,
+        }
+
+    def _sol_balance(self, balance_lamports: int) -> Balance:
+        """Format a SOL balance given in lamports."""
+        chain = self.get_chain()
+        return {
+            "decimals": chain["nativeCurrency"]["decimals"],
+            "symbol": chain["nativeCurrency"]["symbol"],
+            "name": chain["nativeCurrency"]["name"],
+            "value": str(Decimal(balance_lamports) / (10 ** 9)),  # 9 decimals for SOL
+            "in_base_units": str(balance_lamports),
+        }
+
     def get_token_info_by_ticker(self, ticker: str) -> Token:
         """Get token information by ticker.
         
@@ -183,15 +225,10 @@ class SolanaWalletClient(WalletClientBase, ABC):
                 "name": chain["nativeCurrency"]["name"],
             }
         
-        for token in self.tokens:
-            if token["symbol"].upper() == upper_ticker:
-                return {
-                    "symbol": token["symbol"],
-                    "mintAddress": token["mintAddress"],
-                    "decimals": token["decimals"],
-                    "name": token["name"],
-                }
-                
+        token = self.token_registry.get_by_ticker(self.network, upper_ticker)
+        if token is not None:
+            return to_spl_token(token)
+        
         raise ValueError(f"Token with ticker {ticker} not found")
 
     def _get_token_decimals(self, token_address: Optional[str] = None) -> int:
@@ -204,11 +241,15 @@ class SolanaWalletClient(WalletClientBase, ABC):
             Number of decimals
         """
         if token_address:
-            token_info = next((t for t in self.tokens if t["mintAddress"] == token_address), None)
+            token_info = self.token_registry.get_by_address(self.network, token_address)
             
             if token_info:
                 return token_info["decimals"]
             
+            metadata = self.token_metadata_cache.get(f"solana:{self.network}", token_address)
+            if metadata is not None and "decimals" in metadata:
+                return metadata["decimals"]
+            
             return 9
         
         return self.get_chain()["nativeCurrency"]["decimals"]
@@ -274,76 +315,19 @@ class SolanaWalletClient(WalletClientBase, ABC):
         token_address = params.get("tokenAddress")
         
         try:
-            owner_pubkey = Pubkey.from_string(self.get_address())
-            destination_pubkey = Pubkey.from_string(recipient)
-            
-            instructions = []
-            
+            create_destination_account = False
+            mint_decimals = 0
             if token_address:
-                mint_pubkey = Pubkey.from_string(token_address)
-                
-                source_token_account = get_associated_token_address(owner_pubkey, mint_pubkey)
-                
-                destination_token_account = get_associated_token_address(destination_pubkey, mint_pubkey)
-                
-                dest_account_info = self.client.get_account_info(destination_token_account)
-                if dest_account_info.value is None:
-                    create_ata_ix = create_associated_token_account(
-                        owner_pubkey, destination_pubkey, mint_pubkey
-                    )
-                    instructions.append(create_ata_ix)
-                
-                token_info = next((t for t in self.tokens if t["mintAddress"] == token_address), None)
-                token_decimals = token_info["decimals"] if token_info else 9  # Default to 9 if not found
-                
-                # Use a much smaller amount for testing to avoid rate limits
-                max_test_amount = 1000  # Very small amount to avoid rate limits
-                test_amount = min(int(amount_in_base_units), max_test_amount)
-                
-                try:
-                    try:
-                        # We just need mint info, so we can create a dummy keypair for the SplToken
-                        # since we're only going to call get_mint_info() which doesn't require signing
-                        dummy_payer = Keypair()
-                        token = SplToken(
-                            self.client,
-                            mint_pubkey,
-                            TOKEN_PROGRAM_ID,
-                            dummy_payer
-                        )
-                        mint_data = token.get_mint_info()
-                        mint_decimals = mint_data.decimals
-                    except (ImportError, AttributeError):
-                        mint_decimals = token_decimals
-                except Exception as e:
-                    print(f"Warning: Could not get mint info, using token info: {str(e)}")
-                    mint_decimals = token_decimals
-                
-                # Create transfer checked instruction with mint info
-                transfer_ix = transfer_checked(
-                    TransferCheckedParams(
-                        program_id=TOKEN_PROGRAM_ID,
-                        source=source_token_account,
-                        mint=mint_pubkey,
-                        dest=destination_token_account,
-                        owner=owner_pubkey,
-                        amount=test_amount,
-                        decimals=mint_decimals,
-                        signers=[]
-                    )
-                )
-                instructions.append(transfer_ix)
-            else:
-                from solders.system_program import TransferParams, transfer
-                
-                transfer_ix = transfer(
-                    TransferParams(
-                        from_pubkey=owner_pubkey,
-                        to_pubkey=destination_pubkey,
-                        lamports=int(amount_in_base_units)
-                    )
+                destination_token_account = get_associated_token_address(
+                    Pubkey.from_string(recipient), Pubkey.from_string(token_address)
                 )
-                instructions.append(transfer_ix)
+                dest_account_info = self.client.get_account_info(destination_token_account)
+                create_destination_account = dest_account_info.value is None
+                mint_decimals = self._get_mint_decimals(token_address)
+
+            instructions = self._transfer_instructions(
+                recipient, amount_in_base_units, token_address, create_destination_account, mint_decimals
+            )
             
             # Send transaction
             # Create a transaction object with the instructions
@@ -358,6 +342,112 @@ class SolanaWalletClient(WalletClientBase, ABC):
             asset_type = "token" if token_address else "SOL"
             raise ValueError(f"Failed to send {asset_type}: {str(e)}")
 
+    def _get_mint_decimals(self, token_address: str) -> int:
+        """Get the decimals of a mint from the metadata cache, or from the chain on a miss.
+        
+        Args:
+            token_address: The token mint address
+            
+        Returns:
+            Number of decimals
+        """
+        chain_key = f"solana:{self.network}"
+        metadata = self.token_metadata_cache.get(chain_key, token_address)
+        if metadata is not None and "decimals" in metadata:
+            return metadata["decimals"]
+
+        token_info = self.token_registry.get_by_address(self.network, token_address)
+        token_decimals = token_info["decimals"] if token_info else 9  # Default to 9 if not found
+        try:
+            try:
+                # We just need mint info, so we can create a dummy keypair for the SplToken
+                # since we're only going to call get_mint_info() which doesn't require signing
+                dummy_payer = Keypair()
+                token = SplToken(
+                    self.client,
+                    Pubkey.from_string(token_address),
+                    TOKEN_PROGRAM_ID,
+                    dummy_payer
+                )
+                mint_decimals = token.get_mint_info().decimals
+                self.token_metadata_cache.update(chain_key, token_address, {"decimals": mint_decimals})
+                return mint_decimals
+            except (ImportError, AttributeError):
+                return token_decimals
+        except Exception as e:
+            print(f"Warning: Could not get mint info, using token info: {str(e)}")
+            return token_decimals
+
+    def _transfer_instructions(
+        self,
+        recipient: str,
+        amount_in_base_units: str,
+        token_address: Optional[str],
+        create_destination_account: bool,
+        mint_decimals: int,
+    ) -> List[Instruction]:
+        """Build the instructions of a SOL or SPL token transfer from this wallet.
+        
+        Args:
+            recipient: The recipient address
+            amount_in_base_units: The amount to send, in base units
+            token_address: The token mint address, or None for SOL
+            create_destination_account: Whether the recipient's associated token account must be created
+            mint_decimals: Decimals of the mint, for SPL token transfers
+            
+        Returns:
+            The transfer instructions
+        """
+        owner_pubkey = Pubkey.from_string(self.get_address())
+        destination_pubkey = Pubkey.from_string(recipient)
+        
+        instructions = []
+        
+        if token_address:
+            mint_pubkey = Pubkey.from_string(token_address)
+            
+            source_token_account = get_associated_token_address(owner_pubkey, mint_pubkey)
+            
+            destination_token_account = get_associated_token_address(destination_pubkey, mint_pubkey)
+            
+            if create_destination_account:
+                create_ata_ix = create_associated_token_account(
+                    owner_pubkey, destination_pubkey, mint_pubkey
+                )
+                instructions.append(create_ata_ix)
+            
+            # Use a much smaller amount for testing to avoid rate limits
+            max_test_amount = 1000  # Very small amount to avoid rate limits
+            test_amount = min(int(amount_in_base_units), max_test_amount)
+            
+            # Create transfer checked instruction with mint info
+            transfer_ix = transfer_checked(
+                TransferCheckedParams(
+                    program_id=TOKEN_PROGRAM_ID,
+                    source=source_token_account,
+                    mint=mint_pubkey,
+                    dest=destination_token_account,
+                    owner=owner_pubkey,
+                    amount=test_amount,
+                    decimals=mint_decimals,
+                    signers=[]
+                )
+            )
+            instructions.append(transfer_ix)
+        else:
+            from solders.system_program import TransferParams, transfer
+            
+            transfer_ix = transfer(
+                TransferParams(
+                    from_pubkey=owner_pubkey,
+                    to_pubkey=destination_pubkey,
+                    lamports=int(amount_in_base_units)
+                )
+            )
+            instructions.append(transfer_ix)
+        
+        return instructions
+
     def get_core_tools(self) -> List[ToolBase]:
         """Get the core tools for this wallet client.
         
@@ -466,15 +556,27 @@ class SolanaWalletClient(WalletClientBase, ABC):
             List of instructions from the transaction if successful, None if we can't
             properly decompile all instructions
         """
+        return self._decompile_instructions(
+            versioned_transaction,
+            self.get_address_lookup_table_accounts(self._lookup_table_keys(versioned_transaction)),
+        )
+
+    def _lookup_table_keys(self, versioned_transaction: VersionedTransaction) -> List[str]:
+        """Get the addresses of the lookup tables a versioned transaction uses."""
+        message = versioned_transaction.message
+        if isinstance(message, MessageV0) and message.address_table_lookups:
+            return [str(lookup.account_key) for lookup in message.address_table_lookups]
+        return []
+
+    def _decompile_instructions(
+        self, versioned_transaction: VersionedTransaction, lookup_tables: List[Optional[AddressLookupTableAccount]]
+    ) -> List[Instruction]:
+        """Decompile a versioned transaction given the lookup tables it uses, in order."""
         # Convert CompiledInstructions back to Instructions
         message = versioned_transaction.message
         
         # For MessageV0, we need to get all accounts including those from lookup tables
         if isinstance(message, MessageV0) and message.address_table_lookups:
-            # Get lookup table accounts
-            lookup_table_keys = [str(lookup.account_key) for lookup in message.address_table_lookups]
-            lookup_tables = self.get_address_lookup_table_accounts(lookup_table_keys)
-            
             # Filter out None lookup tables and their corresponding lookups
             valid_lookups = []
             valid_tables = []
@@ -528,25 +630,36 @@ class SolanaWalletClient(WalletClientBase, ABC):
                 print(f"Error getting account info for {key}: {e}")
                 account_info = None
             
-            if account_info is not None:
-                try:
-                    # The account data comes as base64, need to decode it first
-                    decoded_data = base64.b64decode(account_info.data)
-                    lookup_table_account = AddressLookupTableAccount.from_bytes(decoded_data)
-                    lookup_table_accounts.append(lookup_table_account)
-                except Exception as e:
-                    print(f"Error decoding lookup table for {key}: {e}")
-                    lookup_table_accounts.append(None)
-            else:
-                lookup_table_accounts.append(None)
+            lookup_table_accounts.append(self._decode_lookup_table(key, account_info))
                 
         return lookup_table_accounts
 
+    def _decode_lookup_table(self, key: str, account_info: Any) -> Optional[AddressLookupTableAccount]:
+        """Decode the account of a lookup table, or return None if it is missing or invalid."""
+        if account_info is None:
+            return None
+        try:
+            # The account data comes as base64, need to decode it first
+            decoded_data = base64.b64decode(account_info.data)
+            return AddressLookupTableAccount.from_bytes(decoded_data)
+        except Exception as e:
+            print(f"Error decoding lookup table for {key}: {e}")
+            return None
+
 
 class SolanaKeypairWalletClient(SolanaWalletClient):
     """A Solana wallet client implementation using a local keypair for signing."""
 
-    def __init__(self, client: SolanaClient, keypair: Keypair, options: Optional[SolanaOptions] = None, tokens: Optional[List[Token]] = None, enable_send: Optional[bool] = None):
+    def __init__(
+        self,
+        client: SolanaClient,
+        keypair: Keypair,
+        options: Optional[SolanaOptions] = None,
+        tokens: Optional[List[Token]] = None,
+        enable_send: Optional[bool] = None,
+        token_metadata_cache: Optional[TokenMetadataCache] = None,
+        token_registry: Optional[TokenRegistry] = None,
+    ):
         """Initialize the Solana keypair wallet client.
         
         Args:
@@ -555,8 +668,10 @@ class SolanaKeypairWalletClient(SolanaWalletClient):
             options: Configuration options
             tokens: List of token configurations (overrides options.tokens if provided)
             enable_send: Whether to enable send functionality (overrides options.enable_send if provided)
+            token_metadata_cache: Cache for mint decimals. Defaults to the process-wide cache
+            token_registry: Prebuilt token index to share between wallets. Takes precedence over tokens
         """
-        super().__init__(client, options, tokens, enable_send)
+        super().__init__(client, options, tokens, enable_send, token_metadata_cache, token_registry)
         self.keypair = keypair
 
     def get_address(self) -> str:
@@ -598,28 +713,9 @@ class SolanaKeypairWalletClient(SolanaWalletClient):
         # Get latest blockhash
         recent_blockhash = self.client.get_latest_blockhash().value.blockhash
 
-        # Create transaction
-        tx = Transaction.new_with_payer(
-            instructions=transaction["instructions"],
-            payer=self.keypair.pubkey(),
-        )
-
-        # Add signers
-        signers = [self.keypair]
-        additional_signers = transaction.get("accounts_to_sign")
-        if additional_signers is not None:
-            signers.extend(additional_signers)
-
         # Sign and send transaction
-        tx.sign(signers, recent_blockhash=recent_blockhash)
-        result = self.client.send_transaction(
-            tx,
-            opts=TxOpts(
-                skip_preflight=False,
-                max_retries=10,
-                preflight_commitment=Confirmed,
-            ),
-        )
+        tx = self._sign_transaction(transaction, recent_blockhash)
+        result = self.client.send_transaction(tx, opts=_SEND_OPTIONS)
 
         # Wait for confirmation
         self.client.confirm_transaction(
@@ -638,21 +734,8 @@ class SolanaKeypairWalletClient(SolanaWalletClient):
         Returns:
             Dict containing the transaction hash
         """
-        # Deserialize the transaction from base64
-        tx = VersionedTransaction.from_bytes(base64.b64decode(transaction))
-        
-        # Extract the message from the transaction and sign it, forming a new transaction
-        tx_signed = VersionedTransaction(tx.message, [self.keypair])
-        
         # Send the transaction
-        result = self.client.send_transaction(
-            tx_signed,
-            opts=TxOpts(
-                skip_preflight=False,
-                max_retries=10,
-                preflight_commitment=Confirmed,
-            ),
-        )
+        result = self.client.send_transaction(self._sign_raw_transaction(transaction), opts=_SEND_OPTIONS)
         
         # Wait for confirmation
         self.client.confirm_transaction(
@@ -662,8 +745,40 @@ class SolanaKeypairWalletClient(SolanaWalletClient):
         
         return {"hash": str(result.value)}
 
+    def _sign_transaction(self, transaction: SolanaTransaction, recent_blockhash: Hash) -> Transaction:
+        """Build a transaction paid by the keypair from its instructions and sign it."""
+        # Create transaction
+        tx = Transaction.new_with_payer(
+            instructions=transaction["instructions"],
+            payer=self.keypair.pubkey(),
+        )
 
-def solana(client: SolanaClient, keypair: Keypair, options: Optional[SolanaOptions] = None, tokens: Optional[List[Token]] = None, enable_send: Optional[bool] = None) -> SolanaKeypairWalletClient:
+        # Add signers
+        signers = [self.keypair]
+        additional_signers = transaction.get("accounts_to_sign")
+        if additional_signers is not None:
+            signers.extend(additional_signers)
+
+        tx.sign(signers, recent_blockhash=recent_blockhash)
+        return tx
+
+    def _sign_raw_transaction(self, transaction: str) -> VersionedTransaction:
+        """Sign a base64 encoded transaction with the keypair."""
+        # Deserialize the transaction from base64
+        tx = VersionedTransaction.from_bytes(base64.b64decode(transaction))
+        
+        # Extract the message from the transaction and sign it, forming a new transaction
+        return VersionedTransaction(tx.message, [self.keypair])
+
+def solana(
+    client: SolanaClient,
+    keypair: Keypair,
+    options: Optional[SolanaOptions] = None,
+    tokens: Optional[List[Token]] = None,
+    enable_send: Optional[bool] = None,
+    token_metadata_cache: Optional[TokenMetadataCache] = None,
+    token_registry: Optional[TokenRegistry] = None,
+) -> SolanaKeypairWalletClient:
     """Create a Solana wallet client with keypair.
     
     Args:
@@ -672,8 +787,12 @@ def solana(client: SolanaClient, keypair: Keypair, options: Optional[SolanaOptio
         options: Configuration options
         tokens: List of token configurations (overrides options.tokens if provided)
         enable_send: Whether to enable send functionality (overrides options.enable_send if provided)
+        token_metadata_cache: Cache for mint decimals. Defaults to the process-wide cache
+        token_registry: Prebuilt token index to share between wallets. Takes precedence over tokens
         
     Returns:
         A Solana wallet client
     """
-    return SolanaKeypairWalletClient(client, keypair, options, tokens, enable_send)
+    return SolanaKeypairWalletClient(
+        client, keypair, options, tokens, enable_send, token_metadata_cache, token_registry
+    )
@@ -0,0 +1,155 @@
+import base64
+from types import SimpleNamespace
+from typing import Any, List, Optional, Tuple
+
+import pytest
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.message import MessageV0, to_bytes_versioned
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+from solders.system_program import ID as SYSTEM_PROGRAM_ID
+from solders.system_program import TransferParams, transfer
+from solders.transaction import Transaction, VersionedTransaction
+from spl.token.constants import ASSOCIATED_TOKEN_PROGRAM_ID, TOKEN_PROGRAM_ID
+from spl.token.instructions import get_associated_token_address
+
+from goat.classes.token_metadata_cache import TokenMetadataCache
+from goat_wallets.solana import USDC, async_solana
+
+RECIPIENT = str(Keypair().pubkey())
+MINT = str(Keypair().pubkey())
+BLOCKHASH = Hash.new_unique()
+
+
+def _response(value: Any) -> SimpleNamespace:
+    return SimpleNamespace(value=value)
+
+
+class StubAsyncClient:
+    """Async Solana RPC client answering from canned values and recording what is sent."""
+
+    def __init__(self, lamports: int = 0, token_amount: Optional[str] = None, account_exists: bool = True):
+        self.lamports = lamports
+        self.token_amount = token_amount
+        self.account_exists = account_exists
+        self.sent: List[Any] = []
+        self.confirmed: List[Tuple[Signature, Any]] = []
+
+    async def get_balance(self, pubkey: Pubkey) -> SimpleNamespace:
+        return _response(self.lamports)
+
+    async def get_token_account_balance(self, account: Pubkey) -> SimpleNamespace:
+        if self.token_amount is None:
+            raise Exception("could not find account")
+        return _response(SimpleNamespace(amount=self.token_amount))
+
+    async def get_account_info(self, pubkey: Pubkey) -> SimpleNamespace:
+        return _response(object() if self.account_exists else None)
+
+    async def get_latest_blockhash(self) -> SimpleNamespace:
+        return _response(SimpleNamespace(blockhash=BLOCKHASH))
+
+    async def send_transaction(self, transaction: Any, opts: Any = None) -> SimpleNamespace:
+        self.sent.append(transaction)
+        return _response(transaction.signatures[0])
+
+    async def confirm_transaction(self, signature: Signature, commitment: Any = None) -> None:
+        self.confirmed.append((signature, commitment))
+
+
+def _wallet(client: StubAsyncClient, keypair: Optional[Keypair] = None):
+    cache = TokenMetadataCache()
+    cache.update("solana:mainnet", MINT, {"decimals": 6})
+    return async_solana(client, keypair or Keypair(), token_metadata_cache=cache)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_sol_balance():
+    balance = await _wallet(StubAsyncClient(lamports=1_500_000_000)).balance_of(RECIPIENT)
+    assert balance["value"] == "1.5"
+    assert balance["symbol"] == "SOL"
+    assert balance["in_base_units"] == "1500000000"
+
+
+@pytest.mark.asyncio
+async def test_token_balance_uses_the_token_registry():
+    balance = await _wallet(StubAsyncClient(token_amount="2500000")).balance_of(RECIPIENT, USDC["mintAddress"])
+    assert balance["symbol"] == "USDC"
+    assert balance["value"] == "2.5"
+
+
+@pytest.mark.asyncio
+async def test_missing_token_account_reads_as_zero():
+    balance = await _wallet(StubAsyncClient()).balance_of(RECIPIENT, MINT)
+    assert balance["in_base_units"] == "0"
+    assert balance["decimals"] == 6
+
+
+@pytest.mark.asyncio
+async def test_send_sol_signs_and_confirms():
+    client = StubAsyncClient()
+    keypair = Keypair()
+    result = await _wallet(client, keypair).send_token({"recipient": RECIPIENT, "baseUnitsAmount": "5000"})
+
+    (sent,) = client.sent
+    assert isinstance(sent, Transaction)
+    assert sent.message.recent_blockhash == BLOCKHASH
+    assert sent.message.account_keys[0] == keypair.pubkey()
+    assert sent.message.account_keys[-1] == SYSTEM_PROGRAM_ID
+    assert sent.verify() is None
+    assert client.confirmed == [(sent.signatures[0], "confirmed")]
+    assert result == {"hash": str(sent.signatures[0])}
+
+
+@pytest.mark.asyncio
+async def test_send_token_creates_the_recipients_token_account():
+    client = StubAsyncClient(account_exists=False)
+    keypair = Keypair()
+    await _wallet(client, keypair).send_token(
+        {"recipient": RECIPIENT, "baseUnitsAmount": "100", "tokenAddress": MINT}
+    )
+
+    (sent,) = client.sent
+    programs = [sent.message.account_keys[ix.program_id_index] for ix in sent.message.instructions]
+    assert programs == [ASSOCIATED_TOKEN_PROGRAM_ID, TOKEN_PROGRAM_ID]
+    destination = get_associated_token_address(Pubkey.from_string(RECIPIENT), Pubkey.from_string(MINT))
+    assert destination in sent.message.account_keys
+
+
+@pytest.mark.asyncio
+async def test_send_token_to_an_existing_token_account():
+    client = StubAsyncClient(account_exists=True)
+    await _wallet(client).send_token({"recipient": RECIPIENT, "baseUnitsAmount": "100", "tokenAddress": MINT})
+    (sent,) = client.sent
+    assert [sent.message.account_keys[ix.program_id_index] for ix in sent.message.instructions] == [
+        TOKEN_PROGRAM_ID
+    ]
+
+
+@pytest.mark.asyncio
+async def test_send_is_refused_when_disabled():
+    wallet = async_solana(StubAsyncClient(), Keypair(), enable_send=False)  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="disabled"):
+        await wallet.send_token({"recipient": RECIPIENT, "baseUnitsAmount": "1"})
+
+
+@pytest.mark.asyncio
+async def test_send_raw_transaction_signs_with_the_keypair():
+    client = StubAsyncClient()
+    keypair = Keypair()
+    message = MessageV0.try_compile(
+        keypair.pubkey(),
+        [transfer(TransferParams(from_pubkey=keypair.pubkey(), to_pubkey=Pubkey.from_string(RECIPIENT), lamports=1))],
+        [],
+        BLOCKHASH,
+    )
+    unsigned = VersionedTransaction.populate(message, [Signature.default()])
+
+    result = await _wallet(client, keypair).send_raw_transaction(base64.b64encode(bytes(unsigned)).decode())
+
+    (sent,) = client.sent
+    assert sent.message == message
+    assert sent.signatures[0] == keypair.sign_message(to_bytes_versioned(message))
+    assert result == {"hash": str(sent.signatures[0])}
+    assert len(client.confirmed) == 1
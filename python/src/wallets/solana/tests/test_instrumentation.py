@@ -0,0 +1,65 @@
+import json
+
+import httpx
+import pytest
+from pydantic import BaseModel
+from solana.rpc.api import Client
+from solana.rpc.async_api import AsyncClient
+from solders.keypair import Keypair
+
+from goat import HistogramCollector, add_instrumentation_hook, create_tool, remove_instrumentation_hook
+from goat_wallets.solana import async_solana, solana
+
+LAMPORTS = 5 * 10**9
+
+
+class EmptyParameters(BaseModel):
+    pass
+
+
+def _rpc(request: httpx.Request) -> httpx.Response:
+    body = json.loads(request.content)
+    result = {"context": {"slot": 1}, "value": LAMPORTS}
+    return httpx.Response(200, json={"jsonrpc": "2.0", "id": body["id"], "result": result})
+
+
+@pytest.fixture
+def collector():
+    collector = HistogramCollector()
+    add_instrumentation_hook(collector)
+    yield collector
+    remove_instrumentation_hook(collector)
+
+
+def test_rpc_requests_are_attributed_to_the_tool_call(collector):
+    client = Client("http://rpc")
+    client._provider.session = httpx.Client(transport=httpx.MockTransport(_rpc))
+    wallet = solana(client, Keypair())
+
+    def balance(parameters):
+        return wallet.balance_of(wallet.get_address())
+
+    tool = create_tool({"name": "balance", "description": "", "parameters": EmptyParameters}, balance)
+    assert tool.execute({})["in_base_units"] == str(LAMPORTS)
+
+    histogram = collector.get("balance")
+    assert histogram.upstream_calls == 1
+    assert histogram.upstream_bytes > 0
+
+
+@pytest.mark.asyncio
+async def test_async_rpc_requests_are_attributed_to_the_tool_call(collector):
+    client = AsyncClient("http://rpc")
+    client._provider.session = httpx.AsyncClient(transport=httpx.MockTransport(_rpc))
+    wallet = async_solana(client, Keypair())
+
+    async def balance(parameters):
+        return await wallet.balance_of(wallet.get_address())
+
+    tool = create_tool({"name": "balance_async", "description": "", "parameters": EmptyParameters}, balance)
+    assert (await tool.execute_async({}))["in_base_units"] == str(LAMPORTS)
+    await client.close()
+
+    histogram = collector.get("balance_async")
+    assert histogram.upstream_calls == 1
+    assert histogram.upstream_bytes > 0
@@ -1,3 +1,21 @@
-from .wallet import Web3EVMWalletClient, Web3Options, web3
+from typing import TYPE_CHECKING
 
-__all__ = ["Web3EVMWalletClient", "Web3Options", "web3"]
+from goat.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .wallet import Web3EVMWalletClient, Web3Options, PendingTransaction, web3
+    from .async_wallet import AsyncWeb3EVMWalletClient, async_web3
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Web3EVMWalletClient": ".wallet",
+        "Web3Options": ".wallet",
+        "PendingTransaction": ".wallet",
+        "web3": ".wallet",
+        "AsyncWeb3EVMWalletClient": ".async_wallet",
+        "async_web3": ".async_wallet",
+    },
+)
+
+__all__ = ["Web3EVMWalletClient", "Web3Options", "PendingTransaction", "web3", "AsyncWeb3EVMWalletClient", "async_web3"]
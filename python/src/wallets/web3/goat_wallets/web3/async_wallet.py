@@ -0,0 +1,252 @@
+from typing import Any, Dict, List, Optional
+from eth_typing import ChecksumAddress, HexStr
+from goat.classes.wallet_client_base import Balance, Signature
+from web3 import AsyncWeb3, Web3
+from web3.types import Wei, TxParams
+from eth_utils.address import to_checksum_address
+from eth_account.messages import encode_defunct, encode_typed_data
+
+from goat.classes.token_metadata_cache import TokenMetadataCache
+from goat.classes.token_registry import TokenRegistry
+from goat_wallets.evm import AsyncEVMWalletClient, Multicall3
+from goat_wallets.evm.types import (
+    EVMTransaction,
+    EVMReadRequest,
+    EVMReadResult,
+)
+
+from .instrumentation import add_upstream_middleware
+from .wallet import Web3Options
+
+
+class AsyncWeb3EVMWalletClient(AsyncEVMWalletClient):
+    """EVM wallet client driven by an AsyncWeb3 instance.
+
+    Reads, balances and sends are coroutines, so many wallets can share one event loop without
+    blocking it on RPC calls. When `default_local_account` is set on the AsyncWeb3 instance the
+    transaction is filled and signed locally, as AsyncWeb3 has no signing middleware; otherwise it
+    is sent with `eth_sendTransaction` for the node to sign.
+
+    Create it with `async_web3`, which looks up the chain ID once.
+    """
+
+    def __init__(
+        self,
+        web3: AsyncWeb3,
+        options: Optional[Web3Options] = None,
+        tokens=None,
+        enable_send=True,
+        token_metadata_cache: Optional[TokenMetadataCache] = None,
+        token_registry: Optional[TokenRegistry] = None,
+        chain_id: Optional[int] = None,
+    ):
+        super().__init__(
+            tokens=tokens,
+            enable_send=enable_send,
+            token_metadata_cache=token_metadata_cache,
+            token_registry=token_registry,
+        )
+        self._web3 = web3
+        add_upstream_middleware(web3)
+        self._default_paymaster_address = (
+            options.paymaster["address"] if options and options.paymaster else None
+        )
+        self._default_paymaster_input = (
+            options.paymaster["input"] if options and options.paymaster else None
+        )
+        self._multicall = Multicall3(web3)
+        self._chain_id = chain_id
+
+    def get_address(self) -> str:
+        if not self._web3.eth.default_account:
+            return ""
+        return self._web3.eth.default_account
+
+    def get_chain_id(self) -> int:
+        if self._chain_id is None:
+            raise ValueError("Chain ID is unknown. Create the wallet with async_web3 or pass chain_id")
+        return self._chain_id
+
+    async def resolve_address(self, address: str) -> ChecksumAddress:
+        """Resolve an address to its canonical form."""
+        if Web3.is_address(address):
+            return to_checksum_address(address)
+
+        # Try ENS resolution if it's a domain
+        try:
+            resolved = await self._web3.ens.address(address)  # type: ignore
+            if not resolved:
+                raise ValueError("ENS name could not be resolved")
+            return to_checksum_address(resolved)
+        except Exception as e:
+            raise ValueError(f"Failed to resolve ENS name: {str(e)}")
+
+    def sign_message(self, message: str) -> Signature:
+        """Sign a message with the current account."""
+        if not self._web3.eth.default_account:
+            raise ValueError("No account connected")
+
+        signable_message = encode_defunct(text=message)
+        signed_message = self._web3.eth.default_local_account.sign_message(signable_message)  # type: ignore
+
+        return {"signature": self._web3.to_hex(signed_message.signature)}
+
+    async def sign_typed_data(  # type: ignore[override]
+        self, types: Dict[str, Any], primary_type: str, domain: Dict[str, Any], value: Dict[str, Any]
+    ) -> Signature:
+        """Sign typed data according to EIP-712."""
+        if not self._web3.eth.default_account:
+            raise ValueError("No account connected")
+
+        # Convert chain_id to int if it's present
+        if "chainId" in domain:
+            domain["chainId"] = int(domain["chainId"])
+
+        structured_data = encode_typed_data(types=types, primary_type=primary_type, domain=domain, value=value)  # type: ignore
+        signed_message = self._web3.eth.default_local_account.sign_message(structured_data)  # type: ignore
+
+        return {"signature": self._web3.to_hex(signed_message.signature)}
+
+    async def send_transaction(self, transaction: EVMTransaction) -> Dict[str, str]:  # type: ignore[override]
+        """Send a transaction on the EVM chain."""
+        if not self._web3.eth.default_account:
+            raise ValueError("No account connected")
+
+        to_address = await self.resolve_address(transaction["to"])
+
+        # Get paymaster options
+        paymaster = transaction.get("options", {}).get("paymaster", {})
+        paymaster_address = paymaster.get("address", self._default_paymaster_address)
+        paymaster_input = paymaster.get("input", self._default_paymaster_input)
+        if paymaster_address and paymaster_input:
+            raise NotImplementedError("Paymaster not supported")
+
+        # Simple ETH transfer
+        if not transaction.get("abi"):
+            tx_params: TxParams = {
+                "from": self._web3.eth.default_account,
+                "to": to_address,
+                "chainId": self.get_chain_id(),
+                "value": Wei(transaction.get("value", 0)),
+                "data": transaction.get("data", HexStr("")),
+            }
+            return await self._send(tx_params)
+
+        # Contract call
+        function_name = transaction.get("functionName")
+        if not function_name:
+            raise ValueError("Function name is required for contract calls")
+
+        contract = self._web3.eth.contract(address=to_address, abi=transaction["abi"])  # type: ignore
+        contract_function = getattr(contract.functions, function_name)
+        args = transaction.get("args", [])
+
+        # First simulate the contract call to catch any potential errors
+        try:
+            await contract_function(*args).call({
+                "from": self._web3.eth.default_account,
+                "value": Wei(transaction.get("value", 0)),
+            })
+        except Exception as e:
+            raise ValueError(f"Contract call simulation failed: {str(e)}")
+
+        tx = await contract_function(*args).build_transaction({
+            "from": self._web3.eth.default_account,
+            "chainId": self.get_chain_id(),
+            "value": Wei(transaction.get("value", 0)),
+        })
+        return await self._send(tx)
+
+    async def _send(self, tx: TxParams) -> Dict[str, str]:
+        """Sign the transaction locally when a local account is set, send it and wait for the receipt."""
+        account = getattr(self._web3.eth, "default_local_account", None)
+        if account is None:
+            tx_hash = await self._web3.eth.send_transaction(tx)
+            return await self._wait_for_receipt(HexStr(tx_hash.hex()))
+
+        if "nonce" not in tx:
+            tx["nonce"] = await self._web3.eth.get_transaction_count(account.address, "pending")
+        if "gas" not in tx:
+            tx["gas"] = await self._web3.eth.estimate_gas(tx)
+        if "gasPrice" not in tx and "maxFeePerGas" not in tx:
+            latest = await self._web3.eth.get_block("latest")
+            base_fee = latest.get("baseFeePerGas")
+            if base_fee is None:
+                tx["gasPrice"] = await self._web3.eth.gas_price
+            else:
+                priority_fee = await self._web3.eth.max_priority_fee
+                tx["maxPriorityFeePerGas"] = priority_fee
+                tx["maxFeePerGas"] = Wei(2 * base_fee + priority_fee)
+
+        signed = account.sign_transaction(tx)
+        # eth-account renamed rawTransaction to raw_transaction
+        raw_transaction = getattr(signed, "raw_transaction", None) or signed.rawTransaction
+        tx_hash = await self._web3.eth.send_raw_transaction(raw_transaction)
+        return await self._wait_for_receipt(HexStr(tx_hash.hex()))
+
+    async def read(self, request: EVMReadRequest) -> EVMReadResult:  # type: ignore[override]
+        """Read data from a smart contract."""
+        contract = self._web3.eth.contract(
+            address=await self.resolve_address(request["address"]), abi=request["abi"]
+        )
+
+        function = getattr(contract.functions, request["functionName"])
+        args = request.get("args", [])
+        result = await function(*args).call()
+
+        return {"value": result}
+
+    async def read_many(self, requests: List[EVMReadRequest]) -> List[EVMReadResult]:  # type: ignore[override]
+        """Read data from several smart contracts in one Multicall3 call, falling back to concurrent reads."""
+        if len(requests) < 2:
+            return await super().read_many(requests)
+        resolved: List[EVMReadRequest] = [
+            {**request, "address": await self.resolve_address(request["address"])} for request in requests
+        ]
+        return await self._multicall.read_many_async(resolved, fallback=super().read_many)
+
+    async def get_native_balance(self) -> int:  # type: ignore[override]
+        """Get the native balance of the wallet in wei."""
+        if not self._web3.eth.default_account:
+            raise ValueError("No account connected")
+        return await self._web3.eth.get_balance(self._web3.eth.default_account)
+
+    async def balance_of(self, address: str, token_address: Optional[str] = None) -> Balance:  # type: ignore[override]
+        """Get the balance of an address for native or ERC20 tokens."""
+        if token_address:
+            return await super().balance_of(address, token_address)
+
+        resolved_address = await self.resolve_address(address)
+        balance_wei = await self._web3.eth.get_balance(resolved_address)
+
+        chain = self.get_chain()
+        return {
+            "value": str(Web3.from_wei(balance_wei, "ether")),
+            "decimals": chain["nativeCurrency"]["decimals"],
+            "symbol": chain["nativeCurrency"]["symbol"],
+            "name": chain["nativeCurrency"]["name"],
+            "in_base_units": str(balance_wei),
+        }
+
+    async def _wait_for_receipt(self, tx_hash: HexStr) -> Dict[str, str]:
+        """Wait for a transaction receipt and return standardized result."""
+        receipt = await self._web3.eth.wait_for_transaction_receipt(tx_hash)
+        return {
+            "hash": receipt["transactionHash"].hex(),
+            "status": "1" if receipt["status"] == 1 else "0",
+        }
+
+
+async def async_web3(
+    client: AsyncWeb3,
+    options: Optional[Web3Options] = None,
+    tokens=None,
+    enable_send=True,
+    token_metadata_cache: Optional[TokenMetadataCache] = None,
+    token_registry: Optional[TokenRegistry] = None,
+) -> AsyncWeb3EVMWalletClient:
+    """Create a new AsyncWeb3EVMWalletClient instance for the chain the client is connected to."""
+    chain_id = await client.eth.chain_id
+    return AsyncWeb3EVMWalletClient(
+        client, options, tokens, enable_send, token_metadata_cache, token_registry, chain_id=chain_id
+    )
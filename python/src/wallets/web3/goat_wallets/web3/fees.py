@@ -0,0 +1,48 @@
+import threading
+import time
+from typing import Optional
+
+from web3 import Web3
+from web3.types import TxParams, Wei
+
+
+class FeeOracle:
+    """Reads the fee fields of new transactions, reusing them for the rest of the block.
+
+    On EIP-1559 chains it returns `maxPriorityFeePerGas` and a `maxFeePerGas` of twice the latest
+    base fee plus the tip, which stays valid for several blocks of rising base fees. Chains
+    without a base fee get a legacy `gasPrice`. Fee data younger than `max_age` seconds is reused,
+    so transactions sent in the same block cost no fee lookups. Concurrent callers share one lookup.
+    """
+
+    def __init__(self, web3: Web3, max_age: float = 2.0):
+        """Initialize the oracle.
+
+        Args:
+            web3: A connected web3.Web3 instance
+            max_age: Seconds fee data is reused for, about one block time of the chain
+        """
+        self._web3 = web3
+        self.max_age = max_age
+        self._fees: Optional[TxParams] = None
+        self._read_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_fees(self) -> TxParams:
+        """Return the fee fields to set on a transaction.
+
+        Returns:
+            Either `maxFeePerGas` and `maxPriorityFeePerGas`, or `gasPrice`
+        """
+        with self._lock:
+            if self._fees is None or time.monotonic() - self._read_at >= self.max_age:
+                self._fees = self._read_fees()
+                self._read_at = time.monotonic()
+            return dict(self._fees)  # type: ignore[return-value]
+
+    def _read_fees(self) -> TxParams:
+        base_fee = self._web3.eth.get_block("latest").get("baseFeePerGas")
+        if base_fee is None:
+            return {"gasPrice": self._web3.eth.gas_price}
+        priority_fee = self._web3.eth.max_priority_fee
+        return {"maxPriorityFeePerGas": priority_fee, "maxFeePerGas": Wei(2 * base_fee + priority_fee)}
@@ -0,0 +1,90 @@
+import json
+from collections.abc import Mapping
+from typing import Any, Callable, Optional, Union
+
+from goat.classes.instrumentation import current_tool_call, record_upstream_call
+from web3 import AsyncWeb3, Web3
+
+try:
+    from web3.middleware.base import Web3Middleware
+except ImportError:  # web3 < 7 only has function middlewares
+    Web3Middleware = None  # type: ignore[assignment,misc]
+
+# Name of the middleware in the onion, so each Web3 instance gets it once
+UPSTREAM_MIDDLEWARE_NAME = "goat_upstream_calls"
+
+
+def add_upstream_middleware(web3: Union[Web3, AsyncWeb3]) -> None:
+    """Counts every JSON-RPC request of a Web3 or AsyncWeb3 instance as an upstream call.
+
+    The middleware is injected innermost, so only requests that reach the provider are counted,
+    and is a no-op outside of instrumented tool calls. Byte counts are the sizes of the
+    JSON-encoded request and response, as middlewares do not see the raw HTTP bodies.
+
+    Args:
+        web3: The instance to instrument. Instrumenting it twice has no effect
+    """
+    if UPSTREAM_MIDDLEWARE_NAME in web3.middleware_onion:
+        return
+    if Web3Middleware is not None:
+        middleware: Any = _UpstreamCallMiddleware
+    elif isinstance(web3, AsyncWeb3):
+        middleware = _async_upstream_middleware
+    else:
+        middleware = _upstream_middleware
+    web3.middleware_onion.inject(middleware, name=UPSTREAM_MIDDLEWARE_NAME, layer=0)
+
+
+def _upstream_middleware(make_request: Callable[..., Any], web3: Any) -> Callable[..., Any]:
+    def middleware(method: str, params: Any) -> Any:
+        if current_tool_call() is None:
+            return make_request(method, params)
+        response = None
+        try:
+            response = make_request(method, params)
+            return response
+        finally:
+            _record(method, params, response)
+
+    return middleware
+
+
+async def _async_upstream_middleware(make_request: Callable[..., Any], web3: Any) -> Callable[..., Any]:
+    async def middleware(method: str, params: Any) -> Any:
+        if current_tool_call() is None:
+            return await make_request(method, params)
+        response = None
+        try:
+            response = await make_request(method, params)
+            return response
+        finally:
+            _record(method, params, response)
+
+    return middleware
+
+
+if Web3Middleware is not None:
+
+    class _UpstreamCallMiddleware(Web3Middleware):  # type: ignore[misc,valid-type]
+        def wrap_make_request(self, make_request: Callable[..., Any]) -> Callable[..., Any]:
+            return _upstream_middleware(make_request, self._w3)
+
+        async def async_wrap_make_request(self, make_request: Callable[..., Any]) -> Callable[..., Any]:
+            return await _async_upstream_middleware(make_request, self._w3)
+
+
+def _record(method: str, params: Any, response: Optional[Any]) -> None:
+    received = _json_size(response) if response is not None else 0
+    record_upstream_call(bytes_sent=_json_size({"method": method, "params": params}), bytes_received=received)
+
+
+def _json_size(value: Any) -> int:
+    return len(json.dumps(value, default=_json_default))
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + bytes(value).hex()
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
@@ -1,4 +1,6 @@
-from typing import Any, Dict, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Set, TypedDict
 from eth_typing import ChecksumAddress, HexStr
 from goat.classes.wallet_client_base import Balance, Signature
 from web3 import Web3
@@ -7,7 +9,9 @@ from eth_utils.address import to_checksum_address
 from eth_account.messages import encode_defunct, encode_typed_data
 
 from goat.types.chain import EvmChain
-from goat_wallets.evm import EVMWalletClient
+from goat.classes.token_metadata_cache import TokenMetadataCache
+from goat.classes.token_registry import TokenRegistry
+from goat_wallets.evm import EVMWalletClient, EncoderCache, Multicall3, NonceManager, default_nonce_manager
 from goat_wallets.evm.types import (
     EVMTransaction,
     EVMReadRequest,
@@ -16,6 +20,9 @@ from goat_wallets.evm.types import (
     PaymasterOptions,
 )
 
+from .fees import FeeOracle
+from .instrumentation import add_upstream_middleware
+
 
 class Web3Options:
     def __init__(
@@ -25,16 +32,61 @@ class Web3Options:
         self.paymaster = paymaster
 
 
+class PendingTransaction(TypedDict):
+    """A sent transaction whose receipt is still being waited for."""
+
+    hash: str
+    receipt: "Future[Dict[str, str]]"
+
+
+# Messages of nodes rejecting a nonce that is already used, meaning the local count is behind
+_NONCE_ERRORS = ("nonce too low", "already known", "replacement transaction underpriced")
+
+# Receipts of submitted transactions are waited for on threads shared by every wallet
+_receipt_executor: Optional[ThreadPoolExecutor] = None
+_receipt_executor_lock = threading.Lock()
+
+
+def _get_receipt_executor() -> ThreadPoolExecutor:
+    global _receipt_executor
+    with _receipt_executor_lock:
+        if _receipt_executor is None:
+            _receipt_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="goat-receipts")
+        return _receipt_executor
+
+
 class Web3EVMWalletClient(EVMWalletClient):
-    def __init__(self, web3: Web3, options: Optional[Web3Options] = None, tokens=None, enable_send=True):
-        super().__init__(tokens=tokens, enable_send=enable_send)
+    def __init__(
+        self,
+        web3: Web3,
+        options: Optional[Web3Options] = None,
+        tokens=None,
+        enable_send=True,
+        token_metadata_cache: Optional[TokenMetadataCache] = None,
+        token_registry: Optional[TokenRegistry] = None,
+        nonce_manager: Optional[NonceManager] = None,
+    ):
+        super().__init__(
+            tokens=tokens,
+            enable_send=enable_send,
+            token_metadata_cache=token_metadata_cache,
+            token_registry=token_registry,
+        )
         self._web3 = web3
+        add_upstream_middleware(web3)
         self._default_paymaster_address = (
             options.paymaster["address"] if options and options.paymaster else None
         )
         self._default_paymaster_input = (
             options.paymaster["input"] if options and options.paymaster else None
         )
+        self._encoders = EncoderCache(web3)
+        self._multicall = Multicall3(web3, encoders=self._encoders)
+        self._chain_id: Optional[int] = None
+        self._nonce_manager = nonce_manager or default_nonce_manager()
+        self._pending_receipts: "Set[Future[Dict[str, str]]]" = set()
+        self._pending_receipts_lock = threading.Lock()
+        self._fee_oracle = FeeOracle(web3)
 
     def get_address(self) -> str:
         if not self._web3.eth.default_account:
@@ -42,10 +94,13 @@ class Web3EVMWalletClient(EVMWalletClient):
         return self._web3.eth.default_account
 
     def get_chain_id(self) -> int:
-        return self._web3.eth.chain_id
+        # The chain of a connected provider does not change, so only ask the node once
+        if self._chain_id is None:
+            self._chain_id = self._web3.eth.chain_id
+        return self._chain_id
 
     def get_chain(self) -> EvmChain:
-        chain_id = self._web3.eth.chain_id
+        chain_id = self.get_chain_id()
         return {"type": "evm", "id": chain_id, "nativeCurrency": {"name": "Ether", "symbol": "ETH", "decimals": 18}}
 
     def resolve_address(self, address: str) -> ChecksumAddress:
@@ -89,7 +144,44 @@ class Web3EVMWalletClient(EVMWalletClient):
         return {"signature": self._web3.to_hex(signed_message.signature)}
 
     def send_transaction(self, transaction: EVMTransaction) -> Dict[str, str]:
-        """Send a transaction on the EVM chain."""
+        """Send a transaction on the EVM chain and wait for its receipt."""
+        return self._wait_for_sent_receipt(self._submit(transaction))
+
+    def submit_transaction(self, transaction: EVMTransaction) -> PendingTransaction:
+        """Send a transaction on the EVM chain without waiting for it to be mined.
+
+        Nonces are counted locally, so several transactions from the wallet can be submitted
+        back to back and mined in the same block.
+
+        Args:
+            transaction: The transaction to send
+
+        Returns:
+            The transaction hash, and a future resolving to the same result as `send_transaction`
+        """
+        tx_hash = self._submit(transaction)
+        receipt = _get_receipt_executor().submit(self._wait_for_sent_receipt, tx_hash)
+        with self._pending_receipts_lock:
+            self._pending_receipts.add(receipt)
+        receipt.add_done_callback(self._discard_pending_receipt)
+        return {"hash": tx_hash, "receipt": receipt}
+
+    def close(self) -> None:
+        """Wait for the receipts of every transaction sent with `submit_transaction`.
+
+        The receipt waits run on threads shared by all wallets, so nothing is left running
+        for the wallet once this returns.
+        """
+        with self._pending_receipts_lock:
+            pending = list(self._pending_receipts)
+        wait(pending)
+
+    def _discard_pending_receipt(self, receipt: "Future[Dict[str, str]]") -> None:
+        with self._pending_receipts_lock:
+            self._pending_receipts.discard(receipt)
+
+    def _submit(self, transaction: EVMTransaction) -> HexStr:
+        """Build and send a transaction, returning its hash."""
         if not self._web3.eth.default_account:
             raise ValueError("No account connected")
 
@@ -99,77 +191,86 @@ class Web3EVMWalletClient(EVMWalletClient):
         paymaster = transaction.get("options", {}).get("paymaster", {})
         paymaster_address = paymaster.get("address", self._default_paymaster_address)
         paymaster_input = paymaster.get("input", self._default_paymaster_input)
+        if paymaster_address and paymaster_input:
+            raise NotImplementedError("Paymaster not supported")
+
+        tx_params: TxParams = {
+            "from": self._web3.eth.default_account,
+            "to": to_address,
+            "chainId": self.get_chain_id(),
+            "value": Wei(transaction.get("value", 0)),
+        }
 
         # Simple ETH transfer
         if not transaction.get("abi"):
-            tx_params: TxParams = {
-                "from": self._web3.eth.default_account,
-                "to": to_checksum_address(to_address),
-                "chainId": self._web3.eth.chain_id,
-                "value": Wei(transaction.get("value", 0)),
-                "data": transaction.get("data", HexStr("")),
-            }
-
-            if paymaster_address and paymaster_input:
-                raise NotImplementedError("Paymaster not supported")
-
-            tx_hash = self._web3.eth.send_transaction(tx_params)
-            return self._wait_for_receipt(HexStr(tx_hash.hex()))
+            tx_params["data"] = transaction.get("data", HexStr(""))
+            return self._send_with_nonce(self._prepare_transaction(tx_params))
 
         # Contract call
         function_name = transaction.get("functionName")
         if not function_name:
             raise ValueError("Function name is required for contract calls")
 
-        contract = self._web3.eth.contract(
-            address=to_checksum_address(to_address), abi=transaction["abi"]  # type: ignore
-        )
-
-        # Build the transaction
-        contract_function = getattr(contract.functions, function_name)
-        args = transaction.get("args", [])
+        encoder = self._encoders.get(to_address, transaction["abi"], function_name)  # type: ignore
+        tx_params["data"] = encoder.encode(transaction.get("args", []))
 
-        # First simulate the contract call to catch any potential errors
+        # The gas estimate doubles as the simulation: a reverting call fails to estimate
         try:
-            contract_function(*args).call({
-                "from": self._web3.eth.default_account,
-                "value": Wei(transaction.get("value", 0)),
-            })
+            tx = self._prepare_transaction(tx_params)
         except Exception as e:
             raise ValueError(f"Contract call simulation failed: {str(e)}")
-
-        # Build transaction parameters
-        tx_params: TxParams = {
-            "from": self._web3.eth.default_account,
-            "chainId": self._web3.eth.chain_id,
-            "value": Wei(transaction.get("value", 0)),
-        }
-
-        if paymaster_address and paymaster_input:
-            raise NotImplementedError("Paymaster not supported")
-
-        # Build and send the transaction
-        tx = contract_function(*args).build_transaction(tx_params)
-        
-        # Get the nonce
-        tx["nonce"] = self._web3.eth.get_transaction_count(self._web3.eth.default_account)
-        
-        # Send the transaction
-        tx_hash = self._web3.eth.send_transaction(tx)
-
-        return self._wait_for_receipt(HexStr(tx_hash.hex()))
+        return self._send_with_nonce(tx)
+
+    def _prepare_transaction(self, tx_params: TxParams) -> TxParams:
+        """Fill in the gas limit and fees. Fees are usually cached, so this costs one gas estimate."""
+        gas = self._web3.eth.estimate_gas(tx_params)
+        return {**tx_params, **self._fee_oracle.get_fees(), "gas": gas}
+
+    def _send_with_nonce(self, tx: TxParams) -> HexStr:
+        """Send a transaction with the next locally tracked nonce of the account.
+
+        With a local account the transaction is signed here and sent raw, as it is already
+        complete; otherwise the node (or a signing middleware) signs it.
+        """
+        account = self._web3.eth.default_account
+        chain_id = self.get_chain_id()
+        nonce = self._nonce_manager.reserve(
+            chain_id, account, lambda: self._web3.eth.get_transaction_count(account, "pending")
+        )
+        tx["nonce"] = nonce
+        local_account = getattr(self._web3.eth, "default_local_account", None)
+        try:
+            if local_account is not None:
+                signed = local_account.sign_transaction(tx)
+                # eth-account renamed rawTransaction to raw_transaction
+                tx_hash = self._web3.eth.send_raw_transaction(
+                    getattr(signed, "raw_transaction", None) or signed.rawTransaction
+                )
+            else:
+                tx_hash = self._web3.eth.send_transaction(tx)
+        except Exception as e:
+            if any(message in str(e).lower() for message in _NONCE_ERRORS):
+                self._nonce_manager.resync(chain_id, account)
+            else:
+                self._nonce_manager.release(chain_id, account, nonce)
+            raise
+        return HexStr(tx_hash.hex())
 
     def read(self, request: EVMReadRequest) -> EVMReadResult:
         """Read data from a smart contract."""
-        contract = self._web3.eth.contract(
-            address=self.resolve_address(request["address"]), abi=request["abi"]
+        encoder = self._encoders.get(
+            self.resolve_address(request["address"]), request["abi"], request["functionName"]
         )
+        return {"value": encoder.call(request.get("args", []))}
 
-        function = getattr(contract.functions, request["functionName"])
-        args = request.get("args", [])
-        result = function(*args).call()
-
-        return {"value": result}
+    def read_many(self, requests: List[EVMReadRequest]) -> List[EVMReadResult]:
+        """Read data from several smart contracts in one Multicall3 call, falling back to sequential reads."""
+        if len(requests) < 2:
+            return super().read_many(requests)
+        resolved: List[EVMReadRequest] = [
+            {**request, "address": self.resolve_address(request["address"])} for request in requests
+        ]
+        return self._multicall.read_many(resolved, fallback=super().read_many)
 
     def get_native_balance(self) -> int:
         """Get the native balance of the wallet in wei."""
@@ -200,6 +301,15 @@ class Web3EVMWalletClient(EVMWalletClient):
                 "in_base_units": str(balance_wei),
             }
 
+    def _wait_for_sent_receipt(self, tx_hash: HexStr) -> Dict[str, str]:
+        """Wait for the receipt of a transaction sent with a local nonce."""
+        try:
+            return self._wait_for_receipt(tx_hash)
+        except Exception:
+            # A dropped transaction leaves a gap in the local nonces
+            self._nonce_manager.resync(self.get_chain_id(), self._web3.eth.default_account)
+            raise
+
     def _wait_for_receipt(self, tx_hash: HexStr) -> Dict[str, str]:
         """Wait for a transaction receipt and return standardized result."""
         receipt = self._web3.eth.wait_for_transaction_receipt(tx_hash)
@@ -209,6 +319,16 @@ class Web3EVMWalletClient(EVMWalletClient):
         }
 
 
-def web3(client: Web3, options: Optional[Web3Options] = None, tokens=None, enable_send=True) -> Web3EVMWalletClient:
+def web3(
+    client: Web3,
+    options: Optional[Web3Options] = None,
+    tokens=None,
+    enable_send=True,
+    token_metadata_cache: Optional[TokenMetadataCache] = None,
+    token_registry: Optional[TokenRegistry] = None,
+    nonce_manager: Optional[NonceManager] = None,
+) -> Web3EVMWalletClient:
     """Create a new Web3EVMWalletClient instance."""
-    return Web3EVMWalletClient(client, options, tokens, enable_send)
+    return Web3EVMWalletClient(
+        client, options, tokens, enable_send, token_metadata_cache, token_registry, nonce_manager
+    )
@@ -0,0 +1,135 @@
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from eth_account import Account
+from web3 import AsyncWeb3, Web3
+from web3.providers.async_base import AsyncBaseProvider
+from web3.providers.base import BaseProvider
+
+PRIVATE_KEY = "0x" + "11" * 32
+GWEI = 10**9
+
+
+class RPCError(Exception):
+    """Returned by a FakeProvider response to answer the request with a JSON-RPC error."""
+
+
+def _receipt(params: List[Any]) -> Dict[str, Any]:
+    return {
+        "transactionHash": params[0],
+        "status": "0x1",
+        "blockHash": "0x" + "1" * 64,
+        "blockNumber": "0x10",
+        "transactionIndex": "0x0",
+        "from": "0x" + "0" * 40,
+        "to": None,
+        "cumulativeGasUsed": "0x5208",
+        "gasUsed": "0x5208",
+        "contractAddress": None,
+        "logs": [],
+        "logsBloom": "0x" + "0" * 512,
+        "effectiveGasPrice": hex(GWEI),
+        "type": "0x2",
+    }
+
+
+class FakeProvider(BaseProvider):
+    """Answers JSON-RPC requests from a table of canned results and records every request.
+
+    A response is either a result, or a callable taking the request params and returning the
+    result or an RPCError.
+    """
+
+    def __init__(self, **responses: Any):
+        super().__init__()
+        self.requests: List[Tuple[str, Any]] = []
+        self.responses: Dict[str, Any] = {
+            "eth_chainId": "0x1",
+            "eth_blockNumber": "0x10",
+            "eth_getBlockByNumber": {
+                "number": "0x10",
+                "hash": "0x" + "2" * 64,
+                "baseFeePerGas": hex(10 * GWEI),
+                "gasLimit": "0x1c9c380",
+                "timestamp": "0x1",
+                "transactions": [],
+            },
+            "eth_maxPriorityFeePerGas": hex(GWEI),
+            "eth_gasPrice": hex(3 * GWEI),
+            "eth_getTransactionCount": "0x5",
+            "eth_estimateGas": "0x5208",
+            "eth_call": "0x" + "0" * 64,
+            "eth_getCode": "0x6080",
+            "eth_sendRawTransaction": "0x" + "3" * 64,
+            "eth_sendTransaction": "0x" + "3" * 64,
+            "eth_getTransactionReceipt": _receipt,
+        }
+        self.responses.update(responses)
+
+    def make_request(self, method: str, params: Any) -> Dict[str, Any]:
+        self.requests.append((method, params))
+        response = self.responses[method]
+        if callable(response):
+            response = response(params)
+        if isinstance(response, RPCError):
+            return {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": str(response)}}
+        return {"jsonrpc": "2.0", "id": 1, "result": response}
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
+
+    def count(self, method: str) -> int:
+        return sum(1 for requested, _ in self.requests if requested == method)
+
+
+class AsyncFakeProvider(AsyncBaseProvider):
+    """Serves AsyncWeb3 requests from a FakeProvider."""
+
+    def __init__(self, provider: FakeProvider):
+        super().__init__()
+        self.provider = provider
+
+    async def make_request(self, method: str, params: Any) -> Dict[str, Any]:
+        return self.provider.make_request(method, params)
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
+
+
+class RecordingAccount:
+    """Local account recording the transactions it signs."""
+
+    def __init__(self, private_key: str):
+        self._account = Account.from_key(private_key)
+        self.address = self._account.address
+        self.signed: List[Dict[str, Any]] = []
+
+    def sign_transaction(self, transaction: Dict[str, Any]) -> Any:
+        self.signed.append(dict(transaction))
+        return self._account.sign_transaction(transaction)
+
+    def sign_message(self, message: Any) -> Any:
+        return self._account.sign_message(message)
+
+
+@pytest.fixture
+def provider() -> FakeProvider:
+    return FakeProvider()
+
+
+@pytest.fixture
+def w3(provider: FakeProvider) -> Web3:
+    client = Web3(provider)
+    account = Account.from_key(PRIVATE_KEY)
+    client.eth.default_account = account.address
+    client.eth.default_local_account = account  # type: ignore[attr-defined]
+    return client
+
+
+@pytest.fixture
+def async_w3(provider: FakeProvider) -> AsyncWeb3:
+    client = AsyncWeb3(AsyncFakeProvider(provider))
+    account = RecordingAccount(PRIVATE_KEY)
+    client.eth.default_account = account.address
+    client.eth.default_local_account = account  # type: ignore[attr-defined]
+    return client
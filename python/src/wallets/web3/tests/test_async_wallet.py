@@ -0,0 +1,140 @@
+import pytest
+import pytest_asyncio
+from eth_abi import decode, encode
+from web3 import Web3
+
+from goat_wallets.evm import MULTICALL3_ADDRESS
+from goat_wallets.web3 import AsyncWeb3EVMWalletClient, async_web3
+
+from .conftest import GWEI, RPCError
+
+TOKEN = Web3.to_checksum_address("0x" + "cd" * 20)
+RECIPIENT = Web3.to_checksum_address("0x" + "ab" * 20)
+
+# Results of the ERC-20 reads made by the wallet, by selector
+TOKEN_READS = {
+    "70a08231": encode(["uint256"], [1_500_000]),
+    "313ce567": encode(["uint8"], [6]),
+    "06fdde03": encode(["string"], ["USD Coin"]),
+    "95d89b41": encode(["string"], ["USDC"]),
+    "a9059cbb": encode(["bool"], [True]),
+    "095ea7b3": encode(["bool"], [True]),
+}
+
+
+def _eth_call(params):
+    call = params[0]
+    if call["to"].lower() == MULTICALL3_ADDRESS.lower():
+        # Multicall3 is not deployed, so the wallet falls back to concurrent reads
+        return "0x"
+    return "0x" + TOKEN_READS[call["data"][2:10]].hex()
+
+
+def _eth_get_code(params):
+    return "0x" if params[0].lower() == MULTICALL3_ADDRESS.lower() else "0x6080"
+
+
+@pytest_asyncio.fixture
+async def wallet(async_w3, provider):
+    provider.responses["eth_call"] = _eth_call
+    provider.responses["eth_getCode"] = _eth_get_code
+    return await async_web3(async_w3)
+
+
+@pytest.mark.asyncio
+async def test_async_web3_reads_the_chain_id_once(async_w3, provider):
+    provider.responses["eth_chainId"] = hex(8453)
+    wallet = await async_web3(async_w3)
+    assert wallet.get_chain_id() == 8453
+    assert wallet.get_chain()["id"] == 8453
+    assert provider.count("eth_chainId") == 1
+
+
+def test_chain_id_is_required_without_the_factory(async_w3):
+    with pytest.raises(ValueError, match="Chain ID is unknown"):
+        AsyncWeb3EVMWalletClient(async_w3).get_chain_id()
+
+
+@pytest.mark.asyncio
+async def test_native_balance(wallet, provider):
+    provider.responses["eth_getBalance"] = hex(2 * 10**18)
+    balance = await wallet.balance_of(RECIPIENT)
+    assert balance["value"] == "2"
+    assert balance["in_base_units"] == str(2 * 10**18)
+
+
+@pytest.mark.asyncio
+async def test_token_balance_reads_metadata_once(wallet, provider):
+    balance = await wallet.balance_of(RECIPIENT, TOKEN)
+    assert balance == {
+        "decimals": 6,
+        "symbol": "USDC",
+        "name": "USD Coin",
+        "value": "1.5",
+        "in_base_units": "1500000",
+    }
+    reads = provider.count("eth_call")
+    await wallet.balance_of(RECIPIENT, TOKEN)
+    # Token metadata is cached, so only the balance is read again
+    assert provider.count("eth_call") == reads + 1
+
+
+@pytest.mark.asyncio
+async def test_core_tools_await_the_wallet_on_the_callers_loop(wallet, provider):
+    provider.responses["eth_getBalance"] = hex(10**18)
+    tools = {tool.name: tool for tool in wallet.get_core_tools()}
+    result = await tools["get_balance"].execute_async({"address": RECIPIENT})
+    assert result["value"] == "1"
+    assert await tools["convert_to_base_units"].execute_async({"amount": "1.5", "tokenAddress": TOKEN}) == "1500000"
+
+
+@pytest.mark.asyncio
+async def test_send_fills_nonce_gas_and_fees_before_signing(wallet, async_w3, provider):
+    provider.responses["eth_getTransactionCount"] = "0x7"
+    result = await wallet.send_token({"recipient": RECIPIENT, "amountInBaseUnits": "5"})
+    assert result["status"] == "1"
+
+    (signed,) = async_w3.eth.default_local_account.signed
+    assert signed["nonce"] == 7
+    assert signed["gas"] == 21000
+    assert signed["maxPriorityFeePerGas"] == GWEI
+    assert signed["maxFeePerGas"] == 21 * GWEI
+    assert ("eth_getTransactionCount", [async_w3.eth.default_account, "pending"]) in provider.requests
+    assert provider.count("eth_sendRawTransaction") == 1
+    assert provider.count("eth_sendTransaction") == 0
+
+
+@pytest.mark.asyncio
+async def test_send_uses_a_gas_price_on_chains_without_base_fee(wallet, async_w3, provider):
+    del provider.responses["eth_getBlockByNumber"]["baseFeePerGas"]
+    await wallet.send_token({"recipient": RECIPIENT, "amountInBaseUnits": "5"})
+    (signed,) = async_w3.eth.default_local_account.signed
+    assert signed["gasPrice"] == 3 * GWEI
+    assert "maxFeePerGas" not in signed
+
+
+@pytest.mark.asyncio
+async def test_send_token_transfers_erc20(wallet, async_w3, provider):
+    await wallet.send_token({"recipient": RECIPIENT, "amountInBaseUnits": "25", "tokenAddress": TOKEN})
+    (signed,) = async_w3.eth.default_local_account.signed
+    assert signed["to"] == TOKEN
+    assert signed["data"][:10] == "0xa9059cbb"
+    assert decode(["address", "uint256"], bytes.fromhex(signed["data"][10:])) == (RECIPIENT.lower(), 25)
+
+
+@pytest.mark.asyncio
+async def test_approve(wallet, async_w3):
+    result = await wallet.approve({"tokenAddress": TOKEN, "spender": RECIPIENT, "amount": "100"})
+    assert result["status"] == "1"
+    (signed,) = async_w3.eth.default_local_account.signed
+    assert signed["data"][:10] == "0x095ea7b3"
+    assert decode(["address", "uint256"], bytes.fromhex(signed["data"][10:])) == (RECIPIENT.lower(), 100)
+
+
+@pytest.mark.asyncio
+async def test_reverting_contract_call_is_not_sent(wallet, async_w3, provider):
+    provider.responses["eth_call"] = lambda params: RPCError("execution reverted")
+    with pytest.raises(ValueError, match="Contract call simulation failed"):
+        await wallet.approve({"tokenAddress": TOKEN, "spender": RECIPIENT, "amount": "100"})
+    assert async_w3.eth.default_local_account.signed == []
+    assert provider.count("eth_sendRawTransaction") == 0
@@ -0,0 +1,39 @@
+from web3 import Web3
+
+from goat_wallets.web3 import fees
+from goat_wallets.web3.fees import FeeOracle
+
+from .conftest import GWEI, FakeProvider
+
+
+def test_eip1559_fees_double_the_base_fee(w3):
+    assert FeeOracle(w3).get_fees() == {"maxPriorityFeePerGas": GWEI, "maxFeePerGas": 21 * GWEI}
+
+
+def test_chains_without_base_fee_get_a_gas_price():
+    provider = FakeProvider()
+    del provider.responses["eth_getBlockByNumber"]["baseFeePerGas"]
+    assert FeeOracle(Web3(provider)).get_fees() == {"gasPrice": 3 * GWEI}
+
+
+def test_fees_are_reused_for_max_age_seconds(w3, provider, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(fees.time, "monotonic", lambda: now[0])
+    oracle = FeeOracle(w3)
+    assert oracle.max_age == 2.0
+
+    first = oracle.get_fees()
+    now[0] += 1.9
+    assert oracle.get_fees() == first
+    assert provider.count("eth_getBlockByNumber") == 1
+
+    provider.responses["eth_maxPriorityFeePerGas"] = hex(2 * GWEI)
+    now[0] += 0.1
+    assert oracle.get_fees()["maxPriorityFeePerGas"] == 2 * GWEI
+    assert provider.count("eth_getBlockByNumber") == 2
+
+
+def test_returned_fees_are_copies(w3):
+    oracle = FeeOracle(w3)
+    oracle.get_fees()["maxFeePerGas"] = 0
+    assert oracle.get_fees()["maxFeePerGas"] == 21 * GWEI
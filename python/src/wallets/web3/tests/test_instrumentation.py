@@ -0,0 +1,60 @@
+import pytest
+from pydantic import BaseModel
+
+from goat import HistogramCollector, add_instrumentation_hook, create_tool, remove_instrumentation_hook
+from goat_wallets.web3 import async_web3, web3
+from goat_wallets.web3.instrumentation import UPSTREAM_MIDDLEWARE_NAME
+
+
+class EmptyParameters(BaseModel):
+    pass
+
+
+@pytest.fixture
+def collector():
+    collector = HistogramCollector()
+    add_instrumentation_hook(collector)
+    yield collector
+    remove_instrumentation_hook(collector)
+
+
+def test_rpc_requests_are_attributed_to_the_tool_call(collector, w3, provider):
+    provider.responses["eth_getBalance"] = hex(10**18)
+    wallet = web3(w3)
+    assert UPSTREAM_MIDDLEWARE_NAME in w3.middleware_onion
+    # A second wallet on the same client does not count requests twice
+    middlewares = len(list(w3.middleware_onion))
+    web3(w3)
+    assert len(list(w3.middleware_onion)) == middlewares
+
+    def balance(parameters):
+        return wallet.balance_of(wallet.get_address())
+
+    tool = create_tool({"name": "balance", "description": "", "parameters": EmptyParameters}, balance)
+    requests_before = len(provider.requests)
+    tool.execute({})
+    # Requests outside of a tool call are not recorded
+    w3.eth.get_balance(wallet.get_address())
+
+    histogram = collector.get("balance")
+    assert histogram.upstream_calls == len(provider.requests) - requests_before - 1
+    assert histogram.upstream_calls > 0
+    assert histogram.upstream_bytes > 0
+
+
+@pytest.mark.asyncio
+async def test_async_rpc_requests_are_attributed_to_the_tool_call(collector, async_w3, provider):
+    provider.responses["eth_getBalance"] = hex(10**18)
+    wallet = await async_web3(async_w3)
+
+    async def balance(parameters):
+        return await wallet.balance_of(wallet.get_address())
+
+    tool = create_tool({"name": "balance_async", "description": "", "parameters": EmptyParameters}, balance)
+    requests_before = len(provider.requests)
+    await tool.execute_async({})
+
+    histogram = collector.get("balance_async")
+    assert histogram.upstream_calls == len(provider.requests) - requests_before
+    assert histogram.upstream_calls > 0
+    assert histogram.upstream_bytes > 0
@@ -0,0 +1,42 @@
+import pytest
+
+from goat_wallets.evm import NonceManager
+from goat_wallets.web3 import web3
+
+from .conftest import RPCError
+
+RECIPIENT = "0x00000000000000000000000000000000000000Aa"
+
+
+def test_transactions_use_consecutive_local_nonces(w3, provider):
+    manager = NonceManager()
+    wallet = web3(w3, nonce_manager=manager)
+    for _ in range(3):
+        wallet.send_transaction({"to": RECIPIENT, "value": 1})
+    assert provider.count("eth_getTransactionCount") == 1
+    assert manager.reserve(1, w3.eth.default_account, lambda: 0) == 8
+
+
+def test_failed_send_releases_its_nonce(w3, provider):
+    manager = NonceManager()
+    wallet = web3(w3, nonce_manager=manager)
+    provider.responses["eth_sendRawTransaction"] = lambda params: RPCError("insufficient funds for gas")
+    with pytest.raises(ValueError, match="insufficient funds"):
+        wallet.send_transaction({"to": RECIPIENT, "value": 1})
+    assert manager.reserve(1, w3.eth.default_account, lambda: 0) == 5
+    assert provider.count("eth_getTransactionCount") == 1
+
+
+def test_nonce_too_low_resyncs_from_the_node(w3, provider):
+    manager = NonceManager()
+    wallet = web3(w3, nonce_manager=manager)
+    counts = iter(["0x5", "0x9"])
+    provider.responses["eth_getTransactionCount"] = lambda params: next(counts)
+    provider.responses["eth_sendRawTransaction"] = lambda params: RPCError("nonce too low")
+    with pytest.raises(ValueError, match="nonce too low"):
+        wallet.send_transaction({"to": RECIPIENT, "value": 1})
+
+    provider.responses["eth_sendRawTransaction"] = "0x" + "3" * 64
+    assert wallet.send_transaction({"to": RECIPIENT, "value": 1})["status"] == "1"
+    assert provider.count("eth_getTransactionCount") == 2
+    assert manager.reserve(1, w3.eth.default_account, lambda: 0) == 10
@@ -0,0 +1,54 @@
+import pytest
+from web3 import Web3
+
+from goat_wallets.evm import NonceManager
+from goat_wallets.web3 import web3
+
+from .conftest import RPCError
+
+TOKEN = Web3.to_checksum_address("0x" + "cd" * 20)
+RECIPIENT = Web3.to_checksum_address("0x" + "ab" * 20)
+TRANSFER_ABI = [
+    {
+        "type": "function",
+        "name": "transfer",
+        "stateMutability": "nonpayable",
+        "inputs": [{"name": "to", "type": "address"}, {"name": "value", "type": "uint256"}],
+        "outputs": [{"name": "", "type": "bool"}],
+    }
+]
+
+
+def _transfer(amount: int):
+    return {"to": TOKEN, "abi": TRANSFER_ABI, "functionName": "transfer", "args": [RECIPIENT, amount]}
+
+
+def test_contract_calls_are_simulated_by_their_gas_estimate(w3, provider):
+    wallet = web3(w3, nonce_manager=NonceManager())
+    assert wallet.send_transaction(_transfer(10))["status"] == "1"
+    assert provider.count("eth_estimateGas") == 1
+    assert provider.count("eth_call") == 0
+
+    (estimated,) = [params[0] for method, params in provider.requests if method == "eth_estimateGas"]
+    assert estimated["data"].startswith("0xa9059cbb")
+
+
+def test_reverting_contract_call_fails_before_taking_a_nonce(w3, provider):
+    wallet = web3(w3, nonce_manager=NonceManager())
+    provider.responses["eth_estimateGas"] = lambda params: RPCError("execution reverted: balance too low")
+    with pytest.raises(ValueError, match="Contract call simulation failed: .*execution reverted"):
+        wallet.send_transaction(_transfer(10))
+    assert provider.count("eth_getTransactionCount") == 0
+    assert provider.count("eth_sendRawTransaction") == 0
+
+
+def test_submitted_transactions_share_the_receipt_threads(w3, provider):
+    first_wallet = web3(w3, nonce_manager=NonceManager())
+    second_wallet = web3(w3, nonce_manager=NonceManager())
+    first = first_wallet.submit_transaction({"to": RECIPIENT, "value": 1})
+    second = second_wallet.submit_transaction({"to": RECIPIENT, "value": 1})
+    first_wallet.close()
+    second_wallet.close()
+    assert first["receipt"].done() and second["receipt"].done()
+    assert first["receipt"].result()["status"] == "1"
+    assert provider.count("eth_sendRawTransaction") == 2